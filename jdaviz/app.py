@@ -1,15 +1,16 @@
 import operator
 import os
 import pathlib
-import re
 import uuid
 import warnings
+from contextlib import contextmanager
+
 import ipyvue
 from astropy import units as u
 from astropy.nddata import NDData
 from astropy.io import fits
 from astropy.time import Time
-from echo import CallbackProperty, DictCallbackProperty, ListCallbackProperty
+from echo import CallbackProperty, DictCallbackProperty, ListCallbackProperty, delay_callback
 from ipygoldenlayout import GoldenLayout
 from ipysplitpanes import SplitPanes
 import matplotlib.cm as cm
@@ -19,6 +20,8 @@ from glue.core import HubListener
 from glue.core.link_helpers import LinkSame, LinkSameWithUnits
 from glue.core.message import (DataCollectionAddMessage,
                                DataCollectionDeleteMessage,
+                               DataUpdateMessage,
+                               NumericalDataChangedMessage,
                                SubsetCreateMessage,
                                SubsetUpdateMessage,
                                SubsetDeleteMessage)
@@ -47,11 +50,13 @@ from jdaviz.core.events import (LoadDataMessage, NewViewerMessage, AddDataMessag
                                 AddDataToViewerMessage, RemoveDataFromViewerMessage,
                                 ViewerAddedMessage, ViewerRemovedMessage,
                                 ViewerRenamedMessage, ChangeRefDataMessage)
+from jdaviz.core.object_cache import ObjectCache
 from jdaviz.core.registries import (tool_registry, tray_registry, viewer_registry,
                                     data_parser_registry)
 from jdaviz.core.tools import ICON_DIR
 from jdaviz.utils import (SnackbarQueue, alpha_index, data_has_valid_wcs, layer_is_table_data,
-                          MultiMaskSubsetState, _wcs_only_label)
+                          MultiMaskSubsetState, _wcs_only_label, spectral_axis_from_data,
+                          _DataLabelRegistry)
 
 __all__ = ['Application', 'ALL_JDAVIZ_CONFIGS']
 
@@ -96,13 +101,13 @@ class UnitConverterWithSpectral:
         # gives the units of the values array, which might not be the same
         # as the original native units of the component in the data.
         if cid.label == "flux":
-            spec = data.get_object(cls=Spectrum1D)
+            spectral_axis = spectral_axis_from_data(data)
             if len(values) == 2:
                 # Need this for setting the y-limits
-                spec_limits = [spec.spectral_axis[0].value, spec.spectral_axis[-1].value]
-                eqv = u.spectral_density(spec_limits*spec.spectral_axis.unit)
+                spec_limits = [spectral_axis[0].value, spectral_axis[-1].value]
+                eqv = u.spectral_density(spec_limits*spectral_axis.unit)
             else:
-                eqv = u.spectral_density(spec.spectral_axis)
+                eqv = u.spectral_density(spectral_axis)
         else:  # spectral axis
             eqv = u.spectral()
 
@@ -309,6 +314,16 @@ class Application(VuetifyTemplate, HubListener):
         self._link_type = 'pixels'
         if self.config == "imviz":
             self._wcs_use_affine = None
+            # affine approximations of WCS links per pair of WCS, reused when relinking
+            self._wcs_link_cache = {}
+
+        # Index of the data labels used to generate unique labels, kept up to date
+        #  through the data collection add/delete and data label update messages
+        self._data_labels = _DataLabelRegistry(self.data_collection)
+
+        # Number of layer icons that count towards the index of the next lettered icon
+        #  (all but the mdi icons), kept up to date as icons are assigned to new layers
+        self._n_indexed_layer_icons = 0
 
         # Subscribe to messages indicating that a new viewer needs to be
         #  created. When received, information is passed to the application
@@ -331,6 +346,11 @@ class Application(VuetifyTemplate, HubListener):
         self.hub.subscribe(self, DataCollectionDeleteMessage,
                            handler=self._on_data_deleted)
 
+        # Subscribe to the event fired when data in the data collection is renamed
+        self.hub.subscribe(self, DataUpdateMessage,
+                           handler=lambda msg: self._data_labels.rename(msg.data),
+                           filter=lambda msg: msg.attribute == 'label')
+
         self.hub.subscribe(self, AddDataToViewerMessage,
                            handler=lambda msg: self.add_data_to_viewer(
                                msg.viewer_reference, msg.data_label))
@@ -347,11 +367,17 @@ class Application(VuetifyTemplate, HubListener):
         # Add a fitted_models dictionary that the helpers (or user) can access
         self.fitted_models = {}
 
+        # Process pool for cube model fitting, started lazily by the
+        # Model Fitting plugin and reused across fits.
+        self._fitting_pool = None
+
         # Internal cache so we don't have to keep calling get_object for the same Data.
         # Key should be (data_label, statistic) and value the translated object.
-        self._get_object_cache = {}
+        self._get_object_cache = ObjectCache()
         self.hub.subscribe(self, SubsetUpdateMessage,
                            handler=lambda msg: self._clear_object_cache(msg.subset.label))
+        self.hub.subscribe(self, NumericalDataChangedMessage,
+                           handler=self._on_numerical_data_changed)
 
         # Subscribe to messages that result in changes to the layers
         self.hub.subscribe(self, AddDataMessage,
@@ -484,15 +510,24 @@ class Application(VuetifyTemplate, HubListener):
 
         if layer_name not in self.state.layer_icons:
             if is_wcs_only:
-                self.state.layer_icons = {**self.state.layer_icons,
-                                          layer_name: orientation_icons.get(layer_name,
-                                                                            wcs_only_refdata_icon)}
+                icon = orientation_icons.get(layer_name, wcs_only_refdata_icon)
             else:
-                self.state.layer_icons = {
-                    **self.state.layer_icons,
-                    layer_name: alpha_index(len([ln for ln, ic in self.state.layer_icons.items()
-                                                 if not ic.startswith('mdi-')]))
-                }
+                icon = alpha_index(self._n_indexed_layer_icons)
+            if not icon.startswith('mdi-'):
+                self._n_indexed_layer_icons += 1
+            self.state.layer_icons = {**self.state.layer_icons, layer_name: icon}
+
+    @contextmanager
+    def _batch_state_updates(self):
+        """
+        Context manager to coalesce changes to the data items and layer icons in the
+        application state (e.g., while loading data).  Their callbacks, and the sync of the
+        state to the UI, are triggered once when exiting the outermost context.
+        """
+        # NOTE: changes are only detected when exiting if items are added to/removed from
+        # data_items and if layer_icons is assigned a new dictionary (as in _on_layers_changed)
+        with delay_callback(self.state, 'data_items', 'layer_icons'):
+            yield
 
     def _change_reference_data(self, new_refdata_label, viewer_id=None):
         """
@@ -727,10 +762,11 @@ class Application(VuetifyTemplate, HubListener):
                 if data_parser:
                     parser = data_parser_registry.members.get(data_parser)
 
-            if parser is not None:
-                parser(self, file_obj, **kwargs)
-            else:
-                self._application_handler.load_data(file_obj)
+            with self._batch_state_updates():
+                if parser is not None:
+                    parser(self, file_obj, **kwargs)
+                else:
+                    self._application_handler.load_data(file_obj)
 
         except Exception:  # Reset state on uncaught errors
             cfg_name = self.state.settings.get('configuration', 'unknown')
@@ -1275,7 +1311,10 @@ class Application(VuetifyTemplate, HubListener):
         if data_label in self.data_collection.labels:
             warnings.warn(f"Overwriting existing data entry with label '{data_label}'")
 
-        self.data_collection[data_label] = data
+        # Links added by subscribers to the DataCollectionAddMessage (e.g., Imviz linking)
+        # are synced with the link manager together with the new data in a single update.
+        with self.data_collection.delay_link_manager_update():
+            self.data_collection[data_label] = data
 
         # Send out a toast message
         if notify_done:
@@ -1349,53 +1388,13 @@ class Application(VuetifyTemplate, HubListener):
         if data_label is None:
             data_label = "Unknown"
 
-        # This regex checks for any length of characters that end
-        # with a space followed by parenthesis with a number inside.
-        # If there is a match, the space and parenthesis section will be
-        # removed so that the remainder of the label can be checked
-        # against the data_label.
-        check_if_dup = re.compile(r"(.*)(\s\(\d*\))$")
-        labels = self.data_collection.labels
-        number_of_duplicates = 0
-        max_number = 0
-        for label in labels:
-            # If label is a duplicate of another label
-            if re.fullmatch(check_if_dup, label):
-                label_split = label.split(" ")
-                label_without_dup = " ".join(label_split[:-1])
-                label = label_without_dup
-                # Remove parentheses and cast to float
-                number_dup = int(label_split[-1][1:-1])
-                # Used to keep track the max number of duplicates,
-                # even if not all duplicates are loaded (or some
-                # are renamed)
-                if number_dup > max_number:
-                    max_number = number_dup
-
-            if ext and f"{data_label}[{ext}]" == label:
-                number_of_duplicates += 1
-            elif ext is None and data_label == label:
-                number_of_duplicates += 1
-
-        if ext:
-            data_label = f"{data_label}[{ext}]"
-
-        if number_of_duplicates > 0:
-            data_label = f"{data_label} ({number_of_duplicates})"
-
-        # It is possible to add data named "test (1)" and then
-        # add another data named "test" and return_unique_name will see the
-        # first test and assume the second is the duplicate, appending
-        # "(1)" to the end. This overwrites the original data and
-        # causes issues. This block alters the duplicate number to be something unique
-        # (one more than the max number duplicate found)
-        # if a duplicate is still found in data_collection.
-        if data_label in self.data_collection.labels:
-            label_split = data_label.split(" ")
-            label_without_dup = " ".join(label_split[:-1])
-            data_label = f"{label_without_dup} ({max_number + 1})"
-
-        return data_label
+        # Labels that end with a space followed by parenthesis with a number
+        # inside are counted as duplicates of the remainder of the label.  If the
+        # label with the number of duplicates appended is still taken (e.g., if
+        # "test (1)" was added before "test"), one more than the maximum duplicate
+        # number found is used instead.  See ``_DataLabelRegistry`` for the index
+        # of the labels that avoids looping over the whole data collection.
+        return self._data_labels.unique_name(data_label, ext=ext)
 
     def add_data_to_viewer(self, viewer_reference, data_label,
                            visible=True, clear_other_data=False):
@@ -1970,7 +1969,8 @@ class Application(VuetifyTemplate, HubListener):
         selected_items[data_id] = 'visible' if visible else 'hidden'
         if replace:
             for id in selected_items:
-                if id != data_id:
+                # each assignment triggers a sync of the application state
+                if id != data_id and selected_items[id] != 'hidden':
                     selected_items[id] = 'hidden'
 
         # remove WCS-only data from selected items, add to wcs_only_layers:
@@ -2058,6 +2058,8 @@ class Application(VuetifyTemplate, HubListener):
             The Glue data collection add message containing information about
             the new data.
         """
+        self._data_labels.add(msg.data)
+
         # We don't need to link the first data to itself
         if len(self.data_collection) > 1:
             self._link_new_data()
@@ -2065,12 +2067,14 @@ class Application(VuetifyTemplate, HubListener):
         self.state.data_items.append(data_item)
 
     def _clear_object_cache(self, data_label=None):
-        if data_label is None:
-            self._get_object_cache.clear()
-        else:
-            # keys are (data_label, statistic) tuples
-            self._get_object_cache = {k: v for k, v in self._get_object_cache.items()
-                                      if k[0] != data_label}
+        # keys are (data_label, statistic) tuples
+        self._get_object_cache.invalidate(data_label)
+
+    def _on_numerical_data_changed(self, msg):
+        # objects translated from the data, or from any of its subsets, are now stale
+        self._clear_object_cache(msg.data.label)
+        for subset in msg.data.subsets:
+            self._clear_object_cache(subset.label)
 
     def _on_data_deleted(self, msg):
         """
@@ -2083,6 +2087,8 @@ class Application(VuetifyTemplate, HubListener):
             The Glue data collection add message containing information about
             the new data.
         """
+        self._data_labels.remove(msg.data)
+
         for data_item in self.state.data_items:
             if data_item['name'] == msg.data.label:
                 self.state.data_items.remove(data_item)
@@ -66,7 +66,9 @@ class Cubeviz(ImageConfigHelper, LineListMixin):
             Setting this to `True` is not recommended unless you know what
             you are doing.
         **kwargs : dict
-            Extra keywords accepted by Jdaviz application-level parser.
+            Extra keywords accepted by Jdaviz application-level parser
+            (e.g., ``lazy=True`` to keep a FITS cube memory-mapped rather than
+            reading it into memory).
 
         """
         if not override_cube_limit and len(self.app.state.data_items) != 0:
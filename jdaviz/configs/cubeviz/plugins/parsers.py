@@ -8,8 +8,11 @@ from astropy.io import fits
 
 from astropy.time import Time
 from astropy.wcs import WCS
+from glue.core import Component, Data
+from glue_astronomy.translators.spectrum1d import PaddedSpectrumWCS
 from specutils import Spectrum1D
 
+from jdaviz.core.parse_cache import get_parse_cache
 from jdaviz.core.registries import data_parser_registry
 from jdaviz.utils import standardize_metadata, PRIHDR_KEY
 
@@ -20,9 +23,12 @@ EXT_TYPES = dict(flux=['flux', 'sci', 'data'],
                  uncert=['ivar', 'err', 'var', 'uncert'],
                  mask=['mask', 'dq', 'quality'])
 
+# Maximum number of cube values read into memory at once by collapses of lazily loaded cubes
+LAZY_CHUNK_SIZE = 2 ** 22
+
 
 @data_parser_registry("cubeviz-data-parser")
-def parse_data(app, file_obj, data_type=None, data_label=None):
+def parse_data(app, file_obj, data_type=None, data_label=None, cache_dir=None, lazy=False):
     """
     Attempts to parse a data file and auto-populate available viewers in
     cubeviz.
@@ -37,6 +43,16 @@ def parse_data(app, file_obj, data_type=None, data_label=None):
         The data type used to explicitly differentiate parsed data.
     data_label : str, optional
         The label to be applied to the Glue data component.
+    cache_dir : str, optional
+        Directory of an on-disk cache of parsed FITS files.  When given (or when the
+        ``JDAVIZ_PARSE_CACHE_DIR`` environment variable is set), re-loading an unchanged
+        file skips parsing and memory-maps (copy-on-write) the cached data instead.  Metadata
+        and WCS are stored as JSON, FITS headers, and ASDF (never pickled).
+    lazy : bool, optional
+        If `True`, a FITS file given by its path is not read into memory on load: the
+        flux, uncertainty, and mask (e.g., JWST DQ) extensions stay memory-mapped, image
+        viewers read the slices they display on demand, and collapsed spectra are computed
+        in chunks.  The parse cache is not used.
     """
 
     flux_viewer_reference_name = app._jdaviz_helper._default_flux_viewer_reference_name
@@ -69,7 +85,17 @@ def parse_data(app, file_obj, data_type=None, data_label=None):
 
         file_name = os.path.basename(file_obj)
 
-        with fits.open(file_obj) as hdulist:
+        # The cache copies the arrays to disk, which a lazy load is meant to avoid.
+        parse_cache = None if lazy else get_parse_cache(cache_dir)
+        if parse_cache is not None and _load_from_parse_cache(app, parse_cache, file_obj,
+                                                              data_label):
+            app.get_tray_item_from_name("Spectral Extraction").disabled_msg = ""
+            return
+        n_data_before = len(app.data_collection)
+
+        # Astropy scales data (e.g., DQ flags stored as offset signed integers) in memory,
+        # so a lazy load opens it unscaled instead (see _hdu_quantity).
+        with fits.open(file_obj, do_not_scale_image_data=lazy) as hdulist:
             prihdr = hdulist[0].header
             telescop = prihdr.get('TELESCOP', '').lower()
             exptype = prihdr.get('EXP_TYPE', '').lower()
@@ -87,7 +113,8 @@ def parse_data(app, file_obj, data_type=None, data_label=None):
                     _parse_jwst_s3d(
                         app, hdulist, data_label, ext=ext, viewer_name=viewer_name,
                         flux_viewer_reference_name=flux_viewer_reference_name,
-                        spectrum_viewer_reference_name=spectrum_viewer_reference_name
+                        spectrum_viewer_reference_name=spectrum_viewer_reference_name,
+                        lazy=lazy
                     )
             elif telescop == 'jwst' and filetype == 'r3d' and system == 'esa-pipeline':
                 for ext, viewer_name in (('DATA', flux_viewer_reference_name),
@@ -97,15 +124,20 @@ def parse_data(app, file_obj, data_type=None, data_label=None):
                     _parse_esa_s3d(
                         app, hdulist, data_label, ext=ext, viewer_name=viewer_name,
                         flux_viewer_reference_name=flux_viewer_reference_name,
-                        spectrum_viewer_reference_name=spectrum_viewer_reference_name
+                        spectrum_viewer_reference_name=spectrum_viewer_reference_name,
+                        lazy=lazy
                     )
             else:
                 _parse_hdulist(
                     app, hdulist, file_name=data_label or file_name,
                     flux_viewer_reference_name=flux_viewer_reference_name,
                     spectrum_viewer_reference_name=spectrum_viewer_reference_name,
-                    uncert_viewer_reference_name=uncert_viewer_reference_name
+                    uncert_viewer_reference_name=uncert_viewer_reference_name,
+                    lazy=lazy
                 )
+        if parse_cache is not None:
+            _store_in_parse_cache(app, parse_cache, file_obj, data_label,
+                                  app.data_collection[n_data_before:])
         app.get_tray_item_from_name("Spectral Extraction").disabled_msg = ""
 
     # If the data types are custom data objects, use explicit parsers. Note
@@ -136,6 +168,44 @@ def parse_data(app, file_obj, data_type=None, data_label=None):
         raise NotImplementedError(f'Unsupported data format: {file_obj}')
 
 
+def _load_from_parse_cache(app, parse_cache, file_obj, data_label):
+    """Load the cached glue data for ``file_obj`` into the app, returning whether it
+    was found (and did not clash with already loaded data labels)."""
+    entries = parse_cache.load(file_obj, variant=data_label or '')
+    if entries is None or any(entry['label'] in app.data_collection.labels
+                              for entry in entries):
+        return False
+
+    for entry in entries:
+        app.add_data(entry['data'], entry['label'])
+        for viewer_reference_name in entry['viewers']:
+            app.add_data_to_viewer(viewer_reference_name, entry['label'])
+        if entry['role'] == 'flux':
+            app._jdaviz_helper._loaded_flux_cube = app.data_collection[entry['label']]
+        elif entry['role'] == 'uncert':
+            app._jdaviz_helper._loaded_uncert_cube = app.data_collection[entry['label']]
+    return True
+
+
+def _store_in_parse_cache(app, parse_cache, file_obj, data_label, new_data):
+    """Store the glue data just parsed from ``file_obj``, along with the viewers
+    they were added to, in the on-disk cache."""
+    helper = app._jdaviz_helper
+    entries = []
+    for data in new_data:
+        data_id = app._data_id_from_label(data.label)
+        viewers = [ref for ref in app.get_viewer_reference_names()
+                   if data_id in app._viewer_item_by_reference(ref)['selected_data_items']]
+        if data is getattr(helper, '_loaded_flux_cube', None):
+            role = 'flux'
+        elif data is getattr(helper, '_loaded_uncert_cube', None):
+            role = 'uncert'
+        else:
+            role = None
+        entries.append({'label': data.label, 'data': data, 'viewers': viewers, 'role': role})
+    parse_cache.store(file_obj, entries, variant=data_label or '')
+
+
 def _get_celestial_wcs(wcs):
     """ If `wcs` has a celestial component return that, otherwise return None """
     return wcs.celestial if hasattr(wcs, 'celestial') else None
@@ -189,10 +259,100 @@ def _return_spectrum_with_correct_units(flux, wcs, metadata, data_type, target_w
     return new_sc
 
 
+class _LazyCubeData(Data):
+    """Glue data whose collapses (e.g., the spectrum viewer profile) are computed in
+    chunks of at most ``LAZY_CHUNK_SIZE`` values, so that a memory-mapped cube is never
+    read into memory as a whole.  As the cube is read-only, collapses of the whole cube
+    are kept rather than read from disk again whenever the spectrum viewer resets."""
+
+    def compute_statistic(self, statistic, cid, subset_state=None, axis=None, view=None,
+                          random_subset=None, n_chunk_max=LAZY_CHUNK_SIZE, **kwargs):
+        if (subset_state is not None or view is not None or random_subset is not None
+                or not isinstance(axis, (int, tuple))):
+            return super().compute_statistic(statistic, cid, subset_state=subset_state,
+                                             axis=axis, view=view, random_subset=random_subset,
+                                             n_chunk_max=n_chunk_max, **kwargs)
+        if not hasattr(self, '_collapse_cache'):
+            self._collapse_cache = {}
+        key = (statistic, cid, axis, tuple(sorted(kwargs.items())))
+        if key not in self._collapse_cache:
+            self._collapse_cache[key] = super().compute_statistic(
+                statistic, cid, axis=axis, n_chunk_max=n_chunk_max, **kwargs)
+        return self._collapse_cache[key].copy()
+
+
+class _UnsignedComponent(Component):
+    """Component of memory-mapped unsigned integers (e.g., JWST DQ flags) that FITS stores as
+    signed integers offset by ``BZERO``, converted back as they are read."""
+
+    def __init__(self, data, units=None):
+        super().__init__(data, units=units)
+        self._unsigned = np.dtype(data.dtype.str.replace('i', 'u'))
+
+    @property
+    def data(self):
+        return self._to_unsigned(self._data)
+
+    def __getitem__(self, key):
+        return self._to_unsigned(self._data[key])
+
+    def _to_unsigned(self, raw):
+        # Subtracting the offset of half the range just flips the sign bit
+        return raw.view(self._unsigned) ^ self._unsigned.type(2 ** (8 * raw.itemsize - 1))
+
+
+def _is_pseudo_unsigned(hdu):
+    dtype = hdu.data.dtype
+    return (dtype.kind == 'i' and hdu.header.get('BSCALE', 1) == 1
+            and hdu.header.get('BZERO', 0) == 2 ** (8 * dtype.itemsize - 1))
+
+
+def _is_lazy_flags(hdu, data_type):
+    """Whether ``hdu``, opened without scaling its data, holds integer flags that a lazy
+    load keeps memory-mapped."""
+    dtype = hdu.data.dtype
+    return (data_type == 'mask' and dtype.kind in 'iu' and dtype.itemsize > 1 and
+            (_is_pseudo_unsigned(hdu) or
+             (hdu.header.get('BSCALE', 1) == 1 and hdu.header.get('BZERO', 0) == 0)))
+
+
+def _hdu_quantity(hdu, unit, data_type, lazy=False):
+    """The data of ``hdu`` with ``unit``.  For a lazy load, ``hdu`` was opened without
+    scaling its data, so other than for flags, scaled data is scaled in memory here as
+    astropy would.  Flags are reinterpreted (rather than converted) as floats of the same
+    size, as only their shape is used before `_spectrum_to_lazy_data` restores them."""
+    data = hdu.data
+    if lazy and _is_lazy_flags(hdu, data_type):
+        return data.view(data.dtype.str.replace(data.dtype.kind, 'f')) << unit
+    if lazy and (hdu.header.get('BSCALE', 1) != 1 or hdu.header.get('BZERO', 0) != 0):
+        data = data * hdu.header.get('BSCALE', 1) + hdu.header.get('BZERO', 0)
+    return data << unit
+
+
+def _spectrum_to_lazy_data(sc, hdu, data_type):
+    """Translate a cube `~specutils.Spectrum1D` of ``hdu`` (see `_hdu_quantity`) to glue
+    data like the glue-astronomy translator does, but wrap its (memory-mapped) flux array
+    in a component as is.  The translator coerces the transposed flux into a new in-memory
+    array instead."""
+    if sc.wcs.world_n_dim == 1:
+        data = _LazyCubeData(coords=PaddedSpectrumWCS(sc.wcs, sc.data.ndim))
+    else:
+        data = _LazyCubeData(coords=sc.wcs)
+    if not _is_lazy_flags(hdu, data_type):
+        component = Component(sc.data, units=str(sc.unit))
+    elif _is_pseudo_unsigned(hdu):
+        component = _UnsignedComponent(sc.data.view(hdu.data.dtype), units=str(sc.unit))
+    else:
+        component = Component(sc.data.view(hdu.data.dtype), units=str(sc.unit))
+    data.add_component(component, 'flux')
+    data.meta.update(sc.meta)
+    return data
+
+
 def _parse_hdulist(app, hdulist, file_name=None,
                    flux_viewer_reference_name=None,
                    spectrum_viewer_reference_name=None,
-                   uncert_viewer_reference_name=None):
+                   uncert_viewer_reference_name=None, lazy=False):
     if file_name is None and hasattr(hdulist, 'file_name'):
         file_name = hdulist.file_name
     else:
@@ -236,7 +396,7 @@ def _parse_hdulist(app, hdulist, file_name=None,
             logging.warning("Invalid BUNIT, using count as data unit")
             flux_unit = u.count
 
-        flux = hdu.data << flux_unit
+        flux = _hdu_quantity(hdu, flux_unit, data_type, lazy=lazy)
 
         metadata = standardize_metadata(hdu.header)
         if hdu.name != 'PRIMARY' and 'PRIMARY' in hdulist:
@@ -248,7 +408,7 @@ def _parse_hdulist(app, hdulist, file_name=None,
         # to sky regions, where the parent data of the subset might have dropped spatial WCS info
         metadata['_orig_spatial_wcs'] = _get_celestial_wcs(wcs)
 
-        app.add_data(sc, data_label)
+        app.add_data(_spectrum_to_lazy_data(sc, hdu, data_type) if lazy else sc, data_label)
         if data_type == 'flux':  # Forced wave unit conversion made it lose stuff, so re-add
             app.data_collection[-1].get_component("flux").units = flux_unit
 
@@ -270,7 +430,7 @@ def _parse_hdulist(app, hdulist, file_name=None,
 
 def _parse_jwst_s3d(app, hdulist, data_label, ext='SCI',
                     viewer_name=None, flux_viewer_reference_name=None,
-                    spectrum_viewer_reference_name=None):
+                    spectrum_viewer_reference_name=None, lazy=False):
     hdu = hdulist[ext]
     data_type = _get_data_type_by_hdu(hdu)
 
@@ -289,10 +449,10 @@ def _parse_jwst_s3d(app, hdulist, data_label, ext='SCI',
                     break
 
     if ext == 'DQ':  # DQ flags have no unit
-        flux = hdu.data << u.dimensionless_unscaled
+        flux = _hdu_quantity(hdu, u.dimensionless_unscaled, data_type, lazy=lazy)
     else:
         unit = u.Unit(hdu.header.get('BUNIT', 'count'))
-        flux = hdu.data << unit
+        flux = _hdu_quantity(hdu, unit, data_type, lazy=lazy)
     wcs = WCS(hdulist['SCI'].header, hdulist)  # Everything uses SCI WCS
 
     metadata = standardize_metadata(hdu.header)
@@ -305,7 +465,7 @@ def _parse_jwst_s3d(app, hdulist, data_label, ext='SCI',
         metadata[PRIHDR_KEY] = standardize_metadata(hdulist['PRIMARY'].header)
 
     data = _return_spectrum_with_correct_units(flux, wcs, metadata, data_type, hdulist=hdulist)
-    app.add_data(data, data_label)
+    app.add_data(_spectrum_to_lazy_data(data, hdu, data_type) if lazy else data, data_label)
     if data_type == 'flux':  # Forced wave unit conversion made it lose stuff, so re-add
         app.data_collection[-1].get_component("flux").units = flux.unit
 
@@ -322,15 +482,15 @@ def _parse_jwst_s3d(app, hdulist, data_label, ext='SCI',
 
 
 def _parse_esa_s3d(app, hdulist, data_label, ext='DATA', flux_viewer_reference_name=None,
-                   spectrum_viewer_reference_name=None):
+                   spectrum_viewer_reference_name=None, lazy=False):
     hdu = hdulist[ext]
     data_type = _get_data_type_by_hdu(hdu)
 
     if ext == 'QUALITY':  # QUALITY flags have no unit
-        flux = hdu.data << u.dimensionless_unscaled
+        flux = _hdu_quantity(hdu, u.dimensionless_unscaled, data_type, lazy=lazy)
     else:
         unit = u.Unit(hdu.header.get('BUNIT', 'count'))
-        flux = hdu.data << unit
+        flux = _hdu_quantity(hdu, unit, data_type, lazy=lazy)
 
     hdr = hdulist[1].header
 
@@ -358,7 +518,7 @@ def _parse_esa_s3d(app, hdulist, data_label, ext='DATA', flux_viewer_reference_n
 
     data = _return_spectrum_with_correct_units(flux, wcs, metadata, data_type, hdulist=hdulist)
 
-    app.add_data(data, data_label)
+    app.add_data(_spectrum_to_lazy_data(data, hdu, data_type) if lazy else data, data_label)
 
     if data_type == 'flux':  # Forced wave unit conversion made it lose stuff, so re-add
         app.data_collection[-1].get_component("flux").units = flux.unit
@@ -497,6 +657,7 @@ def _parse_gif(app, file_obj, data_label=None, flux_viewer_reference_name=None,
 def _get_data_type_by_hdu(hdu):
     # If the data type is some kind of integer, assume it's the mask/dq
     if (hdu.data.dtype in (int, np.uint, np.uint8, np.uint16, np.uint32) or
+            _is_pseudo_unsigned(hdu) or
             any(x in hdu.name.lower() for x in EXT_TYPES['mask'])):
         data_type = 'mask'
     elif ('errtype' in [x.lower() for x in hdu.header.keys()] or
@@ -8,7 +8,6 @@ from astropy.units import UnitsWarning
 from glue_jupyter.bqplot.image import BqplotImageView
 from glue_jupyter.bqplot.profile import BqplotProfileView
 from traitlets import Bool, observe, Any, Int
-from specutils.spectra.spectrum1d import Spectrum1D
 
 from jdaviz.core.events import (AddDataMessage, SliceToolStateMessage,
                                 SliceSelectSliceMessage, SliceWavelengthUpdatedMessage,
@@ -16,6 +15,7 @@ from jdaviz.core.events import (AddDataMessage, SliceToolStateMessage,
 from jdaviz.core.registries import tray_registry
 from jdaviz.core.template_mixin import PluginTemplateMixin
 from jdaviz.core.user_api import PluginUserApi
+from jdaviz.utils import spectral_axis_from_data
 
 __all__ = ['Slice']
 
@@ -136,7 +136,7 @@ class Slice(PluginTemplateMixin):
     def _update_reference_data(self, reference_data):
         if reference_data is None:
             return  # pragma: no cover
-        self._update_data(reference_data.get_object(cls=Spectrum1D).spectral_axis)
+        self._update_data(spectral_axis_from_data(reference_data))
 
     def _update_data(self, x_all):
         self._x_all = x_all.value
@@ -29,6 +29,9 @@ __all__ = ['SpectralExtraction']
 
 ASTROPY_LT_5_3_2 = Version(astropy.__version__) < Version('5.3.2')
 
+# Maximum number of cube elements collapsed at once by spectral extraction.
+SPECTRAL_EXTRACTION_CHUNK_ELEMENTS = 2 ** 22
+
 
 @tray_registry(
     'cubeviz-spectral-extraction', label="Spectral Extraction", viewer_requirements='spectrum'
@@ -206,20 +209,10 @@ class SpectralExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
         spectral_cube = self._app._jdaviz_helper._loaded_flux_cube
         uncert_cube = self._app._jdaviz_helper._loaded_uncert_cube
 
-        # This plugin collapses over the *spatial axes* (optionally over a spatial subset,
-        # defaults to ``No Subset``). Since the Cubeviz parser puts the fluxes
-        # and uncertainties in different glue Data objects, we translate the spectral
-        # cube and its uncertainties into separate NDDataArrays, then combine them:
-        if self.aperture.selected != self.aperture.default_text:
-            nddata = spectral_cube.get_subset_object(
-                subset_id=self.aperture.selected, cls=NDDataArray
-            )
-            uncertainties = uncert_cube.get_subset_object(
-                subset_id=self.aperture.selected, cls=StdDevUncertainty
-            )
-        else:
-            nddata = spectral_cube.get_object(cls=NDDataArray)
-            uncertainties = uncert_cube.get_object(cls=StdDevUncertainty)
+        # by default we want to use operation_ignores_mask=True in nddata:
+        kwargs.setdefault("operation_ignores_mask", True)
+        # by default we want to propagate uncertainties:
+        kwargs.setdefault("propagate_uncertainties", True)
 
         # Use the spectral coordinate from the WCS:
         if '_orig_spec' in spectral_cube.meta:
@@ -227,26 +220,67 @@ class SpectralExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
         else:
             wcs = spectral_cube.coords.spectral
 
-        flux = nddata.data << nddata.unit
-        mask = nddata.mask
-
-        nddata_reshaped = NDDataArray(
-            flux, mask=mask, uncertainty=uncertainties, wcs=wcs, meta=nddata.meta
-        )
+        # This plugin collapses over the *spatial axes* (optionally over a spatial subset,
+        # defaults to ``No Subset``). Since the Cubeviz parser puts the fluxes
+        # and uncertainties in different glue Data objects, we read the spectral
+        # cube and its uncertainties directly and combine them into NDDataArrays:
+        flux = spectral_cube.get_component('flux')
+        if uncert_cube is not None:
+            uncert = uncert_cube.get_component(uncert_cube.main_components[0])
+        else:
+            uncert = None
 
-        # by default we want to use operation_ignores_mask=True in nddata:
-        kwargs.setdefault("operation_ignores_mask", True)
-        # by default we want to propagate uncertainties:
-        kwargs.setdefault("propagate_uncertainties", True)
+        if self.aperture.selected != self.aperture.default_text:
+            # spatial subsets do not depend on wavelength, so the aperture mask is computed
+            # for a single slice and the collapse restricted to its bounding box
+            spatial_mask = ~spectral_cube.get_mask(self.aperture.selected_subset_state,
+                                                   view=(slice(None), slice(None), 0))
+            if kwargs['operation_ignores_mask']:
+                spatial_view = _bounding_box_view(~spatial_mask)
+            else:
+                spatial_view = (slice(None), slice(None))
+            spatial_mask = spatial_mask[spatial_view]
+        else:
+            spatial_mask = None
+            spatial_view = (slice(None), slice(None))
 
         # Collapse an e.g. 3D spectral cube to 1D spectrum, assuming that last axis
         # is always wavelength. This may need adjustment after the following
         # specutils PR is merged: https://github.com/astropy/specutils/pull/1033
-        spatial_axes = (0, 1)
+        # Within each chunk the spectral axis is moved first, since the propagation of
+        # uncertainties for min/max in astropy assumes the preserved axes lead.
+        spatial_axes = (1, 2)
+        function = self.function_selected.lower()
+
+        # Each spectral chunk is collapsed independently so that only a bounded cutout of
+        # the cube (and its uncertainties) is held in memory at any time.
+        n_spectral = spectral_cube.shape[-1]
+        n_spatial = max(1, flux.data[spatial_view + (0,)].size)
+        chunk_size = max(1, SPECTRAL_EXTRACTION_CHUNK_ELEMENTS // n_spatial)
+        collapsed_chunks = []
+        for start in range(0, n_spectral, chunk_size):
+            view = spatial_view + (slice(start, start + chunk_size),)
+            flux_chunk = np.moveaxis(flux.data[view], -1, 0)
+            if spatial_mask is not None:
+                mask = np.broadcast_to(spatial_mask, flux_chunk.shape)
+            elif function in ('min', 'max'):
+                # astropy requires a mask to propagate uncertainties for min/max
+                mask = np.zeros(flux_chunk.shape, dtype=bool)
+            else:
+                mask = None
+            if uncert is not None:
+                uncertainties = StdDevUncertainty(np.moveaxis(uncert.data[view], -1, 0),
+                                                  unit=uncert.units)
+            else:
+                uncertainties = None
+            nddata_chunk = NDDataArray(
+                flux_chunk << u.Unit(flux.units), mask=mask, uncertainty=uncertainties
+            )
+            collapsed_chunks.append(getattr(nddata_chunk, function)(
+                axis=spatial_axes, **kwargs
+            ))  # returns an NDDataArray
 
-        collapsed_nddata = getattr(nddata_reshaped, self.function_selected.lower())(
-            axis=spatial_axes, **kwargs
-        )  # returns an NDDataArray
+        collapsed_nddata = _concatenate_collapsed(collapsed_chunks, wcs, spectral_cube.meta)
 
         # Convert to Spectrum1D, with the spectral axis in correct units:
         if hasattr(spectral_cube.coords, 'spectral_wcs'):
@@ -343,6 +377,42 @@ class SpectralExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
         self.results_label_default = label
 
 
+def _bounding_box_view(include):
+    """
+    Return the slices of the smallest box containing all `True` values of the 2D
+    ``include`` array (or the full array if there are none).
+    """
+    if not np.any(include):
+        return (slice(None), slice(None))
+    view = []
+    for axis in (1, 0):
+        inds = np.flatnonzero(np.any(include, axis=axis))
+        view.append(slice(inds[0], inds[-1] + 1))
+    return tuple(view)
+
+
+def _concatenate_collapsed(collapsed_chunks, wcs, meta):
+    """
+    Join NDDataArrays collapsed from consecutive spectral chunks into a single NDDataArray.
+    """
+    flux = np.concatenate([chunk.data for chunk in collapsed_chunks])
+    if all(chunk.mask is None for chunk in collapsed_chunks):
+        mask = None
+    else:
+        mask = np.concatenate([np.zeros(chunk.data.shape, dtype=bool)
+                               if chunk.mask is None else chunk.mask
+                               for chunk in collapsed_chunks])
+    if collapsed_chunks[0].uncertainty is not None:
+        uncertainty = StdDevUncertainty(
+            np.concatenate([chunk.uncertainty.array for chunk in collapsed_chunks]),
+            unit=collapsed_chunks[0].uncertainty.unit
+        )
+    else:
+        uncertainty = None
+    return NDDataArray(flux, unit=collapsed_chunks[0].unit, mask=mask,
+                       uncertainty=uncertainty, wcs=wcs, meta=meta)
+
+
 def _move_spectral_axis(wcs, flux, mask=None, uncertainty=None):
     """
     Move spectral axis last to match specutils convention. This
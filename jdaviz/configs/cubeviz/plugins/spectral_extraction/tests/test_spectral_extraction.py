@@ -3,10 +3,14 @@ import pytest
 from packaging.version import Version
 import numpy as np
 import astropy
+from astropy import units as u
+from astropy.wcs import WCS
 from astropy.nddata import NDDataArray, StdDevUncertainty
 from specutils import Spectrum1D
 from regions import CirclePixelRegion, PixCoord
-from astropy.utils.exceptions import AstropyUserWarning
+from numpy.testing import assert_allclose
+
+from jdaviz.configs.cubeviz.plugins.spectral_extraction import spectral_extraction
 
 ASTROPY_LT_5_3_2 = Version(astropy.__version__) < Version('5.3.2')
 
@@ -64,10 +68,7 @@ def test_gauss_smooth_before_spec_extract(cubeviz_helper, spectrum1d_cube_with_u
     gs_plugin.mode_selected = 'Spatial'
     gs_plugin.stddev = 3
 
-    with pytest.warns(
-            AstropyUserWarning,
-            match='The following attributes were set on the data object, but will be ignored'):
-        gs_plugin.vue_apply()
+    gs_plugin.vue_apply()
 
     gs_data_label = cubeviz_helper.app.data_collection[2].label
     cubeviz_helper.app.add_data_to_viewer('flux-viewer', gs_data_label)
@@ -144,6 +145,58 @@ def test_subset(
     assert np.all(np.equal(collapsed_spec_2.uncertainty.array, expected_uncert))
 
 
+@pytest.mark.skipif(ASTROPY_LT_5_3_2, reason='Needs astropy 5.3.2 or later')
+@pytest.mark.parametrize("function", ["Sum", "Mean", "Min", "Max"])
+@pytest.mark.parametrize("aperture", ["Entire Cube", "Subset 1"])
+def test_chunked_collapse(cubeviz_helper, monkeypatch, function, aperture):
+    rng = np.random.default_rng(0)
+    flux = rng.random((25, 10, 12))
+    uncert = rng.random(flux.shape)
+    wcs = WCS({'CTYPE1': 'RA---TAN', 'CUNIT1': 'deg', 'CDELT1': -0.0001, 'CRPIX1': 1,
+               'CRVAL1': 205, 'CTYPE2': 'DEC--TAN', 'CUNIT2': 'deg', 'CDELT2': 0.0001,
+               'CRPIX2': 1, 'CRVAL2': 27, 'CTYPE3': 'WAVE-LOG', 'CUNIT3': 'm',
+               'CDELT3': 0.2e-10, 'CRPIX3': 1, 'CRVAL3': 4.6e-7})
+    cubeviz_helper.load_data(Spectrum1D(flux=flux * u.Jy, wcs=wcs,
+                                        uncertainty=StdDevUncertainty(uncert * u.Jy)))
+    cubeviz_helper.load_regions(CirclePixelRegion(PixCoord(4, 6), radius=2.5))
+
+    plg = cubeviz_helper.plugins['Spectral Extraction']
+    plg.function = function
+    plg.aperture = aperture
+    collapsed = plg.collapse_to_spectrum(add_data=False)
+
+    # collapsing a few wavelengths at a time gives identical results
+    monkeypatch.setattr(spectral_extraction, 'SPECTRAL_EXTRACTION_CHUNK_ELEMENTS', 50)
+    collapsed_chunked = plg.collapse_to_spectrum(add_data=False)
+    assert_allclose(collapsed_chunked.flux, collapsed.flux)
+    assert_allclose(collapsed_chunked.uncertainty.array, collapsed.uncertainty.array)
+
+    # compare against a direct calculation within the aperture
+    flux_data, uncert_data = cubeviz_helper.app.data_collection[:2]
+    if aperture == 'Entire Cube':
+        in_aperture = np.ones(flux_data.shape, dtype=bool)
+    else:
+        in_aperture = flux_data.get_mask(plg._obj.aperture.selected_subset_state)
+    n = in_aperture.sum(axis=(0, 1))
+    flux_cube = flux_data.get_data(flux_data.id['flux'])
+    uncert_cube = uncert_data.get_data(uncert_data.main_components[0])
+    masked_flux = np.ma.masked_array(flux_cube, ~in_aperture)
+    if function == 'Sum':
+        expected = masked_flux.sum(axis=(0, 1))
+        expected_uncert = np.sqrt(np.sum(uncert_cube ** 2, axis=(0, 1), where=in_aperture))
+    elif function == 'Mean':
+        expected = masked_flux.mean(axis=(0, 1))
+        expected_uncert = np.sqrt(np.sum(uncert_cube ** 2, axis=(0, 1), where=in_aperture)) / n
+    else:
+        ext = getattr(masked_flux, function.lower())
+        expected = ext(axis=(0, 1))
+        arg = getattr(masked_flux.reshape(-1, flux_cube.shape[-1]), f'arg{function.lower()}')
+        expected_uncert = uncert_cube.reshape(-1, flux_cube.shape[-1])[arg(axis=0),
+                                                                       np.arange(len(n))]
+    assert_allclose(collapsed.flux.value, expected)
+    assert_allclose(collapsed.uncertainty.array, expected_uncert)
+
+
 def test_save_collapsed_to_fits(cubeviz_helper, spectrum1d_cube_with_uncerts, tmpdir):
 
     cubeviz_helper.load_data(spectrum1d_cube_with_uncerts)
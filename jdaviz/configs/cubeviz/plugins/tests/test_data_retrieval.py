@@ -6,6 +6,22 @@ import numpy as np
 from astropy.utils.data import download_file
 
 
+@pytest.mark.filterwarnings('ignore')
+def test_get_data_collapsed_copy(cubeviz_helper, spectrum1d_cube_with_uncerts):
+    cubeviz_helper.load_data(spectrum1d_cube_with_uncerts, data_label='test')
+    sp = cubeviz_helper.get_data('test[FLUX]', function='sum')
+    cached = cubeviz_helper.app._get_object_cache.get(('test[FLUX]', 'sum'))
+    expected_flux = cached.flux.copy()
+
+    # the collapsed spectrum is shared with the spectrum viewer, but each call gets a copy
+    assert sp is not cached
+    sp.flux[:] = 0 * sp.flux.unit
+    np.testing.assert_array_equal(cached.flux, expected_flux)
+    sp2 = cubeviz_helper.get_data('test[FLUX]', function='sum', use_display_units=True)
+    np.testing.assert_array_equal(sp2.flux, expected_flux)
+    assert sp2 is not cached
+
+
 @pytest.mark.remote_data
 def test_data_retrieval(cubeviz_helper):
     """The purpose of this test is to check that both methods:
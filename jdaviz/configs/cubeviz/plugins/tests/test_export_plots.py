@@ -1,8 +1,12 @@
 import os
 
+import numpy as np
 import pytest
+from numpy.testing import assert_allclose
 
-from jdaviz.configs.default.plugins.export_plot.export_plot import HAS_OPENCV
+from jdaviz.configs.default.plugins.export_plot.export_plot import (HAS_OPENCV,
+                                                                    _movie_frame_maker,
+                                                                    _render_movie_frames)
 
 
 # TODO: Remove skip when https://github.com/bqplot/bqplot/pull/1397/files#r726500097 is resolved.
@@ -24,6 +28,35 @@ def test_export_movie(cubeviz_helper, spectrum1d_cube, tmp_path):
         os.chdir(orig_path)
 
 
+def test_movie_frames(cubeviz_helper, spectrum1d_cube_larger):
+    cubeviz_helper.load_data(spectrum1d_cube_larger, data_label="test")
+    viewer = cubeviz_helper.default_viewer._obj
+    viewer.state.layers[0].stretch = 'sqrt'
+
+    # without a display shape, frames are sampled at one pixel per data pixel
+    render = _movie_frame_maker(viewer)
+    shape = viewer.state.reference_data.shape
+    ny, nx = shape[viewer.state.y_att.axis], shape[viewer.state.x_att.axis]
+    assert render(0).shape == (ny, nx, 3)
+    assert render(0).dtype == np.uint8
+
+    viewer.shape = (20, 40)
+    bounds = [(viewer.state.y_min, viewer.state.y_max, 20),
+              (viewer.state.x_min, viewer.state.x_max, 40)]
+    render = _movie_frame_maker(viewer)
+    frames = list(_render_movie_frames(viewer, 1, 3, max_workers=2))
+    assert len(frames) == 3
+
+    # frames match what the viewer itself displays at each slice
+    slice_plg = cubeviz_helper.plugins["Slice"]._obj
+    for i, frame in zip(range(1, 4), frames):
+        slice_plg._on_slider_updated({'new': i})
+        expected = np.round(viewer._composite(bounds=bounds)[::-1, :, 2::-1] * 255)
+        assert_allclose(frame, expected)
+        assert_allclose(render(i), frame)
+    assert not np.all(frames[0] == frames[-1])
+
+
 @pytest.mark.skipif(HAS_OPENCV, reason="opencv-python is installed")
 def test_no_opencv(cubeviz_helper, spectrum1d_cube):
     cubeviz_helper.load_data(spectrum1d_cube, data_label="test")
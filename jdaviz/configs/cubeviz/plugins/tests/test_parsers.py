@@ -1,7 +1,10 @@
+import mmap
+
 import astropy
 import numpy as np
 import pytest
 from astropy import units as u
+from astropy.io import fits
 from astropy.utils.introspection import minversion
 from astropy.wcs import WCS
 from specutils import Spectrum1D
@@ -9,6 +12,9 @@ from glue.core.roi import XRangeROI
 from glue_astronomy.translators.spectrum1d import PaddedSpectrumWCS
 from numpy.testing import assert_allclose, assert_array_equal
 
+from jdaviz import Cubeviz
+from jdaviz.core import parse_cache
+from jdaviz.core.parse_cache import ParseCache
 from jdaviz.utils import PRIHDR_KEY
 
 ASTROPY_LT_5_3 = not minversion(astropy, "5.3")
@@ -121,6 +127,114 @@ def test_fits_image_hdu_parse_from_file(tmpdir, image_cube_hdu_obj, cubeviz_help
                                          '205.4443201084 26.9996148908 (deg)')
 
 
+@pytest.mark.filterwarnings('ignore')
+def test_fits_parse_cache(tmp_path, image_cube_hdu_obj, cubeviz_helper, monkeypatch):
+    path = str(tmp_path / "test_fits_image.fits")
+    image_cube_hdu_obj.writeto(path)
+    cache_dir = tmp_path / "cache"
+    cubeviz_helper.load_data(path, cache_dir=cache_dir)
+    assert len(ParseCache(cache_dir).entries()) == 1
+
+    # loading the same file again is served from the cache
+    cached_helper = Cubeviz()
+    cached_helper.load_data(path, cache_dir=cache_dir)
+
+    app, cached_app = cubeviz_helper.app, cached_helper.app
+    assert cached_app.data_collection.labels == app.data_collection.labels
+    for data, cached_data in zip(app.data_collection, cached_app.data_collection):
+        # cached arrays are memory-mapped rather than read into memory
+        base = cached_data.get_component('flux').data
+        while base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        assert base is not None
+        assert_array_equal(cached_data.get_component('flux').data,
+                           data.get_component('flux').data)
+        assert cached_data.get_component('flux').units == data.get_component('flux').units
+        assert cached_data.meta['EXTNAME'] == data.meta['EXTNAME']
+        assert (cached_data.meta['_fits_comment_card']['EXTNAME'] ==
+                data.meta['_fits_comment_card']['EXTNAME'])
+        assert (cached_data.meta['_orig_spatial_wcs'].to_header_string() ==
+                data.meta['_orig_spatial_wcs'].to_header_string())
+        assert_allclose(cached_data.get_object(Spectrum1D, statistic=None).spectral_axis,
+                        data.get_object(Spectrum1D, statistic=None).spectral_axis)
+    for viewer_ref in app.get_viewer_reference_names():
+        assert (cached_helper.viewers[viewer_ref].data_labels_loaded ==
+                cubeviz_helper.viewers[viewer_ref].data_labels_loaded)
+    assert cached_helper._loaded_flux_cube.label == "test_fits_image.fits[FLUX]"
+    assert cached_helper._loaded_uncert_cube.label == "test_fits_image.fits[ERR]"
+
+    # the manifest is plain JSON, and cached arrays are memory-mapped copy-on-write, so that
+    # changes are never written back to the cache
+    assert len(list(cache_dir.glob('*/manifest.json'))) == 1
+    base = cached_app.data_collection[0].get_component('flux').data
+    while not isinstance(base, np.memmap):
+        base = base.base
+    assert base.mode == 'c'
+
+    # entries in a read-only cache directory are still served
+    def utime(path):
+        raise PermissionError(path)
+
+    with monkeypatch.context() as m:
+        m.setattr(parse_cache.os, 'utime', utime)
+        assert ParseCache(cache_dir).load(path) is not None
+
+    # a modified file is parsed again
+    image_cube_hdu_obj[1].data *= 2
+    image_cube_hdu_obj.writeto(path, overwrite=True)
+    reparsed_helper = Cubeviz()
+    reparsed_helper.load_data(path, cache_dir=cache_dir)
+    assert_array_equal(reparsed_helper.app.data_collection[0].get_component('flux').data, 2)
+    assert len(ParseCache(cache_dir).entries()) == 2
+
+
+@pytest.mark.filterwarnings('ignore')
+@pytest.mark.parametrize('jwst', (False, True))
+def test_fits_lazy_parse(tmp_path, image_cube_hdu_obj_microns, cubeviz_helper, jwst):
+    hdulist = image_cube_hdu_obj_microns
+    hdulist['MASK'].data[0, 0, 0] = 2 ** 15 + 1  # stored as offset signed integers
+    if jwst:
+        hdulist[0].header.update({'TELESCOP': 'JWST', 'EXP_TYPE': 'MIR_MRS'})
+        hdulist['FLUX'].name = 'SCI'
+        hdulist['MASK'] = fits.ImageHDU(hdulist['MASK'].data.astype(np.uint32), name='DQ')
+    path = str(tmp_path / "test_fits_image.fits")
+    hdulist.writeto(path)
+
+    eager_helper = Cubeviz()
+    eager_helper.load_data(path)
+    cubeviz_helper.load_data(path, lazy=True)
+
+    app, eager_app = cubeviz_helper.app, eager_helper.app
+    assert app.data_collection.labels == eager_app.data_collection.labels
+    for data, eager_data in zip(app.data_collection, eager_app.data_collection):
+        # the extensions are memory-mapped rather than read into memory
+        component = data.get_component('flux')
+        base = component._data
+        while isinstance(base, np.ndarray):
+            base = base.base
+        assert isinstance(base, mmap.mmap)
+        assert_array_equal(data['flux'], eager_data['flux'])
+        assert_array_equal(data.get_data(data.id['flux'], view=(slice(None), slice(None), 3)),
+                           eager_data['flux'][:, :, 3])
+        assert component.units == eager_data.get_component('flux').units
+        assert data.meta['EXTNAME'] == eager_data.meta['EXTNAME']
+    assert app.data_collection[-1]['flux'][0, 0, 0] == 2 ** 15 + 1
+    for viewer_ref in app.get_viewer_reference_names():
+        assert (cubeviz_helper.viewers[viewer_ref].data_labels_loaded ==
+                eager_helper.viewers[viewer_ref].data_labels_loaded)
+
+    # collapsed spectra match, whether or not already computed for the spectrum viewer
+    flux_label = cubeviz_helper._loaded_flux_cube.label
+    for function in ('mean', 'sum', 'median'):
+        spec = cubeviz_helper.get_data(flux_label, function=function)
+        eager_spec = eager_helper.get_data(flux_label, function=function)
+        assert_allclose(spec.flux, eager_spec.flux)
+        assert_allclose(spec.spectral_axis, eager_spec.spectral_axis)
+        spec.flux[:] = 0
+        assert_allclose(cubeviz_helper.get_data(flux_label, function=function).flux,
+                        eager_spec.flux)
+
+
 @pytest.mark.filterwarnings('ignore')
 def test_spectrum3d_parse(image_cube_hdu_obj, cubeviz_helper):
     flux = image_cube_hdu_obj[1].data << u.Unit(image_cube_hdu_obj[1].header['BUNIT'])
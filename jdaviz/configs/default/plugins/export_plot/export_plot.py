@@ -1,6 +1,13 @@
 import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+from glue.core import BaseData
+from glue.viewers.image.composite_array import CompositeArray
+from glue.viewers.image.state import get_sliced_data_maker
 from glue_jupyter.bqplot.image import BqplotImageView
 from traitlets import Any, Bool, Unicode
 
@@ -15,13 +22,90 @@ try:
 except ImportError:
     HAS_OPENCV = False
 else:
-    import threading
-    import time
     HAS_OPENCV = True
 
 __all__ = ['ExportViewer']
 
 
+def _movie_frame_maker(viewer):
+    """
+    Return a function that renders a slice of the cube in an image viewer to an 8-bit
+    BGR frame (as expected by OpenCV) in Python, without a roundtrip to the browser.
+
+    Frames use the current limits of the viewer and the stretch, limits, colormap (or
+    color) and opacity of its image layers at the time this is called (subsets and other
+    marks are not included).  They are sampled at the display resolution of the viewer,
+    or at one frame pixel per data pixel if the viewer has never been displayed.
+    """
+    state = viewer.state
+    ref_data = state.reference_data
+    x_axis, y_axis = state.x_att.axis, state.y_att.axis
+    slice_axis = [i for i in range(ref_data.ndim) if i not in (x_axis, y_axis)]
+    if len(slice_axis) != 1:
+        raise ValueError("Selected viewer is not displaying a cube.")
+    slice_axis = slice_axis[0]
+    # the fixed resolution buffer is ordered by data axes, but we need (y, x)
+    transpose = y_axis > x_axis
+
+    if viewer.shape is not None:
+        ny, nx = viewer.shape
+    else:
+        ny = int(np.ceil(state.y_max - state.y_min))
+        nx = int(np.ceil(state.x_max - state.x_min))
+    bounds = [(state.y_min, state.y_max, ny), (state.x_min, state.x_max, nx)]
+
+    # copy the display settings of the image layers that the viewer itself composites
+    layers = {}
+    for artist in viewer.layers:
+        uuid = getattr(artist, 'uuid', None)
+        if uuid in viewer._composite.layers and isinstance(artist.layer, BaseData):
+            layers[uuid] = (dict(viewer._composite.layers[uuid]),
+                            artist.layer, artist.state.attribute)
+    mode = viewer._composite.mode
+    slices = list(state.slices)
+
+    def render(i):
+        frame_slices = list(slices)
+        frame_slices[slice_axis] = i
+        composite = CompositeArray()
+        composite.mode = mode
+        for uuid, (layer, data, attribute) in layers.items():
+            composite.layers[uuid] = dict(layer, array=get_sliced_data_maker(
+                x_axis=x_axis, y_axis=y_axis, slices=frame_slices, data=data,
+                target_cid=attribute, reference_data=ref_data, transpose=transpose))
+        img = composite(bounds=bounds)
+        if img is None:
+            return np.zeros((ny, nx, 3), dtype=np.uint8)
+        # the first row of the buffer is the bottom of the image, and OpenCV expects BGR
+        return np.round(img[::-1, :, 2::-1] * 255).astype(np.uint8)
+
+    return render
+
+
+def _render_movie_frames(viewer, i_start, i_end, max_workers=None):
+    """
+    Yield the frames for slices ``i_start`` to ``i_end`` (inclusive) in order, rendering
+    up to ``2 * max_workers`` frames ahead in a thread pool.
+    """
+    render = _movie_frame_maker(viewer)
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for i in range(i_start, i_end + 1):
+                pending.append(executor.submit(render, i))
+                if len(pending) > 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # if the consumer stops early (e.g., interrupted recording)
+            for future in pending:
+                future.cancel()
+
+
 @tray_registry('g-export-plot', label="Export Plot")
 class ExportViewer(PluginTemplateMixin, ViewerSelectMixin):
     """
@@ -148,53 +232,26 @@ class ExportViewer(PluginTemplateMixin, ViewerSelectMixin):
         self.save_figure(filetype=filetype)
 
     @with_spinner('movie_recording')
-    def _save_movie(self, i_start, i_end, fps, filename, rm_temp_files):
-        # NOTE: All the stuff here has to be in the same thread but
-        #       separate from main app thread to work.
-
+    def _save_movie(self, i_start, i_end, fps, filename):
+        # NOTE: Frames are rendered in Python and streamed to the video writer, so this can
+        #       run in a separate thread from the main app without a browser.
         viewer = self.viewer.selected_obj
-        slice_plg = self.app._jdaviz_helper.plugins["Slice"]._obj
-        orig_slice = slice_plg.slice
-        temp_png_files = []
-        i = i_start
+        frames = _render_movie_frames(viewer, i_start, i_end)
         video = None
 
-        # TODO: Expose to users?
-        i_step = 1  # Need n_frames check if we allow tweaking
-
         try:
-            while i <= i_end:
+            for frame in frames:
                 if self.movie_interrupt:
                     break
 
-                slice_plg._on_slider_updated({'new': i})
-                cur_pngfile = f"._cubeviz_movie_frame_{i}.png"
-                self.save_figure(filename=cur_pngfile, filetype="png")
-                temp_png_files.append(cur_pngfile)
-                i += i_step
-
-                # Wait for the roundtrip to the frontend to complete.
-                while viewer.figure._upload_png_callback is not None:
-                    time.sleep(0.05)
-
-            if not self.movie_interrupt:
-                # Grab frame size.
-                frame_shape = cv2.imread(temp_png_files[0]).shape
-                frame_size = (frame_shape[1], frame_shape[0])
-
-                video = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), fps, frame_size, True)  # noqa: E501
-                for cur_pngfile in temp_png_files:
-                    video.write(cv2.imread(cur_pngfile))
+                if video is None:
+                    frame_size = (frame.shape[1], frame.shape[0])
+                    video = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), fps, frame_size, True)  # noqa: E501
+                video.write(frame)
         finally:
-            cv2.destroyAllWindows()
+            frames.close()
             if video:
                 video.release()
-            slice_plg._on_slider_updated({'new': orig_slice})
-
-        if rm_temp_files or self.movie_interrupt:
-            for cur_pngfile in temp_png_files:
-                if os.path.exists(cur_pngfile):
-                    os.remove(cur_pngfile)
 
         if self.movie_interrupt:
             if os.path.exists(filename):
@@ -205,11 +262,10 @@ class ExportViewer(PluginTemplateMixin, ViewerSelectMixin):
                    rm_temp_files=True):
         """Save selected slices as a movie.
 
-        This method creates a PNG file per frame (``._cubeviz_movie_frame_<n>.png``)
-        in the working directory before stitching all the frames into a movie.
-        Please make sure you have sufficient memory for this operation.
-        PNG files are deleted after the movie is created unless otherwise specified.
-        If another PNG file with the same name already exists, it will be silently replaced.
+        Frames are rendered in Python (in parallel, and without a browser) from the image
+        layers of the selected viewer, using its current limits and the stretch, colormap
+        and opacity of each layer.  Subsets and other overlays are not included.
+        The frames are written directly to the movie, without temporary files.
 
         Parameters
         ----------
@@ -233,7 +289,7 @@ class ExportViewer(PluginTemplateMixin, ViewerSelectMixin):
             of other format(s).
 
         rm_temp_files : bool
-            Remove temporary PNG files after movie creation. Default is `True`.
+            Unused, kept for backwards compatibility (no temporary files are written).
 
         Returns
         -------
@@ -272,7 +328,7 @@ class ExportViewer(PluginTemplateMixin, ViewerSelectMixin):
         viewer = self.viewer.selected_obj
         if not isinstance(viewer, BqplotImageView):  # Profile viewer in glue-jupyter cannot do this
             raise TypeError(f"Movie for {viewer.__class__.__name__} is not supported.")
-        if viewer.shape is None:
+        if viewer.shape is None and viewer.state.reference_data is None:
             raise ValueError("Selected viewer has no display shape.")
 
         if fps is None:
@@ -304,7 +360,7 @@ class ExportViewer(PluginTemplateMixin, ViewerSelectMixin):
 
         filename = str(filename.resolve())
         threading.Thread(
-            target=lambda: self._save_movie(i_start, i_end, fps, filename, rm_temp_files)
+            target=lambda: self._save_movie(i_start, i_end, fps, filename)
         ).start()
 
         return filename
@@ -1,7 +1,12 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from astropy import units as u
-from astropy.convolution import convolve, Gaussian2DKernel
+from astropy.convolution import Gaussian1DKernel
+from scipy.ndimage import correlate1d
+from scipy.signal import fftconvolve
 from specutils import Spectrum1D
 from specutils.manipulation import gaussian_smooth
 from traitlets import List, Unicode, Bool, observe
@@ -20,6 +25,68 @@ __all__ = ['GaussianSmooth']
 spaxel = u.def_unit('spaxel', 1 * u.Unit(""))
 u.add_enabled_units([spaxel])
 
+# number of values per chunk of spectral slices that are smoothed at once
+_SMOOTH_CHUNK_SIZE = 2**22
+
+
+def _spatial_gaussian_smooth(values, stddev, mask=None, max_workers=None):
+    """
+    Smooth the first two (spatial) axes of a cube with a 2D Gaussian kernel.
+
+    This gives the same result as ``astropy.convolution.convolve`` with a
+    ``Gaussian2DKernel`` (with the default ``boundary='fill'``, ``fill_value=0``, and
+    ``nan_treatment='interpolate'``), but uses the separability of the kernel: the
+    cube is smoothed by 1D passes along each spatial axis, or with FFTs for kernels
+    that are large compared to the image.  NaN (and masked) values are interpolated
+    by normalizing by the smoothed map of valid values.  Chunks of spectral slices
+    are smoothed in parallel threads and written into a single output array.
+    """
+    values = np.asarray(values)
+    nx, ny, nz = values.shape
+    kernel = Gaussian1DKernel(stddev).array
+    kernel = kernel / kernel.sum()
+
+    if len(kernel) > 2 * np.log2(nx * ny):
+        kernel_2d = np.outer(kernel, kernel)[np.newaxis]
+
+        def smooth(chunk):
+            return fftconvolve(chunk, kernel_2d, mode='same', axes=(1, 2))
+    else:
+        def smooth(chunk):
+            chunk = correlate1d(chunk, kernel, axis=1, mode='constant', output=float)
+            return correlate1d(chunk, kernel, axis=2, mode='constant', output=chunk)
+
+    out = np.empty(values.shape, dtype=values.dtype if values.dtype.kind == 'f' else float)
+
+    def smooth_slices(start, stop):
+        # spectral axis first, so that each slice is contiguous
+        chunk = np.array(np.moveaxis(values[..., start:stop], -1, 0), dtype=float)
+        invalid = np.isnan(chunk)
+        if mask is not None:
+            invalid |= np.moveaxis(np.asarray(mask[..., start:stop], dtype=bool), -1, 0)
+        if invalid.any():
+            chunk[invalid] = 0
+            result = smooth(chunk)
+            # values outside of the image count as valid (with a value of zero)
+            weights = 1 - smooth(invalid.astype(float))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                result /= weights
+            result[weights < 1e-8] = np.nan
+        else:
+            result = smooth(chunk)
+        out[..., start:stop] = np.moveaxis(result, 0, -1)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    chunk_size = max(1, min(_SMOOTH_CHUNK_SIZE // (nx * ny), int(np.ceil(nz / max_workers))))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(smooth_slices, start, min(start + chunk_size, nz))
+                   for start in range(0, nz, chunk_size)]
+        for future in futures:
+            future.result()
+
+    return out
+
 
 @tray_registry('g-gaussian-smooth', label="Gaussian Smooth",
                viewer_requirements=['spectrum', 'flux'])
@@ -205,8 +272,8 @@ class GaussianSmooth(PluginTemplateMixin, DatasetSelectMixin, AddResultsMixin):
     @with_spinner('spinner')
     def spatial_smooth(self):
         """
-        Use astropy convolution machinery to smooth the spatial dimensions of
-        the data cube.  To add the resulting cube into
+        Smooth the spatial dimensions of the data cube with a 2D Gaussian kernel,
+        interpolating over NaN and masked values.  To add the resulting cube into
         the app, set label options and use :meth:`smooth` instead.
 
         Returns
@@ -217,11 +284,7 @@ class GaussianSmooth(PluginTemplateMixin, DatasetSelectMixin, AddResultsMixin):
         cube = self.dataset.selected_obj
         flux_unit = cube.flux.unit
 
-        # Extend the 2D kernel to have a length 1 spectral dimension, so that
-        # we can do "3d" convolution to the whole cube
-        kernel = np.expand_dims(Gaussian2DKernel(self.stddev), 2)
-
-        convolved_data = convolve(cube, kernel)
+        convolved_data = _spatial_gaussian_smooth(cube.flux.value, self.stddev, mask=cube.mask)
 
         # Copy 3D WCS from input cube.
         data = self.dataset.selected_dc_item
@@ -231,8 +294,8 @@ class GaussianSmooth(PluginTemplateMixin, DatasetSelectMixin, AddResultsMixin):
         else:
             w = data.coords
 
-        # Create a new cube with the old metadata. Note that astropy
-        # convolution generates values for masked (NaN) data.
+        # Create a new cube with the old metadata. Note that the smoothing
+        # generates values for masked (NaN) data.
         newcube = Spectrum1D(flux=convolved_data * flux_unit, wcs=w)
 
         return newcube
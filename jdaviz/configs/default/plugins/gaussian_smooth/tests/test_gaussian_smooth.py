@@ -1,8 +1,11 @@
 import numpy as np
 import pytest
-from astropy.utils.exceptions import AstropyUserWarning
+from astropy.convolution import convolve, Gaussian2DKernel
 from specutils import Spectrum1D
 
+from jdaviz.configs.default.plugins.gaussian_smooth.gaussian_smooth import (
+    _spatial_gaussian_smooth)
+
 
 def test_linking_after_spectral_smooth(cubeviz_helper, spectrum1d_cube):
     app = cubeviz_helper.app
@@ -107,10 +110,7 @@ def test_spatial_convolution(cubeviz_helper, spectrum1d_cube):
     gs.mode_selected = 'Spatial'
     gs.stddev = 3
     assert gs.results_label == f'{data_label}[FLUX] spatial-smooth stddev-3.0'
-    with pytest.warns(
-            AstropyUserWarning,
-            match='The following attributes were set on the data object, but will be ignored'):
-        gs.vue_apply()
+    gs.vue_apply()
 
     assert len(dc) == 2
     assert dc[1].label == f'{data_label}[FLUX] spatial-smooth stddev-3.0'
@@ -120,6 +120,28 @@ def test_spatial_convolution(cubeviz_helper, spectrum1d_cube):
             == (2, 4, 2))
 
 
+@pytest.mark.parametrize('stddev', (1, 8))
+def test_spatial_gaussian_smooth(stddev):
+    # compare against astropy convolution with a 2D kernel, for both the separable
+    # (small kernel) and FFT (large kernel) code paths, including NaN and masked values
+    rng = np.random.default_rng(42)
+    values = rng.random((20, 15, 7))
+    values[3, 4, :] = np.nan
+    values[:6, :6, 2] = np.nan
+    mask = np.zeros(values.shape, dtype=bool)
+    mask[10, 10, 1] = True
+
+    result = _spatial_gaussian_smooth(values, stddev, mask=mask, max_workers=3)
+
+    expected_values = values.copy()
+    expected_values[mask] = np.nan
+    kernel = np.expand_dims(Gaussian2DKernel(stddev), 2)
+    expected = convolve(expected_values, kernel)
+
+    assert result.shape == values.shape
+    np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-12)
+
+
 def test_specviz_smooth(specviz_helper, spectrum1d):
     data_label = 'test'
     dc = specviz_helper.app.data_collection
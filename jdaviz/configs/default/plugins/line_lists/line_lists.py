@@ -9,6 +9,7 @@ from glue.core.message import (SubsetCreateMessage,
                                SubsetDeleteMessage,
                                SubsetUpdateMessage)
 from glue_jupyter.common.toolbar_vuetify import read_icon
+from glue_jupyter.utils import debounced
 from traitlets import Any, Bool, Float, Int, List, Unicode, Dict, observe
 
 from jdaviz.core.custom_traitlets import FloatHandleEmpty
@@ -20,7 +21,7 @@ from jdaviz.core.events import (AddDataMessage,
                                 RedshiftMessage,
                                 SpectralMarksChangedMessage)
 from jdaviz.core.linelists import load_preset_linelist, get_linelist_metadata
-from jdaviz.core.marks import SpectralLine
+from jdaviz.core.marks import SpectralLineCollection
 from jdaviz.core.registries import tray_registry
 from jdaviz.core.template_mixin import PluginTemplateMixin
 from jdaviz.core.tools import ICON_DIR
@@ -53,6 +54,9 @@ class LineListTool(PluginTemplateMixin):
     available_lists = List([]).tag(sync=True)
     loaded_lists = List([]).tag(sync=True)
     list_contents = Dict({}).tag(sync=True)
+    # observed wavelengths of the lines currently visible in the plugin, by list name
+    # and line index, so that redshift changes do not need to re-send list_contents
+    visible_obs = Dict({}).tag(sync=True)
     custom_name = Unicode().tag(sync=True)
     custom_rest = Unicode().tag(sync=True)
     custom_unit_choices = List([]).tag(sync=True)
@@ -80,6 +84,10 @@ class LineListTool(PluginTemplateMixin):
                                          "color": "#FF0000FF",
                                          "medium": "Unknown (Custom)"}}
         self.line_mark_dict = {}
+        # rest values and line names per list as arrays (see _line_list_arrays) and
+        # the observed wavelengths per list computed from those
+        self._list_arrays = {}
+        self._list_obs = {}
         self._units = {}
         self._bounds = {}
         self._global_redshift = 0
@@ -178,9 +186,12 @@ class LineListTool(PluginTemplateMixin):
         if msg.data.label not in viewer_data_labels:
             return
 
-        label = msg.data.label
+        get_data_kwargs = {'data_label': msg.data.label}
+        if self.config == 'cubeviz':
+            # the collapsed spectrum, rather than the (possibly lazily loaded) whole cube
+            get_data_kwargs['function'] = getattr(viewer.state, 'function', None)
         try:
-            viewer_data = self.app._jdaviz_helper.get_data(data_label=label)
+            viewer_data = self.app._jdaviz_helper.get_data(**get_data_kwargs)
         except TypeError:
             warn_message = SnackbarMessage("Line list plugin could not retrieve data from viewer",
                                            sender=self, color="error")
@@ -282,8 +293,9 @@ class LineListTool(PluginTemplateMixin):
 
         for mark in self.app.get_viewer(self._default_spectrum_viewer_reference_name).figure.marks:
             # update ALL to this redshift, if adding support for per-line redshift
-            # this logic will need to change to not affect ALL lines
-            if not isinstance(mark, SpectralLine):
+            # this logic will need to change to not affect ALL lines.  Each mark
+            # is a collection of lines, which updates all its lines at once.
+            if not isinstance(mark, SpectralLineCollection):
                 continue
 
             mark.redshift = z
@@ -324,33 +336,77 @@ class LineListTool(PluginTemplateMixin):
         self._rs_disable_observe = True
         self.rs_rv = self._redshift_to_velocity(value)
         self._rs_disable_observe = False
+        # the plotted lines and the observed wavelengths in the tables are each updated
+        # for all lines at once, so they can follow every event from the slider
         self._update_line_positions()
+        self._update_line_list_obs()
 
         if not self._rs_pause_tables:
-            # TODO: try to avoid essentially repeating the loop from above, careful to minimize
-            # updates to vue, maybe pause traitlets?
-            self._update_line_list_obs()
-
             # Send the redshift back to the Specviz helper (and also trigger
             # self._update_global_redshift)
             msg = RedshiftMessage("redshift", value, sender=self)
             self.app.hub.broadcast(msg)
 
-    def _update_line_list_obs(self, *args):
-        for list_name, line_list in self.list_contents.items():
-            for i, line in enumerate(line_list['lines']):
-                if self._rs_line_obs_change[0] == list_name and self._rs_line_obs_change[1] == i:  # noqa
-                    # this trigger is coming from a manual change to the observed
-                    # wavelength and would result in a small change to the value before the
-                    # user can finish typing.  So we'll just keep the old value until the
-                    # widget is blurred (loses focus)
-                    line_list['lines'][i]['obs'] = self._rs_line_obs_change[2]
-                else:
-                    line_list['lines'][i]['obs'] = self._rest_to_obs(float(line['rest']))
-
-            self.list_contents[list_name] = line_list
+    def _line_list_arrays(self, list_name):
+        """
+        Rest values and (lower-case) line names of a line list as arrays.  These are
+        cached until lines are added to the list, since the rest values never change.
+        """
+        lines = self.list_contents[list_name]['lines']
+        arrays = self._list_arrays.get(list_name)
+        if arrays is None or len(arrays['rest']) != len(lines):
+            arrays = {'rest': np.array([float(line['rest']) for line in lines], dtype=float),
+                      'linename': np.array([line['linename'].lower() for line in lines],
+                                           dtype=str)}
+            self._list_arrays[list_name] = arrays
+        return arrays
 
-        self.send_state('list_contents')
+    def _update_line_list_obs(self, *args):
+        redshift = float(self.rs_redshift)
+        for list_name in self.list_contents:
+            obs = self._rest_to_obs(self._line_list_arrays(list_name)['rest'], redshift)
+            if self._rs_line_obs_change[0] == list_name:
+                # this trigger is coming from a manual change to the observed
+                # wavelength and would result in a small change to the value before the
+                # user can finish typing.  So we'll just keep the old value until the
+                # widget is blurred (loses focus)
+                obs[self._rs_line_obs_change[1]] = self._rs_line_obs_change[2]
+            self._list_obs[list_name] = obs
+
+        self._sync_line_list_obs()
+
+    def _visible_lines_mask(self, list_name, obs):
+        # matches lineItemVisible in line_lists.vue
+        mask = np.ones(len(obs), dtype=bool)
+        if self.lines_filter:
+            linenames = self._line_list_arrays(list_name)['linename']
+            mask &= np.char.find(linenames, self.lines_filter.lower()) != -1
+        if self.filter_range:
+            mask &= (obs > self.spectrum_viewer_min) & (obs < self.spectrum_viewer_max)
+        return mask
+
+    @observe('lines_filter', 'filter_range', 'spectrum_viewer_min', 'spectrum_viewer_max')
+    def _on_visible_lines_changed(self, event=None):
+        self._sync_line_list_obs()
+
+    @debounced(delay_seconds=0.1, method=True)
+    def _sync_line_list_obs(self):
+        """
+        Store the latest observed wavelengths in list_contents and send those of the
+        visible lines to the frontend.
+        """
+        visible_obs = {}
+        for list_name, obs in self._list_obs.items():
+            lines = self.list_contents.get(list_name, {}).get('lines', [])
+            if len(lines) != len(obs):
+                # lines were added since, and will be included in the next update
+                continue
+            for line, line_obs in zip(lines, obs.tolist()):
+                line['obs'] = line_obs
+            visible = np.flatnonzero(self._visible_lines_mask(list_name, obs))
+            visible_obs[list_name] = dict(zip(visible.astype(str).tolist(),
+                                              obs[visible].tolist()))
+        self.visible_obs = visible_obs
 
     def vue_change_line_obs(self, kwargs):
         # NOTE: we can only pass one argument from vue (it seems), so we'll pass as
@@ -403,8 +459,9 @@ class LineListTool(PluginTemplateMixin):
         # to update the value in the MOS table and observed wavelengths
         self._rs_pause_tables = True
         self.rs_redshift = redshift
-        # but we do want to update the plotted lines
+        # but we do want to update the plotted lines and observed wavelengths
         self._update_line_positions()
+        self._update_line_list_obs()
 
         self._rs_disable_observe = False
 
@@ -526,6 +583,7 @@ class LineListTool(PluginTemplateMixin):
 
         self._viewer.plot_spectral_lines(tmp_names_rest)
         self.update_line_mark_dict()
+        self._update_line_list_obs()
 
         msg_text = ("Spectral lines loaded from notebook. Lines can be hidden"
                     "/shown in the Line Lists plugin")
@@ -536,8 +594,8 @@ class LineListTool(PluginTemplateMixin):
     def update_line_mark_dict(self):
         self.line_mark_dict = {}
         for m in self._viewer.figure.marks:
-            if isinstance(m, SpectralLine):
-                self.line_mark_dict[m.table_index] = m
+            if isinstance(m, SpectralLineCollection):
+                self.line_mark_dict.update(dict.fromkeys(m.names_rest, m))
 
         n_lines_shown = len(self.line_mark_dict)
 
@@ -610,6 +668,7 @@ class LineListTool(PluginTemplateMixin):
 
         self._viewer.plot_spectral_lines()
         self.update_line_mark_dict()
+        self._update_line_list_obs()
 
         msg_text = ("Spectral lines loaded from preset. Lines can be shown/hidden"
                     f" in the {self.list_to_load} dropdown in the Line Lists plugin")
@@ -647,6 +706,7 @@ class LineListTool(PluginTemplateMixin):
 
             self._viewer.plot_spectral_line(temp_dict["name_rest"])
             self.update_line_mark_dict()
+            self._update_line_list_obs()
 
         lines_loaded_message = SnackbarMessage("Custom spectral line loaded",
                                                sender=self, color="success")
@@ -803,15 +863,17 @@ class LineListTool(PluginTemplateMixin):
 
             for line in self.list_contents[listname]["lines"]:
                 line["colors"] = color
-                # Update the astropy table entry
-                name_rest = line["name_rest"]
-                self._viewer.spectral_lines.loc[name_rest]["colors"] = color
-                # Update the color on the plot
-                if name_rest in self.line_mark_dict:
-                    self.line_mark_dict[name_rest].colors = [color]
+
+            # Update the astropy table entries
+            spectral_lines = self._viewer.spectral_lines
+            spectral_lines["colors"][spectral_lines["listname"] == listname] = color
 
             self.send_state('list_contents')
 
+            # Update the colors on the plot, where lines are grouped into marks by color
+            self._viewer.plot_spectral_lines()
+            self.update_line_mark_dict()
+
         elif "linename" in data:
             pass
 
@@ -830,6 +892,9 @@ class LineListTool(PluginTemplateMixin):
 
         self.loaded_lists = [x for x in self.loaded_lists if x != listname]
         self.list_contents = {k: v for k, v in self.list_contents.items() if k != listname}
+        self._list_arrays.pop(listname, None)
+        self._list_obs.pop(listname, None)
+        self._sync_line_list_obs()
         row_inds = [i for i, ln in
                     enumerate(self._viewer.spectral_lines['listname'])
                     if ln != listname]
@@ -852,7 +917,7 @@ class LineListTool(PluginTemplateMixin):
         if erase:
             try:
                 self._viewer.erase_spectral_lines(name_rest=name_rest)
-                del self.line_mark_dict[name_rest]
+                self.line_mark_dict.pop(name_rest, None)
             except KeyError:
                 raise KeyError("line marks: {}".format(self._viewer.figure.marks))
         else:
@@ -141,3 +141,82 @@ def test_line_identify(specviz_helper, spectrum1d):
     ll_plugin.vue_change_visible(('Test List', line, 0))
     assert line.get('show') is False
     assert line.get('identify', False) is False
+
+
+def test_line_marks_collection(specviz_helper, spectrum1d):
+    specviz_helper.load_data(spectrum1d, data_label="Test 1D Spectrum")
+    sv = specviz_helper.app.get_viewer('spectrum-viewer')
+
+    n_lines = 1000
+    lt = QTable()
+    lt['linename'] = [f'line {i}' for i in range(n_lines)]
+    lt['rest'] = np.linspace(6000, 8000, n_lines)*u.AA
+    lt['listname'] = 'Test List'
+    lt['colors'] = ['#FF0000FF', '#0000FFFF'] * (n_lines // 2)
+    specviz_helper.load_line_list(lt)
+
+    # all shown lines are drawn as a single mark per color
+    line_marks = sv._spectral_line_marks
+    assert len(line_marks) == 2
+    assert sum(len(m.names_rest) for m in line_marks) == n_lines
+    mark = line_marks[0]
+    assert len(mark.x) == len(mark.y) == 3 * len(mark.names_rest)
+    assert np.all(np.isnan(mark.y[2::3]))
+    assert_allclose(mark.x[0::3], mark.rest_values)
+
+    ll_plugin = specviz_helper.plugins['Line Lists']._obj
+    assert len(ll_plugin.line_mark_dict) == n_lines
+    ll_plugin.rs_redshift = 0.1
+    assert_allclose(mark.obs_values, mark.rest_values * 1.1)
+    assert_allclose(mark.x[1::3], mark.obs_values)
+
+    # identify by index within the collection
+    name_rest = mark.names_rest[3]
+    line = ll_plugin.list_contents['Test List']['lines'][6]
+    assert line['name_rest'] == name_rest
+    ll_plugin.vue_set_identify(('Test List', line, 6))
+    assert mark.identified == 3
+    assert line_marks[1].identified is None
+    assert mark.identify_mark.visible
+    assert_allclose(mark.identify_mark.x, mark.obs_values[3])
+
+    # hiding another line keeps the identified line
+    sv.erase_spectral_lines(name_rest=mark.names_rest[0])
+    assert specviz_helper.spectral_lines.loc[name_rest]['show']
+    line_marks = sv._spectral_line_marks
+    assert sum(len(m.names_rest) for m in line_marks) == n_lines - 1
+    mark = [m for m in line_marks if name_rest in m.names_rest][0]
+    assert mark.identified == 2
+    assert_allclose(mark.obs_values, mark.rest_values * 1.1)
+
+    specviz_helper.erase_spectral_lines()
+    assert len(sv._spectral_line_marks) == 0
+    assert not ll_plugin.identify_label
+
+
+def test_visible_obs(specviz_helper, spectrum1d):
+    specviz_helper.load_data(spectrum1d, data_label="Test 1D Spectrum")
+    ll_plugin = specviz_helper.plugins['Line Lists']._obj
+
+    lt = QTable()
+    lt['linename'] = ['O III', 'Halpha', 'Hbeta']
+    lt['rest'] = [5007, 6563, 4861]*u.AA
+    lt['listname'] = 'Test List'
+    specviz_helper.load_line_list(lt)
+    assert_allclose(ll_plugin._line_list_arrays('Test List')['rest'], [5007, 6563, 4861])
+
+    ll_plugin.rs_redshift = 0.5
+    lines = ll_plugin.list_contents['Test List']['lines']
+    assert_allclose([line['obs'] for line in lines], [7510.5, 9844.5, 7291.5])
+    assert_allclose(list(ll_plugin.visible_obs['Test List'].values()), [7510.5, 9844.5, 7291.5])
+
+    # only the lines that pass the filters in the plugin are sent to the frontend
+    ll_plugin.lines_filter = 'h'
+    assert list(ll_plugin.visible_obs['Test List'].keys()) == ['1', '2']
+    ll_plugin.spectrum_viewer_min, ll_plugin.spectrum_viewer_max = 7000, 8000
+    ll_plugin.filter_range = True
+    assert ll_plugin.visible_obs['Test List'] == {'2': 7291.5}
+
+    ll_plugin.rs_redshift = 0.
+    assert ll_plugin.visible_obs['Test List'] == {}
+    assert_allclose([line['obs'] for line in lines], [5007, 6563, 4861])
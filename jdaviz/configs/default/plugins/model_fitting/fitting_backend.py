@@ -1,20 +1,24 @@
 from asteval import Interpreter
 
+import math
 import multiprocessing as mp
-from multiprocessing import Pool
+import weakref
+from multiprocessing import Pool, shared_memory
 
 import numpy as np
 
 import astropy.units as u
+from astropy.modeling import CompoundModel, models
 
 from specutils import Spectrum1D
 from specutils.fitting import fit_lines
 
-__all__ = ['fit_model_to_spectrum']
+__all__ = ['fit_model_to_spectrum', 'SpaxelPool']
 
 
 def fit_model_to_spectrum(spectrum, component_list, expression,
-                          run_fitter=False, window=None, n_cpu=None):
+                          run_fitter=False, window=None, n_cpu=None,
+                          pool=None, progress_callback=None):
     """Fits a `~astropy.modeling.CompoundModel` to a
     `~specutils.Spectrum1D` instance.
 
@@ -53,6 +57,16 @@ def fit_model_to_spectrum(spectrum, component_list, expression,
         If `None`, it will use max cores minus one.
         Set this to 1 for debugging.
 
+    pool : `None` or `SpaxelPool`
+        **This is only used for spectral cube fitting.**
+        Persistent process pool to fit spaxels with. If `None`, a
+        temporary pool is started for this fit and closed afterwards.
+
+    progress_callback : `None` or callable
+        **This is only used for spectral cube fitting.**
+        Called with the fraction (between 0 and 1) of spaxels fitted
+        so far, as results come in.
+
     Returns
     -------
     output_model : `~astropy.modeling.CompoundModel` or list
@@ -70,7 +84,8 @@ def fit_model_to_spectrum(spectrum, component_list, expression,
     initial_model = _build_model(component_list, expression)
 
     if len(spectrum.shape) > 1:
-        return _fit_3D(initial_model, spectrum, window=window, n_cpu=n_cpu)
+        return _fit_3D(initial_model, spectrum, window=window, n_cpu=n_cpu,
+                       pool=pool, progress_callback=progress_callback)
     else:
         return _fit_1D(initial_model, spectrum, run_fitter, window=window)
 
@@ -120,12 +135,17 @@ def _fit_1D(initial_model, spectrum, run_fitter, filter_non_finite=True, window=
     return output_model, output_spectrum
 
 
-def _fit_3D(initial_model, spectrum, window=None, n_cpu=None):
+def _fit_3D(initial_model, spectrum, window=None, n_cpu=None, vectorized=True,
+            pool=None, progress_callback=None):
     """
     Fits an astropy CompoundModel to every spaxel in a cube
     using a multiprocessor pool running in parallel. Computes
     realizations of the models over each spaxel.
 
+    If the model is supported by the vectorized engine (see
+    ``_can_fit_vectorized``), all spaxels are instead fitted at once
+    on stacked arrays, without building a ``Spectrum1D`` per spaxel.
+
     Parameters
     ----------
     initial_model : :class: `astropy.modeling.CompoundModel`
@@ -139,6 +159,16 @@ def _fit_3D(initial_model, spectrum, window=None, n_cpu=None):
         Using all the cores at once is not recommended.
         If `None`, it will use max cores minus one.
         Set this to 1 for debugging.
+    vectorized : bool
+        Use the vectorized engine when the model supports it. Set this
+        to `False` to always fit each spaxel separately with
+        :func:`specutils.fitting.fitmodels.fit_lines`.
+    pool : `None` or `SpaxelPool`
+        Persistent process pool to fit spaxels with. If `None`, a
+        temporary pool is started for this fit and closed afterwards.
+    progress_callback : `None` or callable
+        Called with the fraction (between 0 and 1) of spaxels fitted
+        so far, as results come in.
 
     Returns
     -------
@@ -149,12 +179,16 @@ def _fit_3D(initial_model, spectrum, window=None, n_cpu=None):
         The spectrum that stores the fitted model values in its 'flux'
         attribute.
     """
-    if n_cpu is None:
-        n_cpu = mp.cpu_count() - 1
-
     # Generate list of all spaxels to be fitted
     spaxels = _generate_spaxel_list(spectrum)
 
+    if vectorized and _can_fit_vectorized(initial_model, window=window):
+        return _fit_3D_vectorized(initial_model, spectrum, spaxels,
+                                  progress_callback=progress_callback)
+
+    if n_cpu is None:
+        n_cpu = mp.cpu_count() - 1
+
     fitted_models = []
 
     # Build cube with empty arrays, one per input spaxel. These
@@ -176,31 +210,48 @@ def _fit_3D(initial_model, spectrum, window=None, n_cpu=None):
             # Store fitted values
             output_flux_cube[x, y, :] = fitted_values
 
+        if progress_callback is not None and len(spaxels):
+            progress_callback(len(fitted_models) / len(spaxels))
+
     # Run multiprocessor pool to fit each spaxel and
     # compute model values on that same spaxel.
     if n_cpu > 1:
-        results = []
-        pool = Pool(n_cpu)
-
-        # The communication overhead of spawning a process for each *individual*
-        # parameter set is prohibitively high (it's actually faster to run things
-        # sequentially). Instead, chunk the spaxel list based on the number of
-        # available processors, and have each processor do the model fitting
-        # on the entire subset of spaxel tuples, then return the set of results.
-        for spx in np.array_split(spaxels, n_cpu):
-            # Worker for the multiprocess pool.
-            worker = SpaxelWorker(spectrum.flux,
-                                  spectrum.spectral_axis,
-                                  initial_model,
-                                  param_set=spx,
-                                  window=window,
-                                  mask=spectrum.mask)
-            r = pool.apply_async(worker, callback=collect_result)
-            results.append(r)
-        for r in results:
-            r.wait()
-
-        pool.close()
+        close_pool = pool is None
+        if close_pool:
+            pool = SpaxelPool()
+
+        # The cube is placed in shared memory once, and workers only
+        # receive its name along with the (small) list of spaxels to fit.
+        shared_flux = _SharedArray(spectrum.flux.value)
+        shared_mask = _SharedArray(spectrum.mask) if spectrum.mask is not None else None
+        try:
+            # Spawning a task for each *individual* spaxel has a prohibitively
+            # high communication overhead. Instead, the spaxel list is split
+            # into many small chunks that idle workers pick up as they
+            # finish, which balances the load when some spaxels are slower
+            # to fit than others.
+            tasks = [(shared_flux.spec,
+                      shared_mask.spec if shared_mask is not None else None,
+                      spectrum.flux.unit,
+                      spectrum.spectral_axis,
+                      initial_model,
+                      window,
+                      spx)
+                     for spx in _chunk_spaxel_list(spaxels, n_cpu)]
+            results = pool.imap_unordered(_fit_spaxel_chunk, tasks, n_cpu=n_cpu)
+            for _ in range(len(tasks)):
+                try:
+                    collect_result(next(results))
+                except Exception:  # nosec
+                    # As with a failed fit in a single spaxel, a chunk that
+                    # fails leaves its spaxels out of the results.
+                    continue
+        finally:
+            shared_flux.close()
+            if shared_mask is not None:
+                shared_mask.close()
+            if close_pool:
+                pool.close()
 
     # This route is only for dev debugging because it is very slow
     # but exceptions will not get swallowed up by multiprocessing.
@@ -222,6 +273,402 @@ def _fit_3D(initial_model, spectrum, window=None, n_cpu=None):
     return fitted_models, output_spectrum
 
 
+class SpaxelPool:
+    """
+    Persistent process pool for fitting the spaxels of a cube in parallel.
+
+    The worker processes are only started the first time the pool is
+    used, and are then kept around to be reused by subsequent fits
+    (they are restarted if a different number of processes is requested).
+    Call `close` to stop the workers.
+
+    Parameters
+    ----------
+    n_cpu : `None` or int
+        Default number of worker processes. If `None`, it will use
+        max cores minus one.
+    """
+    def __init__(self, n_cpu=None):
+        self.n_cpu = n_cpu
+        self._pool = None
+        self._pool_n_cpu = None
+        self._finalizer = None
+
+    def _get_pool(self, n_cpu=None):
+        if n_cpu is None:
+            n_cpu = self.n_cpu if self.n_cpu is not None else mp.cpu_count() - 1
+        if self._pool is None or n_cpu != self._pool_n_cpu:
+            self.close()
+            self._pool = Pool(n_cpu)
+            self._pool_n_cpu = n_cpu
+            # Make sure the workers do not outlive the pool object.
+            self._finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    @property
+    def is_running(self):
+        """Whether the worker processes have been started."""
+        return self._pool is not None
+
+    def imap_unordered(self, func, tasks, n_cpu=None):
+        """
+        Runs ``func`` on every item of ``tasks`` in the worker processes,
+        starting them if needed. Results are returned as an iterator, in
+        the order in which they complete.
+        """
+        return self._get_pool(n_cpu).imap_unordered(func, tasks)
+
+    def close(self):
+        """Stops the worker processes, if running."""
+        if self._finalizer is not None:
+            self._finalizer()
+        self._pool = None
+        self._pool_n_cpu = None
+        self._finalizer = None
+
+
+class _SharedArray:
+    """
+    Copy of a numpy array in shared memory, that worker processes can
+    attach to by name (see ``_attach_shared_array``) without the array
+    being pickled. ``spec`` holds everything needed to attach to it.
+    """
+    def __init__(self, array):
+        array = np.asarray(array)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf)[...] = array
+        self.spec = (self._shm.name, array.shape, array.dtype.str)
+
+    def close(self):
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _attach_shared_array(spec):
+    """
+    Attaches to an array created by ``_SharedArray`` from its ``spec``.
+    Returns the shared memory block, which must be closed once the
+    (zero-copy) array view is no longer in use, and the view itself.
+    """
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _chunk_spaxel_list(spaxels, n_cpu, chunks_per_cpu=8, max_chunk_size=64):
+    """
+    Splits the list of spaxels into small chunks, so that there are
+    several chunks per worker to balance the load dynamically.
+    """
+    chunk_size = math.ceil(len(spaxels) / (n_cpu * chunks_per_cpu))
+    chunk_size = min(max(chunk_size, 1), max_chunk_size)
+    return [spaxels[i:i + chunk_size] for i in range(0, len(spaxels), chunk_size)]
+
+
+def _fit_spaxel_chunk(task):
+    """
+    Fits a chunk of spaxels in a worker process of a `SpaxelPool`,
+    reading the flux and mask cubes from shared memory.
+    """
+    flux_spec, mask_spec, flux_unit, wave, model, window, spaxels = task
+
+    flux_shm, flux = _attach_shared_array(flux_spec)
+    mask_shm, mask = (None, None) if mask_spec is None else _attach_shared_array(mask_spec)
+    try:
+        return SpaxelWorker(u.Quantity(flux, flux_unit, copy=False),
+                            wave,
+                            model,
+                            param_set=spaxels,
+                            window=window,
+                            mask=mask)()
+    finally:
+        # Views into the shared memory must be released before closing it.
+        del flux, mask
+        flux_shm.close()
+        if mask_shm is not None:
+            mask_shm.close()
+
+
+# Model classes whose ``evaluate`` broadcasts over stacked parameter
+# arrays, so that a single call realizes the model for many spaxels.
+_VECTORIZABLE_MODELS = (models.Const1D, models.Linear1D, models.Polynomial1D,
+                        models.Gaussian1D, models.Lorentz1D, models.Voigt1D,
+                        models.PowerLaw1D)
+_VECTORIZABLE_OPERATORS = ('+', '-', '*', '/')
+
+# Upper limit on the number of elements in the stacked Jacobian
+# (spaxels x spectral samples x free parameters) held in memory at once.
+_MAX_CHUNK_ELEMENTS = 2 ** 24
+
+
+def _model_nodes(model):
+    """
+    Returns the submodels and operators of ``model`` in postfix order,
+    or ``[model]`` if it is not a compound model.
+    """
+    if isinstance(model, CompoundModel):
+        return model.traverse_postorder(include_operator=True)
+    return [model]
+
+
+def _can_fit_vectorized(model, window=None):
+    """
+    Whether the vectorized engine can fit ``model`` to a cube.
+
+    Only compound models built out of ``_VECTORIZABLE_MODELS`` with
+    arithmetic operators and without tied parameters or a fitting window
+    are supported. Anything else is fitted spaxel by spaxel.
+    """
+    if window is not None or not model._supports_unit_fitting:
+        return False
+    if any(model.tied.values()):
+        return False
+    for node in _model_nodes(model):
+        if isinstance(node, str):
+            if node not in _VECTORIZABLE_OPERATORS:
+                return False
+        elif not isinstance(node, _VECTORIZABLE_MODELS):
+            return False
+    return True
+
+
+def _is_linear_model(model):
+    """
+    Whether ``model`` is linear in its parameters, i.e., a sum or
+    difference of models that are each linear in their parameters.
+    """
+    for node in _model_nodes(model):
+        if isinstance(node, str):
+            if node not in ('+', '-'):
+                return False
+        elif not node.linear:
+            return False
+    return True
+
+
+def _fit_3D_vectorized(initial_model, spectrum, spaxels, progress_callback=None):
+    """
+    Fits an astropy CompoundModel to a list of spaxels in a cube
+    at once, operating on stacked arrays of shape (spaxel, wavelength).
+
+    Models that are linear in their parameters are solved in closed
+    form with a linear least-squares solve per distinct mask pattern.
+    All other models are fitted with a Levenberg-Marquardt iteration
+    in which the Jacobian of every spaxel is computed and solved for
+    in a single batched operation.
+
+    Parameters
+    ----------
+    initial_model : :class: `astropy.modeling.CompoundModel`
+        Initial guess for the model to be fitted.
+    spectrum : :class:`specutils.Spectrum1D`
+        The spectrum that stores the cube in its 'flux' attribute.
+    spaxels : list
+        List with (x, y) spaxel coordinates to be fitted, as returned by
+        ``_generate_spaxel_list``.
+    progress_callback : `None` or callable
+        Called with the fraction (between 0 and 1) of spaxels fitted
+        so far.
+
+    Returns
+    -------
+    output_model : :list: a list of dictionaries with the ``x`` and ``y``
+        coordinates and fitted ``model`` for each spaxel, in the same
+        format as ``_fit_3D``.
+    output_spectrum : :class:`specutils.Spectrum1D`
+        The spectrum that stores the fitted model values in its 'flux'
+        attribute.
+    """
+    wave = spectrum.spectral_axis
+    funit = spectrum.flux.unit
+    output_flux_cube = np.zeros(shape=spectrum.flux.shape)
+
+    # Strip units from the model the same way the astropy fitters do,
+    # so that parameter values are expressed in the units of the data.
+    if initial_model.input_units is not None:
+        wave = wave.to(initial_model.input_units[initial_model.inputs[0]],
+                       equivalencies=initial_model.input_units_equivalencies)
+    rename_data = {initial_model.inputs[0]: wave,
+                   initial_model.outputs[0]: spectrum.flux[0, 0, :],
+                   'z': None}
+    unitless_model = initial_model.without_units_for_data(**rename_data)
+    if isinstance(unitless_model, tuple):
+        rename_data['_left_kwargs'] = unitless_model[1]
+        rename_data['_right_kwargs'] = unitless_model[2]
+        unitless_model = unitless_model[0]
+    template_model = unitless_model.with_units_from_data(**rename_data)
+
+    if len(spaxels) == 0:
+        return [], Spectrum1D(wcs=spectrum.wcs, flux=output_flux_cube * funit,
+                              mask=spectrum.mask)
+
+    xs, ys = np.asarray(spaxels).T
+    x = wave.value
+    y = spectrum.flux.value[xs, ys, :]
+    valid = np.isfinite(y)
+    if spectrum.mask is not None:
+        valid &= ~spectrum.mask[xs, ys, :]
+
+    param_names = unitless_model.param_names
+    free = np.array([not unitless_model.fixed[name] for name in param_names])
+    bounds = [unitless_model.bounds[name] for name in param_names]
+    lower = np.array([-np.inf if lo is None else lo for lo, _ in bounds])
+    upper = np.array([np.inf if hi is None else hi for _, hi in bounds])
+
+    def evaluate(params):
+        return unitless_model.evaluate(x[np.newaxis, :],
+                                       *[p[:, np.newaxis] for p in params.T])
+
+    initial_params = np.broadcast_to(unitless_model.parameters,
+                                     (len(xs), len(param_names)))
+    if not np.any(free):
+        fitted_params = initial_params.copy()
+    elif _is_linear_model(unitless_model):
+        fitted_params = _fit_linear_least_squares(evaluate, initial_params, free, y, valid)
+    else:
+        fitted_params = np.empty_like(initial_params)
+        chunk_size = max(1, _MAX_CHUNK_ELEMENTS // (len(x) * (free.sum() + 1)))
+        for start in range(0, len(xs), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            fitted_params[chunk] = _fit_levenberg_marquardt(
+                evaluate, initial_params[chunk], free, lower, upper,
+                y[chunk], valid[chunk])
+            if progress_callback is not None:
+                progress_callback(min(start + chunk_size, len(xs)) / len(xs))
+
+    fitted_params = np.clip(fitted_params, lower, upper)
+    output_flux_cube[xs, ys, :] = evaluate(fitted_params)
+
+    fitted_models = []
+    for x_ind, y_ind, params in zip(xs, ys, fitted_params):
+        model = template_model.copy()
+        model.parameters = params
+        fitted_models.append({"x": x_ind, "y": y_ind, "model": model})
+
+    if progress_callback is not None:
+        progress_callback(1)
+
+    # Build output 3D spectrum
+    output_spectrum = Spectrum1D(wcs=spectrum.wcs,
+                                 flux=output_flux_cube * funit,
+                                 mask=spectrum.mask)
+
+    return fitted_models, output_spectrum
+
+
+def _fit_linear_least_squares(evaluate, initial_params, free, y, valid):
+    """
+    Closed-form least-squares solution for a model that is linear in its
+    free parameters, for every row of ``y`` at once.
+
+    The design matrix is built by realizing the model once per free
+    parameter. Spaxels that share the same pattern of valid samples are
+    solved together as the right-hand sides of a single solve.
+    """
+    n_free = free.sum()
+    # Realize the model with all free parameters set to zero (offset from
+    # fixed parameters) and then with each free parameter set to one.
+    basis_params = np.tile(initial_params[0], (n_free + 1, 1))
+    basis_params[:, free] = np.vstack([np.zeros(n_free), np.eye(n_free)])
+    basis = evaluate(basis_params)
+    offset = basis[0]
+    design = (basis[1:] - offset).T
+
+    # Scale the columns to improve the conditioning of the problem (e.g.
+    # high-order polynomials over a spectral axis in Hz).
+    scale = np.linalg.norm(design, axis=0)
+    scale[scale == 0] = 1
+    design = design / scale
+
+    fitted_params = initial_params.copy()
+    patterns, inverse = np.unique(valid, axis=0, return_inverse=True)
+    for pattern_ind, pattern in enumerate(patterns):
+        rows = np.flatnonzero(inverse.ravel() == pattern_ind)
+        if not np.any(pattern):
+            continue
+        rhs = (y[rows][:, pattern] - offset[pattern]).T
+        solution = np.linalg.lstsq(design[pattern], rhs, rcond=None)[0]
+        fitted_params[np.ix_(rows, np.flatnonzero(free))] = (solution / scale[:, np.newaxis]).T
+    return fitted_params
+
+
+def _fit_levenberg_marquardt(evaluate, initial_params, free, lower, upper, y, valid,
+                             maxiter=100, ftol=1.49012e-08, xtol=1.49012e-08):
+    """
+    Levenberg-Marquardt least-squares fit of a model to every row of ``y``
+    at once.
+
+    Every iteration computes a forward-difference Jacobian for all
+    still-active spaxels with one stacked model realization per free
+    parameter, and solves the damped normal equations of all spaxels in
+    a single batched call. Damping is adapted per spaxel, and spaxels are
+    dropped from the active set as they converge. Parameters are clipped
+    to their bounds after each step, as in the astropy fitters.
+    """
+    n_spaxels = len(y)
+    free_ind = np.flatnonzero(free)
+    params = initial_params.copy()
+    weights = valid.astype(float)
+    y = np.where(valid, y, 0)
+
+    model_values = evaluate(params)
+    resid = (y - model_values) * weights
+    cost = np.sum(resid ** 2, axis=1)
+    damping = np.full(n_spaxels, 1e-3)
+    active = np.isfinite(cost) & np.any(valid, axis=1)
+    eps = np.sqrt(np.finfo(float).eps)
+
+    for _ in range(maxiter):
+        ind = np.flatnonzero(active)
+        if len(ind) == 0:
+            break
+        p = params[ind]
+        w = weights[ind]
+
+        # One stacked model realization per free parameter covers the
+        # Jacobian of every active spaxel.
+        jac = np.empty((len(ind), y.shape[1], len(free_ind)))
+        for j, param_ind in enumerate(free_ind):
+            step = eps * np.where(p[:, param_ind] == 0, 1, np.abs(p[:, param_ind]))
+            stepped = p.copy()
+            stepped[:, param_ind] += step
+            jac[:, :, j] = (evaluate(stepped) - model_values[ind]) * w / step[:, np.newaxis]
+        jac_t = jac.transpose(0, 2, 1)
+        jtj = jac_t @ jac
+        jtr = (jac_t @ resid[ind][..., np.newaxis])[..., 0]
+        diag = np.einsum('sii->si', jtj)
+        damped = jtj + np.einsum('si,ij->sij',
+                                 damping[ind, np.newaxis] * np.maximum(diag, eps),
+                                 np.eye(len(free_ind)))
+        try:
+            delta = np.linalg.solve(damped, jtr[..., np.newaxis])[..., 0]
+        except np.linalg.LinAlgError:
+            delta = np.einsum('sij,sj->si', np.linalg.pinv(damped), jtr)
+
+        trial = p.copy()
+        trial[:, free_ind] += delta
+        trial = np.clip(trial, lower, upper)
+        trial_values = evaluate(trial)
+        trial_resid = (y[ind] - trial_values) * w
+        trial_cost = np.sum(trial_resid ** 2, axis=1)
+
+        improved = np.isfinite(trial_cost) & (trial_cost < cost[ind])
+        small_gain = improved & (cost[ind] - trial_cost <= ftol * cost[ind])
+        small_step = np.all(np.abs(delta) <= xtol * (np.abs(p[:, free_ind]) + xtol), axis=1)
+
+        accepted = ind[improved]
+        params[accepted] = trial[improved]
+        model_values[accepted] = trial_values[improved]
+        resid[accepted] = trial_resid[improved]
+        cost[accepted] = trial_cost[improved]
+        damping[accepted] /= 10
+        damping[ind[~improved]] *= 10
+
+        active[ind[small_gain | small_step | (damping[ind] > 1e16)]] = False
+
+    return params
+
+
 class SpaxelWorker:
     """
     A class with callable instances that perform fitting over a
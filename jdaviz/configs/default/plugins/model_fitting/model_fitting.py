@@ -5,7 +5,7 @@ from copy import deepcopy
 import astropy.units as u
 from specutils import Spectrum1D
 from specutils.utils import QuantityModel
-from traitlets import Bool, List, Unicode, observe
+from traitlets import Bool, Float, List, Unicode, observe
 
 from jdaviz.core.events import SnackbarMessage, GlobalDisplayUnitChanged
 from jdaviz.core.registries import tray_registry
@@ -22,7 +22,8 @@ from jdaviz.core.template_mixin import (PluginTemplateMixin,
                                         with_spinner)
 from jdaviz.core.custom_traitlets import IntHandleEmpty
 from jdaviz.core.user_api import PluginUserApi
-from jdaviz.configs.default.plugins.model_fitting.fitting_backend import fit_model_to_spectrum
+from jdaviz.configs.default.plugins.model_fitting.fitting_backend import (fit_model_to_spectrum,
+                                                                          SpaxelPool)
 from jdaviz.configs.default.plugins.model_fitting.initializers import (MODELS,
                                                                        initialize,
                                                                        get_model_parameters)
@@ -107,6 +108,7 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
     display_order = Bool(False).tag(sync=True)
 
     cube_fit = Bool(False).tag(sync=True)
+    cube_fit_progress = Float(0).tag(sync=True)  # percent of spaxels fitted so far
 
     # residuals (non-cube fit only)
     residuals_calculate = Bool(False).tag(sync=True)
@@ -924,13 +926,24 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
         for subset in [self.spatial_subset, self.spectral_subset]:
             spec = self._apply_subset_masks(spec, subset)
 
+        # The worker processes are started on the first cube fit and kept
+        # alive by the app for later fits.
+        if self.app._fitting_pool is None:
+            self.app._fitting_pool = SpaxelPool()
+
+        def _update_progress(fraction):
+            self.cube_fit_progress = 100 * fraction
+
+        self.cube_fit_progress = 0
         try:
             fitted_model, fitted_spectrum = fit_model_to_spectrum(
                 spec,
                 models_to_fit,
                 self.model_equation,
                 run_fitter=True,
-                window=None
+                window=None,
+                pool=self.app._fitting_pool,
+                progress_callback=_update_progress
             )
         except ValueError:
             snackbar_message = SnackbarMessage(
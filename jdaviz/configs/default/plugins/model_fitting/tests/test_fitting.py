@@ -384,3 +384,104 @@ def test_incompatible_units(specviz_helper, spectrum1d):
     with warnings.catch_warnings():
         warnings.filterwarnings('ignore', message='Model is linear in parameters.*')
         mf.calculate_fit(add_data=True)
+
+
+@pytest.mark.parametrize(('model_list', 'expression'), [
+    ([models.Linear1D(0.1*u.Jy/u.um, 1*u.Jy, name='L'),
+      models.Polynomial1D(2, name='P')], 'L'),
+    ([models.Gaussian1D(0.8*u.Jy, 4.8*u.um, 0.6*u.um, name='G'),
+      models.Linear1D(0*u.Jy/u.um, 0.2*u.Jy, name='L')], 'G+L')])
+def test_cube_fitting_vectorized(model_list, expression):
+    np.random.seed(42)
+
+    x = np.linspace(1, 10, SPECTRUM_SIZE)
+    flux_cube = np.empty((4, 3, SPECTRUM_SIZE))
+    for i in range(flux_cube.shape[0]):
+        for j in range(flux_cube.shape[1]):
+            g = models.Gaussian1D(1 + 0.1 * i, 5 + 0.05 * j, 0.5)
+            flux_cube[i, j] = g(x) + 0.3 + 0.02 * x + np.random.normal(0, 0.05, x.shape)
+
+    # Mask part of the spectral axis everywhere and some samples in a single spaxel.
+    mask = np.zeros_like(flux_cube).astype(bool)
+    mask[..., :SPECTRUM_SIZE // 10] = True
+    mask[2, 1, 50:60] = True
+    spectrum = Spectrum1D(flux=flux_cube*u.Jy, spectral_axis=x*u.um, mask=mask)
+
+    initial_model = fb._build_model(model_list, expression)
+    assert fb._can_fit_vectorized(initial_model)
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='Model is linear in parameters.*')
+        warnings.filterwarnings("ignore", message="The fit may be unsuccessful.*")
+        fitted_vec, spectrum_vec = fb._fit_3D(initial_model, spectrum, vectorized=True)
+        fitted_ref, spectrum_ref = fb._fit_3D(initial_model, spectrum, n_cpu=1,
+                                              vectorized=False)
+
+    assert len(fitted_vec) == len(fitted_ref) == 12
+    for m_vec, m_ref in zip(fitted_vec, fitted_ref):
+        assert (m_vec['x'], m_vec['y']) == (m_ref['x'], m_ref['y'])
+        assert m_vec['model'].param_names == m_ref['model'].param_names
+        for param_name in m_ref['model'].param_names:
+            param_vec = getattr(m_vec['model'], param_name)
+            param_ref = getattr(m_ref['model'], param_name)
+            assert param_vec.unit == param_ref.unit
+            assert_allclose(param_vec.value, param_ref.value, rtol=1e-4, atol=1e-6)
+
+    assert spectrum_vec.flux.unit == spectrum_ref.flux.unit
+    assert_allclose(spectrum_vec.flux.value, spectrum_ref.flux.value, atol=1e-5)
+    assert_array_equal(spectrum_vec.mask, mask)
+
+
+def test_cube_fitting_vectorized_unsupported():
+    # Tied parameters and fitting windows are only supported spaxel by spaxel.
+    g = models.Gaussian1D(1*u.Jy, 5*u.um, 0.5*u.um, name='G')
+    assert fb._can_fit_vectorized(g)
+    assert not fb._can_fit_vectorized(g, window=(4, 6)*u.um)
+    g.tied['stddev'] = lambda m: m.mean / 10
+    assert not fb._can_fit_vectorized(g)
+
+
+def test_cube_fitting_spaxel_pool():
+    np.random.seed(42)
+
+    x = np.linspace(1, 10, SPECTRUM_SIZE)
+    flux_cube = (models.Gaussian1D(1, 5, 0.5)(x) + 0.3
+                 + np.random.normal(0, 0.05, (5, 4, SPECTRUM_SIZE)))
+    mask = np.zeros_like(flux_cube).astype(bool)
+    mask[..., :SPECTRUM_SIZE // 10] = True
+    spectrum = Spectrum1D(flux=flux_cube*u.Jy, spectral_axis=x*u.um, mask=mask)
+
+    g = models.Gaussian1D(0.8*u.Jy, 4.8*u.um, 0.6*u.um, name='g')
+    c = models.Const1D(0.2*u.Jy, name='c')
+    initial_model = fb._build_model([g, c], 'g + c')
+
+    pool = fb.SpaxelPool()
+    assert not pool.is_running
+    progress = []
+    try:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="The fit may be unsuccessful.*")
+            fitted_pool, spectrum_pool = fb._fit_3D(initial_model, spectrum, n_cpu=2,
+                                                    vectorized=False, pool=pool,
+                                                    progress_callback=progress.append)
+            assert pool.is_running
+            # The same workers are reused by the next fit.
+            workers = pool._pool
+            fb._fit_3D(initial_model, spectrum, n_cpu=2, vectorized=False, pool=pool)
+            assert pool._pool is workers
+
+            fitted_ref, spectrum_ref = fb._fit_3D(initial_model, spectrum, n_cpu=1,
+                                                  vectorized=False)
+    finally:
+        pool.close()
+    assert not pool.is_running
+
+    # Chunks complete in any order, but every spaxel is fitted once.
+    assert len(progress) > 2
+    assert np.all(np.diff(progress) > 0)
+    assert progress[-1] == 1
+    params_pool = {(m['x'], m['y']): m['model'].parameters for m in fitted_pool}
+    assert len(params_pool) == len(fitted_ref) == 20
+    for m in fitted_ref:
+        assert_allclose(params_pool[(m['x'], m['y'])], m['model'].parameters)
+    assert_allclose(spectrum_pool.flux.value, spectrum_ref.flux.value)
@@ -10,6 +10,7 @@ from astropy.visualization import (
 from echo import delay_callback
 from traitlets import Any, Dict, Float, Bool, Int, List, Unicode, observe
 
+from glue.core.message import NumericalDataChangedMessage
 from glue.core.subset_group import GroupedSubset
 from glue.config import colormaps, stretches
 from glue.viewers.scatter.state import ScatterViewerState
@@ -35,6 +36,32 @@ from scipy.interpolate import PchipInterpolator
 
 __all__ = ['PlotOptions']
 
+# Maximum number of pixels used to build the stretch histogram (and its percentile
+# limits). Larger images are represented by a deterministic random subsample.
+STRETCH_HIST_MAX_SAMPLES = 1_000_000
+
+# Number of (data, attribute, zoom-window) histogram samples kept in memory.
+STRETCH_HIST_CACHE_SIZE = 16
+
+
+def _sample_finite_values(arr, max_samples=None, seed=0):
+    """
+    Return the finite values of ``arr`` as a 1D array. If ``arr`` has more than
+    ``max_samples`` (default: ``STRETCH_HIST_MAX_SAMPLES``) elements, only a random
+    subsample of that many elements is read (from their flat indices, without
+    copying the full array). The same seed always draws the same subsample for
+    the same shape.
+    """
+    if max_samples is None:
+        max_samples = STRETCH_HIST_MAX_SAMPLES
+    if arr.size > max_samples:
+        rng = np.random.default_rng(seed)
+        inds = np.sort(rng.choice(arr.size, size=max_samples, replace=False, shuffle=False))
+        values = np.asarray(arr[np.unravel_index(inds, arr.shape)])
+    else:
+        values = np.asarray(arr).ravel()
+    return values[np.isfinite(values)]
+
 
 class SplineStretch:
     """
@@ -647,6 +674,12 @@ class PlotOptions(PluginTemplateMixin):
         self.hub.subscribe(self, ChangeRefDataMessage,
                            handler=self._on_refdata_change)
 
+        # cache of sampled pixel values for the stretch histogram, keyed by
+        # (data uuid, attribute label, zoom window)
+        self._stretch_hist_samples = {}
+        self.hub.subscribe(self, NumericalDataChangedMessage,
+                           handler=self._clear_stretch_hist_samples)
+
         # give UI access to sampled version of the available colormap choices
         def hex_for_cmap(cmap):
             N = 50
@@ -936,7 +969,6 @@ class PlotOptions(PluginTemplateMixin):
 
         comp = data.get_component(layer.state.attribute)
 
-        # TODO: further optimization could be done by caching sub_data
         if self.stretch_hist_zoom_limits and (not self.layer_multiselect or len(self.layer_selected) == 1):  # noqa
             if hasattr(viewer, '_get_zoom_limits'):
                 # Viewer limits. This takes account of Imviz linking.
@@ -947,39 +979,50 @@ class PlotOptions(PluginTemplateMixin):
                 x_max = x_limits.max()
                 y_min = max(y_limits.min(), 0)
                 y_max = y_limits.max()
-
-                arr = comp.data[y_min:y_max, x_min:x_max]
-                sub_data = arr.ravel()
-
+                zoom_window = (x_min, x_max, y_min, y_max)
             else:
                 # spectrum-2d-viewer, for example.  We'll assume the viewer
                 # limits correspond to the fixed data components from glue
                 # and filter directly.
-                x_data = data.get_component(data.components[1]).data
-                y_data = data.get_component(data.components[0]).data
-
                 inverted_x = getattr(viewer, 'inverted_x_axis', False)
                 x_min = viewer.state.x_min if not inverted_x else viewer.state.x_max
                 x_max = viewer.state.x_max if not inverted_x else viewer.state.x_min
+                zoom_window = (x_min, x_max, viewer.state.y_min, viewer.state.y_max)
+        else:
+            # include all data, regardless of zoom limits
+            zoom_window = None
+
+        cache_key = (data.uuid, layer.state.attribute.label, zoom_window)
+        if cache_key in self._stretch_hist_samples:
+            sub_data, n_pixels = self._stretch_hist_samples[cache_key]
+        else:
+            if zoom_window is None:
+                arr = comp.data
+            elif hasattr(viewer, '_get_zoom_limits'):
+                arr = comp.data[y_min:y_max, x_min:x_max]
+            else:
+                x_data = data.get_component(data.components[1]).data
+                y_data = data.get_component(data.components[0]).data
                 inds = np.where((x_data >= x_min) &
                                 (x_data <= x_max) &
                                 (y_data >= viewer.state.y_min) &
                                 (y_data <= viewer.state.y_max))
+                arr = comp.data[inds]
 
-                sub_data = comp.data[inds].ravel()
-
-        else:
-            # include all data, regardless of zoom limits
-            arr = comp.data
-            sub_data = arr.ravel()
+            # only a (deterministic) subsample of large arrays is passed on to the
+            # histogram, with non-finite values filtered out (or else bqplot will fail)
+            n_pixels = arr.size
+            sub_data = _sample_finite_values(arr)
 
-        # filter out nans (or else bqplot will fail)
-        if np.any(np.isnan(sub_data)):
-            sub_data = sub_data[~np.isnan(sub_data)]
+            if len(self._stretch_hist_samples) >= STRETCH_HIST_CACHE_SIZE:
+                # drop the oldest entry
+                self._stretch_hist_samples.pop(next(iter(self._stretch_hist_samples)))
+            self._stretch_hist_samples[cache_key] = (sub_data, n_pixels)
 
         self.stretch_histogram._update_data('histogram', x=sub_data)
 
         if len(sub_data) > 0:
+            # for a subsample, these are approximate percentiles of the full data
             interval = PercentileInterval(95)
             hist_lims = interval.get_limits(sub_data)
             # set the stepsize for vmin/vmax to be approximately 1% of the range of the
@@ -993,13 +1036,21 @@ class PlotOptions(PluginTemplateMixin):
                 self.stretch_histogram.viewer.state.hist_x_min = hist_lims[0]
                 self.stretch_histogram.viewer.state.hist_x_max = hist_lims[1]
 
-        self.stretch_histogram.figure.title = f"{len(sub_data)} pixels"
+        if n_pixels > STRETCH_HIST_MAX_SAMPLES:
+            self.stretch_histogram.figure.title = f"{len(sub_data)} of {n_pixels} pixels (sampled)"
+        else:
+            self.stretch_histogram.figure.title = f"{len(sub_data)} pixels"
 
         # update the n_bins since this may be a new layer
         self._histogram_nbins_changed()
         # update the curve/colorbar
         self._update_stretch_curve(msg)
 
+    def _clear_stretch_hist_samples(self, msg):
+        # sampled values are stale once the underlying data has changed
+        for key in [key for key in self._stretch_hist_samples if key[0] == msg.data.uuid]:
+            del self._stretch_hist_samples[key]
+
     @observe('image_color_mode_value', 'image_color_value', 'image_colormap_value',
              'image_contrast_value', 'image_bias_value',
              'stretch_hist_nbins',
@@ -6,6 +6,7 @@ import matplotlib
 from numpy.testing import assert_allclose
 from photutils.datasets import make_4gaussians_image
 
+from jdaviz.configs.default.plugins.plot_options import plot_options
 from jdaviz.configs.default.plugins.plot_options.plot_options import SplineStretch
 
 
@@ -138,6 +139,41 @@ def test_stretch_histogram(cubeviz_helper, spectrum1d_cube_with_uncerts):
     assert po.stretch_histogram.marks['vmax'].x[0] == po.stretch_vmax.value
 
 
+@pytest.mark.filterwarnings('ignore')
+def test_stretch_histogram_sampled(imviz_helper, monkeypatch):
+    arr = np.arange(100 * 80, dtype=float).reshape(100, 80)
+    arr[:10] = np.nan
+    imviz_helper.load_data(arr, data_label='image')
+    po = imviz_helper.plugins['Plot Options']._obj
+    po.plugin_opened = True
+
+    hist_lyr = po.stretch_histogram.layers['histogram']
+    assert_allclose(hist_lyr.layer.data['x'], arr[10:].ravel())
+    assert po.stretch_histogram.figure.title == '7200 pixels'
+
+    # large images are represented by a deterministic subsample of their finite values
+    monkeypatch.setattr(plot_options, 'STRETCH_HIST_MAX_SAMPLES', 1000)
+    sample = plot_options._sample_finite_values(arr)
+    assert len(sample) <= 1000
+    assert np.all(np.isin(sample, arr[10:]))
+    assert_allclose(plot_options._sample_finite_values(arr), sample)
+
+    # samples are cached per data, attribute, and zoom window
+    assert len(po._stretch_hist_samples) == 1
+    po.stretch_hist_zoom_limits = True
+    assert len(po._stretch_hist_samples) == 2
+    hist_lyr = po.stretch_histogram.layers['histogram']
+    n_sampled = len(hist_lyr.layer.data['x'])
+    assert n_sampled <= 1000
+    assert po.stretch_histogram.figure.title.startswith(f"{n_sampled} of ")
+    assert po.stretch_histogram.figure.title.endswith(" pixels (sampled)")
+
+    # changing the data values invalidates its cached samples
+    data = imviz_helper.app.data_collection['image']
+    data.update_components({data.id['DATA']: arr + 1})
+    assert len(po._stretch_hist_samples) == 0
+
+
 @pytest.mark.filterwarnings('ignore')
 def test_user_api(cubeviz_helper, spectrum1d_cube):
     cubeviz_helper.load_data(spectrum1d_cube)
@@ -225,7 +225,8 @@ class JdavizViewerMixin:
                                                      'suffix_label': suffix}
 
         viewer_item = self.jdaviz_app._viewer_item_by_id(self.reference_id)
-        viewer_item['visible_layers'] = visible_layers
+        if viewer_item.get('visible_layers') != visible_layers:
+            viewer_item['visible_layers'] = visible_layers
 
     def _on_layers_update(self, layers=None):
         if self.__class__.__name__ == 'MosvizTableViewer':
@@ -238,21 +239,22 @@ class JdavizViewerMixin:
             return
         selected_data_items = viewer_item.get('selected_data_items', {})
 
-        # update selected_data_items
+        # update selected_data_items, only assigning the entries that changed since each
+        # assignment triggers a sync of the application state
+        data_labels = {x['id']: x['name'] for x in self.jdaviz_app.state.data_items}
+        layer_visibilities = {}
+        for layer in self.state.layers:
+            layer_visibilities.setdefault(layer.layer.data.label, []).append(layer.visible)
         for data_id, visibility in selected_data_items.items():
-            label = next((x['name'] for x in self.jdaviz_app.state.data_items
-                          if x['id'] == data_id), None)
-
-            visibilities = []
-            for layer in self.state.layers:
-                if layer.layer.data.label == label:
-                    visibilities.append(layer.visible)
+            visibilities = layer_visibilities.get(data_labels.get(data_id), [])
             if np.all(visibilities):
-                selected_data_items[data_id] = 'visible'
+                new_visibility = 'visible'
             elif np.any(visibilities):
-                selected_data_items[data_id] = 'mixed'
+                new_visibility = 'mixed'
             else:
-                selected_data_items[data_id] = 'hidden'
+                new_visibility = 'hidden'
+            if new_visibility != visibility:
+                selected_data_items[data_id] = new_visibility
 
         self._update_layer_icons()
 
@@ -5,10 +5,14 @@ from copy import deepcopy
 
 import numpy as np
 import astropy.units as u
+from astropy.io import fits
+from astropy.wcs import WCS
 from astropy.wcs.wcsapi import BaseHighLevelWCS
 from glue.core import BaseData
 from glue.core.link_helpers import LinkSame
-from glue.plugins.wcs_autolinking.wcs_autolinking import WCSLink, NoAffineApproximation
+from glue.plugins.wcs_autolinking.wcs_autolinking import (
+    OffsetLink, WCSLink, NoAffineApproximation
+)
 
 from jdaviz.core.events import SnackbarMessage, NewViewerMessage, LinkUpdatedMessage
 from jdaviz.core.helpers import ImageConfigHelper
@@ -21,6 +25,9 @@ __all__ = ['Imviz']
 
 base_wcs_layer_label = 'Default orientation'
 
+# Maximum number of affine approximations of WCS links kept for reuse when relinking.
+_WCS_LINK_CACHE_SIZE = 4096
+
 
 class Imviz(ImageConfigHelper):
     """Imviz Helper class."""
@@ -78,7 +85,7 @@ class Imviz(ImageConfigHelper):
             raise ValueError(f"Default viewer '{viewer_id}' cannot be destroyed")
         self.app.vue_destroy_viewer_item(viewer_id)
 
-    def load_data(self, data, data_label=None, show_in_viewer=True, **kwargs):
+    def load_data(self, data, data_label=None, show_in_viewer=True, n_cpu=1, **kwargs):
         """Load data into Imviz.
 
         Parameters
@@ -106,6 +113,8 @@ class Imviz(ImageConfigHelper):
               ``axis=0`` as a separate image (limit is 16 slices), however
               loading too many slices will cause performance issue,
               so consider using Cubeviz instead.
+            * A list of any of the above, or a comma-separated string of
+              file names (see ``n_cpu``)
 
         data_label : str or `None`
             Data label to go with the given data. If not given, this is
@@ -116,6 +125,11 @@ class Imviz(ImageConfigHelper):
         show_in_viewer : str or bool
             If `True`, show the data in default viewer.  If a string, show in that viewer.
 
+        n_cpu : int or `None`
+            Number of processes used to read the FITS files when a list of inputs
+            is given. If `None`, it will use max cores minus one. Data read in worker
+            processes are loaded into memory instead of being memory-mapped.
+
         kwargs : dict
             Extra keywords to be passed into app-level parser.
             The only one you might call directly here is ``ext`` (any FITS
@@ -134,26 +148,43 @@ class Imviz(ImageConfigHelper):
         prev_data_labels = self.app.data_collection.labels
 
         if isinstance(data, str):
-            filelist = data.split(',')
+            data = data.split(',')
 
-            if len(filelist) > 1 and data_label:
+        # NOTE: HDUList is a list of HDUs, but is loaded as a single input
+        if isinstance(data, (list, tuple)) and not isinstance(data, fits.HDUList):
+            if len(data) > 1 and data_label:
                 raise ValueError('Do not manually overwrite data_label for '
                                  'a list of images')
 
-            for data in filelist:
-                kw = deepcopy(kwargs)
-                filepath, ext, cur_data_label = split_filename_with_fits_ext(data)
+            file_list = []
+            for cur_data in data:
+                cur_ext = kwargs.get('ext')
+                if isinstance(cur_data, str):
+                    cur_data, ext, _ = split_filename_with_fits_ext(cur_data)
 
-                # This, if valid, will overwrite input.
-                if ext is not None:
-                    kw['ext'] = ext
+                    # This, if valid, will overwrite input.
+                    if ext is not None:
+                        cur_ext = ext
 
-                # This will only overwrite if not provided.
-                if not data_label:
-                    kw['data_label'] = None
-                else:
-                    kw['data_label'] = data_label
-                self.app.load_data(filepath, parser_reference='imviz-data-parser', **kw)
+                file_list.append((cur_data, cur_ext, data_label or None))
+
+            if len(file_list) == 1:
+                cur_data, cur_ext, cur_data_label = file_list[0]
+                kw = deepcopy(kwargs)
+                kw['ext'] = cur_ext
+                kw['data_label'] = cur_data_label
+                self.app.load_data(cur_data, parser_reference='imviz-data-parser', **kw)
+            else:
+                from jdaviz.configs.imviz.plugins.parsers import _parse_image_files
+
+                # Add the data to the data collection in order (as they are read) and link
+                # them (and show them in the viewer) only once at the end.
+                self.app.loading = True
+                try:
+                    with self.batch_load():
+                        _parse_image_files(self.app, file_list, n_cpu=n_cpu)
+                finally:
+                    self.app.loading = False
 
         elif isinstance(data, np.ndarray) and data.ndim >= 3:
             if data.ndim > 3:
@@ -457,6 +488,46 @@ def get_reference_image_data(app, viewer_id=None):
     return refdata, iref
 
 
+def _wcs_cache_key(data):
+    """Hashable key for the shape and full WCS of 2D ``data``, so that the same WCS
+    can be recognized across data entries (e.g., re-created orientation layers).
+    WCS that cannot be fully described by a FITS header (e.g., GWCS or lookup table
+    distortions) fall back to the data UUID."""
+    wcs = data.coords
+    if (isinstance(wcs, WCS) and wcs.cpdis1 is None and wcs.cpdis2 is None
+            and wcs.det2im1 is None and wcs.det2im2 is None):
+        return data.shape, wcs.to_header_string(relax=True)
+    return data.uuid
+
+
+def _affine_wcs_link(app, refdata, data, ids0, ids1):
+    """WCS link between ``refdata`` and ``data``, approximated by an affine transform
+    if possible.  The approximation is cached per pair of WCS in ``app._wcs_link_cache``,
+    so relinking (e.g., when toggling link type or orientation) does not refit it."""
+    key = (_wcs_cache_key(refdata), _wcs_cache_key(data))
+    link_cache = app._wcs_link_cache
+    if key not in link_cache:
+        wcslink = WCSLink(data1=refdata, data2=data, cids1=ids0, cids2=ids1)
+        try:
+            link = wcslink.as_affine_link()
+        except NoAffineApproximation:  # pragma: no cover
+            return wcslink
+        if len(link_cache) >= _WCS_LINK_CACHE_SIZE:
+            del link_cache[next(iter(link_cache))]
+        if isinstance(link, OffsetLink):
+            kwargs = {'offsets': link.offsets}
+        else:
+            kwargs = {'matrix': link.matrix}
+        # WCSLink may pick its own pixel components, so store their axes to rebuild them
+        link_cache[key] = (type(link), [cid.axis for cid in link.cids1],
+                           [cid.axis for cid in link.cids2], kwargs)
+        return link
+    link_cls, axes1, axes2, kwargs = link_cache[key]
+    return link_cls(data1=refdata, data2=data,
+                    cids1=[refdata.pixel_component_ids[axis] for axis in axes1],
+                    cids2=[data.pixel_component_ids[axis] for axis in axes2], **kwargs)
+
+
 # TODO: This is not really public API, so we can move what Orientation uses here into the plugin
 #       and remove this function from helper.py module in the future. Also move base_wcs_layer_label
 #       and remove update_plugin keyword when that happens.
@@ -544,11 +615,11 @@ def link_image_data(app, link_type='pixels', wcs_fallback_scheme=None, wcs_use_a
     else:
         link_plugin = None
 
-    data_already_linked = []
+    data_already_linked = set()
     if link_type == app._link_type and wcs_use_affine == app._wcs_use_affine:
         for link in app.data_collection.external_links:
             if link.data1.label != _wcs_only_label:
-                data_already_linked.append(link.data2)
+                data_already_linked.add(link.data2)
     else:
         for viewer in app._viewer_store.values():
             if len(viewer._marktags):
@@ -620,14 +691,10 @@ def link_image_data(app, link_type='pixels', wcs_fallback_scheme=None, wcs_use_a
                 new_links = [LinkSame(ids0[i], ids1[i]) for i in ndim_range]
             # otherwise if linking by WCS *and* this data entry has WCS:
             elif hasattr(data.coords, 'pixel_to_world'):
-                wcslink = WCSLink(data1=refdata, data2=data, cids1=ids0, cids2=ids1)
                 if wcs_use_affine:
-                    try:
-                        new_links = [wcslink.as_affine_link()]
-                    except NoAffineApproximation:  # pragma: no cover
-                        new_links = [wcslink]
+                    new_links = [_affine_wcs_link(app, refdata, data, ids0, ids1)]
                 else:
-                    new_links = [wcslink]
+                    new_links = [WCSLink(data1=refdata, data2=data, cids1=ids0, cids2=ids1)]
         except Exception as e:
             if link_type == 'wcs' and wcs_fallback_scheme == 'pixels':
                 try:
@@ -1,3 +1,4 @@
+import multiprocessing as mp
 import os
 import warnings
 from datetime import datetime, timezone
@@ -8,6 +9,7 @@ from astropy import units as u
 from astropy.modeling.fitting import LevMarLSQFitter
 from astropy.modeling import Parameter
 from astropy.modeling.models import Gaussian1D
+from astropy.table import vstack
 from astropy.time import Time
 from glue.core.message import SubsetUpdateMessage
 from glue_jupyter.common.toolbar_vuetify import read_icon
@@ -15,6 +17,8 @@ from ipywidgets import widget_serialization
 from packaging.version import Version
 from photutils.aperture import (ApertureStats, CircularAperture, EllipticalAperture,
                                 RectangularAperture)
+from photutils.geometry import (circular_overlap_grid, elliptical_overlap_grid,
+                                rectangular_overlap_grid)
 from traitlets import Any, Bool, Integer, List, Unicode, observe
 
 from jdaviz.core.custom_traitlets import FloatHandleEmpty
@@ -31,6 +35,13 @@ __all__ = ['SimpleAperturePhotometry']
 
 ASTROPY_LT_5_2 = Version(astropy.__version__) < Version('5.2')
 
+# Columns of photutils ApertureStats reported in the results.
+# Some columns are excluded, add back as needed.
+APERSTATS_COLUMNS = ('id', 'sum', 'sum_aper_area',
+                     'min', 'max', 'mean', 'median', 'mode', 'std', 'mad_std', 'var',
+                     'biweight_location', 'biweight_midvariance', 'fwhm', 'semimajor_sigma',
+                     'semiminor_sigma', 'orientation', 'eccentricity')
+
 
 @tray_registry('imviz-aper-phot-simple', label="Aperture Photometry")
 class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
@@ -359,6 +370,45 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
             self.hub.broadcast(SnackbarMessage(
                 f"Failed to extract {background_selected}: {repr(e)}", color='error', sender=self))
 
+    def _get_unit_factors(self, comp, pixel_area=None, counts_factor=None, flux_scaling=None):
+        """
+        Determine the image unit and the unit conversion factors that apply to photometry
+        of the given data component, using the plugin values unless overridden.
+
+        Returns
+        -------
+        img_unit, pixarea, ctfac, flux_scale
+            Unit of the data (or `None` if unitless), pixel area in arcsec squared (only for
+            surface brightness units), counts conversion factor, and flux scaling.
+            Factors that do not apply or are zero are returned as `None`.
+        """
+        if not comp.units:
+            return None, None, None, None
+
+        img_unit = u.Unit(comp.units)
+        pixarea = ctfac = flux_scale = None
+        if u.sr in img_unit.bases:  # TODO: Better way to detect surface brightness unit?
+            try:
+                pixarea = float(pixel_area if pixel_area is not None else self.pixel_area)
+            except ValueError:  # Clearer error message
+                raise ValueError('Missing or invalid pixel area')
+            if np.allclose(pixarea, 0):
+                pixarea = None
+        if img_unit != u.count:
+            try:
+                ctfac = float(counts_factor if counts_factor is not None else self.counts_factor)
+            except ValueError:  # Clearer error message
+                raise ValueError('Missing or invalid counts conversion factor')
+            if np.allclose(ctfac, 0):
+                ctfac = None
+        try:
+            flux_scale = float(flux_scaling if flux_scaling is not None else self.flux_scaling)
+        except ValueError:  # Clearer error message
+            raise ValueError('Missing or invalid flux scaling')
+        if np.allclose(flux_scale, 0):
+            flux_scale = None
+        return img_unit, pixarea, ctfac, flux_scale
+
     @with_spinner()
     def calculate_photometry(self, dataset=None, aperture=None, background=None,
                              background_value=None, pixel_area=None, counts_factor=None,
@@ -477,40 +527,16 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
                 sky_center = None
 
         aperture = regions2aperture(reg)
-        include_pixarea_fac = False
-        include_counts_fac = False
-        include_flux_scale = False
-        if comp.units:
-            img_unit = u.Unit(comp.units)
+        img_unit, pixarea, ctfac, flux_scale = self._get_unit_factors(
+            comp, pixel_area=pixel_area, counts_factor=counts_factor, flux_scaling=flux_scaling)
+        include_pixarea_fac = pixarea is not None
+        include_counts_fac = ctfac is not None
+        include_flux_scale = flux_scale is not None
+        if img_unit is not None:
             bg = bg * img_unit
             comp_data = comp_data << img_unit
-
-            if u.sr in img_unit.bases:  # TODO: Better way to detect surface brightness unit?
-                try:
-                    pixarea = float(pixel_area if pixel_area is not None else self.pixel_area)
-                except ValueError:  # Clearer error message
-                    raise ValueError('Missing or invalid pixel area')
-                if not np.allclose(pixarea, 0):
-                    include_pixarea_fac = True
-            if img_unit != u.count:
-                try:
-                    ctfac = float(counts_factor if counts_factor is not None else self.counts_factor)  # noqa
-                except ValueError:  # Clearer error message
-                    raise ValueError('Missing or invalid counts conversion factor')
-                if not np.allclose(ctfac, 0):
-                    include_counts_fac = True
-            try:
-                flux_scale = float(flux_scaling if flux_scaling is not None else self.flux_scaling)
-            except ValueError:  # Clearer error message
-                raise ValueError('Missing or invalid flux scaling')
-            if not np.allclose(flux_scale, 0):
-                include_flux_scale = True
         phot_aperstats = ApertureStats(comp_data, aperture, wcs=data.coords, local_bkg=bg)
-        phot_table = phot_aperstats.to_table(columns=(
-            'id', 'sum', 'sum_aper_area',
-            'min', 'max', 'mean', 'median', 'mode', 'std', 'mad_std', 'var',
-            'biweight_location', 'biweight_midvariance', 'fwhm', 'semimajor_sigma',
-            'semiminor_sigma', 'orientation', 'eccentricity'))  # Some cols excluded, add back as needed.  # noqa
+        phot_table = phot_aperstats.to_table(columns=APERSTATS_COLUMNS)
         rawsum = phot_table['sum'][0]
 
         if include_pixarea_fac:
@@ -860,10 +886,250 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
                 err_msg += "  To see full exceptions, run individually or pass full_exceptions=True"  # noqa
             raise RuntimeError(err_msg)
 
+    @with_spinner()
+    def calculate_catalog_photometry(self, sources, dataset=None, background_value=0,
+                                     pixel_area=None, counts_factor=None, flux_scaling=None,
+                                     add_to_table=False, n_cpu=1):
+        """
+        Run aperture photometry for a catalog of sources, without going through the plugin
+        subsets.  Sources sharing a dataset and aperture shape are measured together in a
+        single photutils call.
+
+        Parameters
+        ----------
+        sources : `~astropy.table.Table`
+            One row per source.  Positions are given either by ``xcenter`` and ``ycenter``
+            columns (in pixels) or by a ``sky_center`` column of
+            `~astropy.coordinates.SkyCoord`.  The aperture shape is given by an ``r`` column
+            for circular apertures, ``a`` and ``b`` for elliptical apertures, or ``w`` and ``h``
+            for rectangular apertures (in pixels), with an optional ``theta`` column (in
+            radians, if not a `~astropy.units.Quantity`).  Optional ``dataset`` and
+            ``background`` columns override the arguments of the same name per source, and an
+            optional ``subset_label`` column is carried over to the results.
+        dataset : str, optional
+            Dataset to use for sources without a ``dataset`` column.  If not provided,
+            the dataset selected in the plugin is used.
+        background_value : float, optional
+            Background to subtract, same unit as data, for sources without a ``background``
+            column.
+        pixel_area : float, optional
+            Pixel area in arcsec squared, only used if sr in data unit.
+        counts_factor : float, optional
+            Factor to convert data unit to counts, in unit of flux/counts.
+        flux_scaling : float, optional
+            Same unit as data, used in -2.5 * log(flux / flux_scaling).
+        add_to_table : bool, optional
+            Whether to add the results to the plugin table (all at once, at the end).
+        n_cpu : int or `None`, optional
+            Number of processes across which groups of sources are measured.
+            If `None`, it will use max cores minus one.  By default, everything
+            runs in the current process.
+
+        Returns
+        -------
+        phot_table : `~astropy.table.QTable`
+            Photometry results, one row per source and in the same order as ``sources``.
+        """
+        n_sources = len(sources)
+        colnames = sources.colnames
+        if 'r' in colnames:
+            aperture_cls, shape_cols = CircularAperture, ('r',)
+        elif 'a' in colnames and 'b' in colnames:
+            aperture_cls, shape_cols = EllipticalAperture, ('a', 'b', 'theta')
+        elif 'w' in colnames and 'h' in colnames:
+            aperture_cls, shape_cols = RectangularAperture, ('w', 'h', 'theta')
+        else:
+            raise ValueError("sources must define the aperture shape with 'r', 'a' and 'b', "
+                             "or 'w' and 'h' columns")
+        if not (('xcenter' in colnames and 'ycenter' in colnames) or 'sky_center' in colnames):
+            raise ValueError("sources must define positions with 'xcenter' and 'ycenter', "
+                             "or 'sky_center' columns")
+
+        if 'dataset' in colnames:
+            datasets = np.asarray(sources['dataset']).astype(str)
+        else:
+            if dataset is None:
+                if self.multiselect:
+                    raise ValueError("dataset must be provided in multiselect mode")
+                dataset = self.dataset.selected
+            datasets = np.full(n_sources, dataset)
+        for label in np.unique(datasets):
+            if label not in self.dataset.choices:
+                raise ValueError(f"dataset must be one of {self.dataset.choices}")
+
+        if 'background' in colnames:
+            backgrounds = np.asarray(sources['background'], dtype=float)
+        else:
+            backgrounds = np.full(n_sources, float(background_value))
+
+        shapes = []
+        for col in shape_cols:
+            if col == 'theta':
+                shapes.append(u.Quantity(sources[col], u.rad).value
+                              if col in colnames else np.zeros(n_sources))
+            else:
+                shapes.append(np.asarray(u.Quantity(sources[col]).value, dtype=float))
+        shapes = np.column_stack(shapes)
+
+        # Resolve the data, pixel positions, and unit factors once per dataset.
+        datasets_info = {}
+        xcenter = np.zeros(n_sources)
+        ycenter = np.zeros(n_sources)
+        for label in np.unique(datasets):
+            in_dataset = datasets == label
+            data = self.dataset._get_dc_item(label)
+            comp = data.get_component(data.main_components[0])
+            is_cube = self.config == "cubeviz" and data.ndim > 2
+            if is_cube:
+                comp_data = comp.data[:, :, self._cube_idx].T  # nx, ny --> ny, nx
+                # Similar to coords_info logic.
+                if '_orig_spec' in getattr(data, 'meta', {}):
+                    w = data.meta['_orig_spec'].wcs
+                else:
+                    w = data.coords
+            else:  # "imviz"
+                comp_data = comp.data  # ny, nx
+                w = data.coords
+
+            if 'xcenter' in colnames:
+                xcenter[in_dataset] = u.Quantity(sources['xcenter'][in_dataset]).value
+                ycenter[in_dataset] = u.Quantity(sources['ycenter'][in_dataset]).value
+            elif is_cube:
+                ycenter[in_dataset], xcenter[in_dataset] = w.world_to_pixel(
+                    self._cube_wave, sources['sky_center'][in_dataset])[1]
+            else:
+                xcenter[in_dataset], ycenter[in_dataset] = w.world_to_pixel(
+                    sources['sky_center'][in_dataset])
+
+            img_unit, pixarea, ctfac, flux_scale = self._get_unit_factors(
+                comp, pixel_area=pixel_area, counts_factor=counts_factor,
+                flux_scaling=flux_scaling)
+            if img_unit is not None:
+                comp_data = comp_data << img_unit
+            datasets_info[label] = (data, comp_data, w, is_cube, img_unit,
+                                    pixarea, ctfac, flux_scale)
+
+        # Sources sharing a dataset and aperture shape are measured in one call.
+        groups = {}
+        for i, key in enumerate(zip(datasets, map(tuple, shapes))):
+            groups.setdefault(key, []).append(i)
+        group_keys = list(groups)
+        group_indices = [np.asarray(groups[key]) for key in group_keys]
+        tasks = []
+        for (label, shape), indices in zip(group_keys, group_indices):
+            comp_data, img_unit = datasets_info[label][1], datasets_info[label][4]
+            bg = backgrounds[indices]
+            if img_unit is not None:
+                bg = bg * img_unit
+            tasks.append((comp_data, np.column_stack([xcenter[indices], ycenter[indices]]),
+                          aperture_cls, shape, bg))
+
+        if n_cpu is None:
+            n_cpu = mp.cpu_count() - 1
+        if n_cpu > 1 and len(tasks) > 1:
+            with mp.Pool(min(n_cpu, len(tasks))) as pool:
+                stats_tables = pool.map(_catalog_aperture_stats, tasks)
+        else:
+            stats_tables = [_catalog_aperture_stats(task) for task in tasks]
+
+        timestamp = Time(datetime.now(tz=timezone.utc))
+        tables = []
+        for (label, _), indices, phot_table in zip(group_keys, group_indices, stats_tables):
+            data, _, w, is_cube, img_unit, pixarea, ctfac, flux_scale = datasets_info[label]
+            n_group = len(indices)
+            bg = backgrounds[indices]
+            if img_unit is not None:
+                bg = bg * img_unit
+
+            if 'sky_center' in colnames:
+                sky_center = sources['sky_center'][indices]
+            elif data.coords is not None:
+                if is_cube:
+                    sky_center = w.pixel_to_world(self._cube_idx, ycenter[indices],
+                                                  xcenter[indices])[1]
+                else:  # "imviz"
+                    sky_center = w.pixel_to_world(xcenter[indices], ycenter[indices])
+            else:
+                sky_center = [None] * n_group
+
+            rawsum = phot_table['sum']
+            if pixarea is not None:
+                pixarea = pixarea * (u.arcsec * u.arcsec / (u.pix * u.pix))
+                # NOTE: Sum already has npix value encoded, so we simply apply the npix unit here.
+                pixarea_fac = (u.pix * u.pix) * pixarea.to(u.sr / (u.pix * u.pix))
+                phot_table['sum'] = rawsum * pixarea_fac
+            else:
+                pixarea_fac = None
+            if ctfac is not None:
+                ctfac = ctfac * (rawsum.unit / u.count)
+                sum_ct = rawsum / ctfac
+                sum_ct_err = np.sqrt(sum_ct.value) * sum_ct.unit
+            else:
+                sum_ct = sum_ct_err = None
+            if flux_scale is not None:
+                flux_scale = flux_scale * phot_table['sum'].unit
+                sum_mag = -2.5 * np.log10(phot_table['sum'] / flux_scale) * u.mag
+            else:
+                sum_mag = None
+            if 'subset_label' in colnames:
+                subset_labels = sources['subset_label'][indices]
+            else:
+                subset_labels = [''] * n_group
+
+            phot_table.add_columns(
+                [xcenter[indices] * u.pix, ycenter[indices] * u.pix, sky_center,
+                 bg, pixarea_fac, sum_ct, sum_ct_err, ctfac, sum_mag, flux_scale,
+                 [data.label] * n_group, subset_labels, Time([timestamp] * n_group)],
+                names=['xcenter', 'ycenter', 'sky_center', 'background', 'pixarea_tot',
+                       'aperture_sum_counts', 'aperture_sum_counts_err', 'counts_fac',
+                       'aperture_sum_mag', 'flux_scaling',
+                       'data_label', 'subset_label', 'timestamp'],
+                indexes=[1, 1, 1, 1, 3, 3, 3, 3, 3, 3, 18, 18, 18])
+            if self.config == "cubeviz":
+                if is_cube:
+                    slice_val = self._cube_wave
+                else:
+                    slice_val = u.Quantity(np.nan, self._cube_wave.unit)
+                phot_table.add_column([slice_val.value] * n_group * slice_val.unit,
+                                      name="slice_wave", index=29)
+            tables.append(phot_table)
+
+        phot_table = vstack(tables, metadata_conflicts='silent')
+        # restore the order of the input sources
+        phot_table = phot_table[np.argsort(np.concatenate(group_indices), kind='stable')]
+
+        first_id = 1
+        if add_to_table and self.table._qtable is not None and 'id' in self.table._qtable.colnames:
+            first_id = self.table._qtable['id'].max() + 1
+        phot_table['id'] = np.arange(first_id, first_id + n_sources)
+
+        if add_to_table:
+            try:
+                self.table.add_item(phot_table)
+            except Exception:  # Discard incompatible QTable
+                self.table.clear_table()
+                phot_table['id'] = np.arange(1, n_sources + 1)
+                self.table.add_item(phot_table)
+
+            # User wants 'sum' as scientific notation.
+            self.table._qtable['sum'].info.format = '.6e'
+
+        return phot_table
+
 
 # NOTE: These are hidden because the APIs are for internal use only
 # but we need them as a separate functions for unit testing.
 
+def _catalog_aperture_stats(task):
+    """
+    Measures one group of catalog sources sharing an aperture shape
+    (possibly in a worker process), returning the photutils statistics table.
+    """
+    data, positions, aperture_cls, shape, local_bkg = task
+    aperture = aperture_cls(positions, *shape)
+    return ApertureStats(data, aperture, local_bkg=local_bkg).to_table(columns=APERSTATS_COLUMNS)
+
+
 def _radial_profile(radial_cutout, reg_bb, centroid, raw=False):
     """Calculate radial profile.
 
@@ -968,30 +1234,16 @@ def _curve_of_growth(data, centroid, aperture, final_sum, wcs=None, background=0
     if isinstance(aperture, CircularAperture):
         x_label = 'Radius (pix)'
         x_arr = np.linspace(0, aperture.r, num=n_datapoints)[1:]
-        aper_list = [CircularAperture(centroid, cur_r) for cur_r in x_arr[:-1]]
     elif isinstance(aperture, EllipticalAperture):
         x_label = 'Semimajor axis (pix)'
         x_arr = np.linspace(0, aperture.a, num=n_datapoints)[1:]
-        a_arr = x_arr[:-1]
-        b_arr = aperture.b * a_arr / aperture.a
-        aper_list = [EllipticalAperture(centroid, cur_a, cur_b, theta=aperture.theta)
-                     for (cur_a, cur_b) in zip(a_arr, b_arr)]
     elif isinstance(aperture, RectangularAperture):
         x_label = 'Width (pix)'
         x_arr = np.linspace(0, aperture.w, num=n_datapoints)[1:]
-        w_arr = x_arr[:-1]
-        h_arr = aperture.h * w_arr / aperture.w
-        aper_list = [RectangularAperture(centroid, cur_w, cur_h, theta=aperture.theta)
-                     for (cur_w, cur_h) in zip(w_arr, h_arr)]
     else:
         raise TypeError(f'Unsupported aperture: {aperture}')
 
-    sum_arr = [ApertureStats(data, cur_aper, wcs=wcs, local_bkg=background).sum
-               for cur_aper in aper_list]
-    if isinstance(sum_arr[0], u.Quantity):
-        sum_arr = u.Quantity(sum_arr)
-    else:
-        sum_arr = np.array(sum_arr)
+    sum_arr = _nested_aperture_sums(data, centroid, aperture, x_arr[:-1], background=background)
     if pixarea_fac is not None:
         sum_arr = sum_arr * pixarea_fac
     sum_arr = np.append(sum_arr, final_sum)
@@ -1003,3 +1255,126 @@ def _curve_of_growth(data, centroid, aperture, final_sum, wcs=None, background=0
         y_label = 'Value'
 
     return x_arr, sum_arr, x_label, y_label
+
+
+def _nested_aperture_sums(data, centroid, aperture, sizes, background=0):
+    """Calculate the aperture sums of scaled copies of an aperture in a single pass.
+
+    This gives the same sums as ``ApertureStats(...).sum`` for each scaled
+    aperture (exact overlap, or 32x32 subpixels for rectangles as in
+    ``photutils``), but only extracts and sorts the cutout of the given
+    aperture once. Pixels entirely within a scaled aperture are summed from a
+    cumulative sum over the pixels sorted by their farthest corner, so that the
+    overlap only needs to be computed for the pixels along its edge.
+
+    Parameters
+    ----------
+    data : ndarray or `~astropy.units.Quantity`
+        Data for the calculation.
+
+    centroid : tuple of float
+        Center of the apertures in ``(x, y)``.
+
+    aperture : obj
+        ``photutils`` pixel aperture defining the shape (and largest size) of the apertures.
+
+    sizes : array-like
+        Radius, semimajor axis, or width of the apertures (for circular,
+        elliptical, or rectangular apertures, respectively), no larger than
+        that of ``aperture``.
+
+    background : float or `~astropy.units.Quantity`
+        Background to subtract, if any. Unit must match ``data``.
+
+    Returns
+    -------
+    sum_arr : ndarray or `~astropy.units.Quantity`
+        Aperture sums for each of ``sizes``.
+
+    """
+    if isinstance(aperture, CircularAperture):
+        largest = CircularAperture(centroid, aperture.r)
+        ratio, theta = 1, 0
+    elif isinstance(aperture, EllipticalAperture):
+        largest = EllipticalAperture(centroid, aperture.a, aperture.b, theta=aperture.theta)
+        ratio, theta = aperture.b / aperture.a, u.Quantity(aperture.theta, u.rad).value
+    elif isinstance(aperture, RectangularAperture):
+        largest = RectangularAperture(centroid, aperture.w, aperture.h, theta=aperture.theta)
+        ratio, theta = aperture.h / aperture.w, u.Quantity(aperture.theta, u.rad).value
+    else:
+        raise TypeError(f'Unsupported aperture: {aperture}')
+
+    unit = data.unit if isinstance(data, u.Quantity) else None
+    if unit is not None:
+        background = u.Quantity(background, unit).value
+        data = data.value
+
+    sum_arr = np.zeros(len(sizes))
+    slices = largest.bbox.get_overlap_slices(data.shape)[0]
+    if slices is None:  # No overlap with the data
+        return sum_arr if unit is None else sum_arr << unit
+
+    # Like ApertureStats, non-finite values are excluded.
+    values = np.asarray(data[slices], dtype=float) - background
+    values[~np.isfinite(values)] = 0
+    flat_values = values.ravel()
+    nx = values.shape[1]
+
+    # Scaled distance of each pixel corner from the center, such that a corner
+    # is inside the aperture of a given size if its distance is within that size.
+    # The distance is a convex function of position, so the farthest corner
+    # decides whether a pixel is entirely inside the aperture.
+    ygrid, xgrid = np.ogrid[slices[0].start - 0.5:slices[0].stop + 0.5,
+                            slices[1].start - 0.5:slices[1].stop + 0.5]
+    dx = xgrid - centroid[0]
+    dy = ygrid - centroid[1]
+    dx_rot = dx * np.cos(theta) + dy * np.sin(theta)
+    dy_rot = dy * np.cos(theta) - dx * np.sin(theta)
+    # Every point of a pixel is within half a diagonal of one of its corners, which
+    # bounds how much smaller the distance can get within the pixel than at its corners.
+    if isinstance(aperture, RectangularAperture):
+        corner_dist = 2 * np.maximum(np.abs(dx_rot), np.abs(dy_rot) / ratio)
+        max_change = 2 * max(1, 1 / ratio) * np.sqrt(0.5)
+    else:
+        corner_dist = np.hypot(dx_rot, dy_rot / ratio)
+        max_change = max(1, 1 / ratio) * np.sqrt(0.5)
+    corners = [corner_dist[:-1, :-1], corner_dist[:-1, 1:],
+               corner_dist[1:, :-1], corner_dist[1:, 1:]]
+    far_dist = np.maximum.reduce(corners).ravel()
+    near_dist = np.minimum.reduce(corners).ravel() - max_change
+
+    order = np.argsort(far_dist)
+    far_sorted = far_dist[order]
+    cumsum = np.concatenate([[0], np.cumsum(flat_values[order])])
+
+    # exact overlap of the aperture of a given size with a row of pixels
+    if isinstance(aperture, CircularAperture):
+        def overlap(x0, x1, y0, n, size):
+            return circular_overlap_grid(x0, x1, y0, y0 + 1, n, 1, size, 1, 1)[0]
+    elif isinstance(aperture, EllipticalAperture):
+        def overlap(x0, x1, y0, n, size):
+            return elliptical_overlap_grid(x0, x1, y0, y0 + 1, n, 1,
+                                           size, size * ratio, theta, 1, 1)[0]
+    else:
+        def overlap(x0, x1, y0, n, size):
+            return rectangular_overlap_grid(x0, x1, y0, y0 + 1, n, 1,
+                                            size, size * ratio, theta, 0, 32)[0]
+
+    pix_x0 = dx[0, :-1].tolist()
+    pix_y0 = dy[:-1, 0].tolist()
+    for i, size in enumerate(sizes):
+        # pixels entirely inside the aperture
+        sum_arr[i] = cumsum[np.searchsorted(far_sorted, size, side='right')]
+
+        # pixels on the edge of the aperture, in runs of consecutive pixels along rows
+        edge = np.nonzero((near_dist < size) & (far_dist > size))[0]
+        if not len(edge):
+            continue
+        breaks = np.nonzero((np.diff(edge) != 1) | (edge[1:] % nx == 0))[0] + 1
+        starts = np.concatenate([[0], breaks])
+        ends = np.concatenate([breaks, [len(edge)]])
+        fracs = [overlap(pix_x0[start % nx], pix_x0[start % nx] + n, pix_y0[start // nx], n, size)
+                 for start, n in zip(edge[starts].tolist(), (ends - starts).tolist())]
+        sum_arr[i] += np.dot(np.concatenate(fracs), flat_values[edge])
+
+    return sum_arr if unit is None else sum_arr << unit
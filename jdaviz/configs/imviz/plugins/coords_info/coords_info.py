@@ -57,6 +57,8 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
         self._marks = {}
         self._dict = {}  # dictionary representation of current mouseover info
         self._x, self._y = None, None  # latest known cursor positions
+        # per-layer spectral axis and flux in display units, sorted by spectral axis value
+        self._spectrum_hover_index = {}
 
         # subscribe/unsubscribe to mouse events across all existing viewers
         viewer_refs = []
@@ -199,6 +201,11 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
         self.update_display(viewer, x=x, y=y)
 
     def _layers_changed(self, viewer):
+        # drop cached hover indices for layers that are no longer in this viewer
+        layer_labels = [lyr.layer.label for lyr in viewer.state.layers]
+        self._spectrum_hover_index = {k: v for k, v in self._spectrum_hover_index.items()
+                                      if k[0] != viewer._reference_id or k[1] in layer_labels}
+
         if self._x is None or self._y is None:
             return
 
@@ -236,14 +243,17 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
         else:  # pragma: no cover
             raise ValueError(f'does not support ndim={image.ndim}')
 
-    def _get_cube_value(self, image, arr, x, y, viewer):
+    def _get_cube_value(self, image, attribute, x, y, viewer):
+        # pass the single requested element as a view so that glue only reads (or for derived
+        # components, only computes) that element instead of materializing the full array
         if image.ndim == 3:
             # cubeviz case:
-            return arr[int(round(x)), int(round(y)), viewer.state.slices[-1]]
+            view = (int(round(x)), int(round(y)), viewer.state.slices[-1])
         elif image.ndim == 2:
-            return arr[int(round(y)), int(round(x))]
+            view = (int(round(y)), int(round(x)))
         else:  # pragma: no cover
             raise ValueError(f'does not support ndim={image.ndim}')
+        return image.get_data(attribute, view=view)
 
     def _image_viewer_update(self, viewer, x, y):
         # Display the current cursor coordinates (both pixel and world) as
@@ -430,13 +440,8 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
         if (-0.5 < x < image.shape[ix_shape] - 0.5 and -0.5 < y < image.shape[iy_shape] - 0.5
                 and hasattr(active_layer, 'attribute')):
             attribute = active_layer.attribute
-            if isinstance(viewer, (ImvizImageView, MosvizImageView, MosvizProfile2DView)):
-                value = image.get_data(attribute)[int(round(y)), int(round(x))]
-                unit = image.get_component(attribute).units
-            elif isinstance(viewer, CubevizImageView):
-                arr = image.get_component(attribute).data
-                unit = image.get_component(attribute).units
-                value = self._get_cube_value(image, arr, x, y, viewer)
+            value = self._get_cube_value(image, attribute, x, y, viewer)
+            unit = image.get_component(attribute).units
             self.row1b_title = 'Value'
             self.row1b_text = f'{value:+10.5e} {unit}'
             self._dict['value'] = float(value)
@@ -460,6 +465,34 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
                 else:
                     self.marks[matched_marker_id].visible = False
 
+    def _get_spectrum_hover_index(self, cache_key, sp, viewer):
+        # Converting the spectral axis and flux to display units is expensive for long spectra,
+        # so cache the converted (and sorted) arrays until either the underlying spectrum
+        # object or the display units change.
+        x_unit = viewer.state.x_display_unit
+        y_unit = viewer.state.y_display_unit
+        index = self._spectrum_hover_index.get(cache_key)
+        if index is not None and index[0] is sp and index[1] == (x_unit, y_unit):
+            return index[2:]
+
+        disp_wave = sp.spectral_axis.to_value(x_unit, u.spectral())
+        disp_flux = sp.flux.to_value(y_unit, u.spectral_density(sp.spectral_axis))
+        order = np.flatnonzero(np.isfinite(disp_wave))
+        order = order[np.argsort(disp_wave[order], kind='stable')]
+        index = (sp, (x_unit, y_unit), disp_wave[order], disp_flux[order], order)
+        self._spectrum_hover_index[cache_key] = index
+        return index[2:]
+
+    @staticmethod
+    def _nearest_sorted_index(sorted_values, x):
+        # index into sorted_values of the entry closest to x
+        i = np.searchsorted(sorted_values, x)
+        if i == 0:
+            return 0
+        if i == len(sorted_values):
+            return i - 1
+        return i if sorted_values[i] - x < x - sorted_values[i - 1] else i - 1
+
     def _spectrum_viewer_update(self, viewer, x, y):
         def _cursor_fallback():
             self._dict['axes_x'] = x
@@ -527,26 +560,25 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
                 # But if not (maybe user changed statistic), we cache it here too.
                 statistic = getattr(viewer.state, 'function', None)
                 cache_key = (lyr.layer.label, statistic)
-                if cache_key in self.app._get_object_cache:
-                    sp = self.app._get_object_cache[cache_key]
-                else:
+                sp = self.app._get_object_cache.get(cache_key)
+                if sp is None:
                     sp = self._specviz_helper.get_data(data_label=data_label,
                                                        spatial_subset=subset_label)
                     self.app._get_object_cache[cache_key] = sp
 
                 # Calculations have to happen in the frame of viewer display units.
-                disp_wave = sp.spectral_axis.to_value(viewer.state.x_display_unit, u.spectral())
-                disp_flux = sp.flux.to_value(viewer.state.y_display_unit,
-                                             u.spectral_density(sp.spectral_axis))
+                disp_wave, disp_flux, order = self._get_spectrum_hover_index(
+                    (viewer._reference_id, *cache_key), sp, viewer)
 
                 # Out of range in spectral axis.
                 if (self.dataset.selected != lyr.layer.label and
-                        (x < disp_wave.min() or x > disp_wave.max())):
+                        (x < disp_wave[0] or x > disp_wave[-1])):
                     continue
 
-                cur_i = np.argmin(abs(disp_wave - x))
-                cur_wave = disp_wave[cur_i]
-                cur_flux = disp_flux[cur_i]
+                sorted_i = self._nearest_sorted_index(disp_wave, x)
+                cur_i = order[sorted_i]
+                cur_wave = disp_wave[sorted_i]
+                cur_flux = disp_flux[sorted_i]
 
                 dx = cur_wave - x
                 dy = cur_flux - y
@@ -1,3 +1,4 @@
+import multiprocessing as mp
 import os
 
 import asdf
@@ -174,7 +175,10 @@ def _parse_image(app, file_obj, data_label, ext=None):
     if data_label is None:
         data_label = app.return_data_label(file_obj, ext, alt_name="image_data")
     data_iter = get_image_data_iterator(app, file_obj, data_label, ext=ext)
+    _add_image_data(app, data_iter)
 
+
+def _add_image_data(app, data_iter):
     for data, data_label in data_iter:
         if isinstance(data.coords, GWCS) and (data.coords.bounding_box is not None):
             # keep a copy of the original bounding box so we can detect
@@ -191,7 +195,99 @@ def _parse_image(app, file_obj, data_label, ext=None):
     # Do not link image data here. We do it at the end in Imviz.load_data()
 
 
+def _is_fits_file(file_obj):
+    return (isinstance(file_obj, str) and os.path.isfile(file_obj) and
+            not file_obj.endswith('contents') and
+            not file_obj.lower().endswith(('.jpg', '.jpeg', '.png', '.asdf', '.reg')))
+
+
+def _read_fits_image_file(task):
+    """Read the image data in a FITS file without touching the app, so that
+    several files can be read in worker processes.
+
+    Parameters
+    ----------
+    task : tuple
+        ``(file_obj, ext, data_label)``
+
+    Returns
+    -------
+    data_list : list
+        ``(data, data_label)`` pairs as yielded by `get_image_data_iterator`.
+
+    more_extensions : bool
+        Whether to inform the user of more viewable extensions in the file.
+
+    """
+    file_obj, ext, data_label = task
+    with fits.open(file_obj) as pf:
+        data_list = list(get_image_data_iterator(None, pf, data_label, ext=ext))
+        more_extensions = (ext != '*' and (ext is None or 'ASDF' in pf) and
+                           _count_image2d_extensions(pf) > 1)
+    return data_list, more_extensions
+
+
+def _parse_image_files(app, file_list, n_cpu=1):
+    """Parse several image files into Imviz, optionally reading the FITS files
+    in a pool of worker processes.
+
+    The data are added to the app in the order of ``file_list``, so the
+    resulting data labels do not depend on which file finishes reading first.
+    Inputs that are not FITS files are parsed with `parse_data`.
+
+    Parameters
+    ----------
+    app : `~jdaviz.app.Application`
+        The application-level object used to reference the viewers.
+
+    file_list : list of tuple
+        ``(file_obj, ext, data_label)`` for each input, as accepted by `parse_data`.
+
+    n_cpu : int or `None`
+        Number of processes used to read FITS files.
+        If `None`, it will use max cores minus one.
+        Data read in worker processes are loaded into memory instead of
+        being memory-mapped.
+
+    """
+    # resolve the base label of each FITS file before reading anything
+    tasks = []
+    for file_obj, ext, data_label in file_list:
+        if _is_fits_file(file_obj):
+            if data_label is None:
+                data_label = os.path.splitext(os.path.basename(file_obj))[0]
+            tasks.append((file_obj, ext, data_label))
+
+    if n_cpu is None:
+        n_cpu = mp.cpu_count() - 1
+    n_cpu = min(n_cpu, len(tasks))
+
+    pool = mp.Pool(n_cpu) if n_cpu > 1 else None
+    try:
+        if pool is None:
+            results = map(_read_fits_image_file, tasks)
+        else:
+            # results come back in order, while later files are still being read
+            results = pool.imap(_read_fits_image_file, tasks)
+
+        for file_obj, ext, data_label in file_list:
+            if not _is_fits_file(file_obj):
+                app.load_data(file_obj, parser_reference='imviz-data-parser',
+                              ext=ext, data_label=data_label)
+                continue
+            data_list, more_extensions = next(results)
+            if more_extensions:
+                app.hub.broadcast(SnackbarMessage(INFO_MSG, color="info",
+                                                  timeout=8000, sender=app))
+            _add_image_data(app, data_list)
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
 def _info_nextensions(app, file_obj):
+    if app is None:  # reading outside of the app (see _parse_image_files)
+        return
     if _count_image2d_extensions(file_obj) > 1:
         info_msg = SnackbarMessage(INFO_MSG, color="info", timeout=8000, sender=app)
         app.hub.broadcast(info_msg)
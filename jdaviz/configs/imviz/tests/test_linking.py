@@ -1,12 +1,16 @@
+from unittest.mock import patch
+
+import numpy as np
 import pytest
 from astropy.table import Table
-from astropy.wcs import WCS
+from astropy.wcs import WCS, Sip
+from glue.core import Data
 from glue.core.link_helpers import LinkSame
 from glue.plugins.wcs_autolinking.wcs_autolinking import AffineLink, OffsetLink, WCSLink
 from numpy.testing import assert_allclose
 from regions import PixCoord, CirclePixelRegion, PolygonPixelRegion
 
-from jdaviz.configs.imviz.helper import get_reference_image_data
+from jdaviz.configs.imviz.helper import _wcs_cache_key, get_reference_image_data
 from jdaviz.configs.imviz.tests.utils import (
     BaseImviz_WCS_NoWCS, BaseImviz_WCS_WCS, BaseImviz_WCS_GWCS, BaseImviz_GWCS_GWCS)
 
@@ -175,6 +179,46 @@ class TestLink_WCS_WCS(BaseImviz_WCS_WCS, BaseLinkHandler):
         assert self.viewer.get_link_type('has_wcs_1[SCI,1]') == 'wcs'
         assert self.viewer.get_link_type('has_wcs_2[SCI,1]') == 'wcs'
 
+    def test_wcslink_cache(self):
+        dc = self.imviz.app.data_collection
+        self.imviz.link_data(link_type='wcs')
+        self.imviz.link_data(link_type='pixels')
+        self.imviz.link_data(link_type='wcs')
+        offsets = sorted(tuple(link.offsets) for link in dc.external_links)
+        n_cached = len(self.imviz.app._wcs_link_cache)
+        assert n_cached > 0
+
+        # Toggling the link type again re-creates the orientation layer but reuses
+        # the affine approximations computed before.
+        with patch.object(WCSLink, 'as_affine_link') as mock_affine:
+            self.imviz.link_data(link_type='pixels')
+            self.imviz.link_data(link_type='wcs')
+        assert mock_affine.call_count == 0
+        assert len(self.imviz.app._wcs_link_cache) == n_cached
+        assert sorted(tuple(link.offsets) for link in dc.external_links) == offsets
+        for link in dc.external_links:
+            assert all(cid.parent is link.data1 for cid in link.cids1)
+            assert all(cid.parent is link.data2 for cid in link.cids2)
+        assert self.viewer.get_link_type('has_wcs_2[SCI,1]') == 'wcs'
+
+    @pytest.mark.filterwarnings('ignore:Some non-standard WCS keywords were excluded')
+    def test_wcslink_cache_key(self):
+        data = self.imviz.app.data_collection['has_wcs_1[SCI,1]']
+        key = _wcs_cache_key(data)
+
+        # Same WCS and shape on another data entry share the cached link.
+        same = Data(x=np.zeros(data.shape), coords=data.coords.deepcopy())
+        assert _wcs_cache_key(same) == key
+
+        # Any change to the WCS, including distortion terms, changes the key.
+        w = data.coords.deepcopy()
+        w.wcs.ctype = ['RA---TAN-SIP', 'DEC--TAN-SIP']
+        w.sip = Sip(np.zeros((3, 3)), np.array([[0, 0, 0], [0, 1e-6, 0], [0, 0, 0]]),
+                    None, None, w.wcs.crpix)
+        assert _wcs_cache_key(Data(x=np.zeros(data.shape), coords=w)) != key
+
+        assert _wcs_cache_key(Data(x=np.zeros((3, 3)), coords=data.coords)) != key
+
     # Also test other exception handling here.
 
     def test_invalid_inputs(self):
@@ -221,6 +221,33 @@ class TestParseImage:
         with pytest.raises(ValueError, match='Do not manually overwrite data_label'):
             imviz_helper.load_data(flist, data_label='foo', show_in_viewer=False)
 
+    def test_list_of_inputs(self, imviz_helper, tmp_path):
+        inputs = []
+
+        # Same file names in different directories, read in worker processes.
+        for i in range(6):
+            fpath = tmp_path / f'dir{i % 2}' / f'myfits_{i // 2}.fits'
+            fpath.parent.mkdir(exist_ok=True)
+            hdulist = fits.HDUList([fits.PrimaryHDU(),
+                                    fits.ImageHDU(np.zeros((2, 2)) + i, name='SCI'),
+                                    fits.ImageHDU(np.ones((2, 2)), name='ERR')])
+            hdulist.writeto(fpath)
+            inputs.append(str(fpath))
+        inputs[-1] += '[ERR]'
+
+        # Inputs that are not FITS files are parsed in order with the rest.
+        inputs.insert(2, NDData(np.ones((2, 2))))
+
+        imviz_helper.load_data(inputs, n_cpu=2)
+
+        dc = imviz_helper.app.data_collection
+        assert dc.labels == ['myfits_0[SCI,1]', 'myfits_0[SCI,1] (1)', 'NDData[DATA]',
+                             'myfits_1[SCI,1]', 'myfits_1[SCI,1] (1)',
+                             'myfits_2[SCI,1]', 'myfits_2[ERR,1]']
+        for i, label in enumerate(dc.labels[:2] + dc.labels[3:6]):
+            assert_allclose(dc[label].get_component('SCI,1').data, i)
+        assert len(imviz_helper.default_viewer._obj.data()) == len(dc)
+
     def test_parse_asdf_in_fits_4d(self, imviz_helper, tmp_path):
         hdulist = fits.HDUList([
             fits.PrimaryHDU(),
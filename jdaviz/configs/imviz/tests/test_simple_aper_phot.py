@@ -1,7 +1,9 @@
 import pytest
 import numpy as np
 from astropy import units as u
+from astropy.coordinates import SkyCoord
 from astropy.io import fits
+from astropy.table import Table
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.utils.data import get_pkg_data_filename
 from numpy.testing import assert_allclose, assert_array_equal
@@ -11,7 +13,7 @@ from regions import (CircleAnnulusPixelRegion, CirclePixelRegion, EllipsePixelRe
                      RectanglePixelRegion, PixCoord)
 
 from jdaviz.configs.imviz.plugins.aper_phot_simple.aper_phot_simple import (
-    _curve_of_growth, _radial_profile)
+    _curve_of_growth, _nested_aperture_sums, _radial_profile)
 from jdaviz.configs.imviz.tests.utils import BaseImviz_WCS_WCS, BaseImviz_WCS_NoWCS
 
 
@@ -239,6 +241,52 @@ class TestSimpleAperPhot(BaseImviz_WCS_WCS):
         phot_plugin.vue_do_aper_phot()
         assert len(phot_plugin.table) == 5
 
+    def test_catalog_phot(self):
+        self.imviz.link_data(link_type='wcs')  # They are dithered by 1 pixel on X
+        self.imviz._apply_interactive_region('bqplot:truecircle', (0, 0), (9, 9))  # Draw a circle
+
+        # TODO: remove ._obj when API is made public
+        phot_plugin = self.imviz.plugins['Aperture Photometry']._obj
+        phot_plugin.aperture.selected = 'Subset 1'
+        phot_plugin.background_value = 0.5
+        expected = [phot_plugin.calculate_photometry(dataset=dataset, aperture='Subset 1',
+                                                     add_to_table=False, update_plots=False)[0]
+                    for dataset in phot_plugin.dataset.choices]
+
+        # one source per dataset at the same sky position, plus a smaller aperture
+        sky = expected[0]['sky_center'][0]
+        sources = Table({'sky_center': SkyCoord([sky, sky, sky]),
+                         'r': [4.5, 4.5, 2],
+                         'dataset': ['has_wcs_1[SCI,1]', 'has_wcs_2[SCI,1]', 'has_wcs_1[SCI,1]'],
+                         'subset_label': ['a', 'b', 'c']})
+        phot_table = phot_plugin.calculate_catalog_photometry(sources, background_value=0.5,
+                                                              add_to_table=True)
+        assert phot_table.colnames == expected[0].colnames
+        assert_array_equal(phot_table['id'], [1, 2, 3])
+        assert_array_equal(phot_table['subset_label'], ['a', 'b', 'c'])
+        for i in range(2):
+            assert phot_table['data_label'][i] == expected[i]['data_label'][0]
+            assert_allclose(phot_table['xcenter'][i], expected[i]['xcenter'][0])
+            assert_allclose(phot_table['sum'][i], expected[i]['sum'][0])
+            assert_allclose(phot_table['median'][i], expected[i]['median'][0])
+        assert_allclose(phot_table['sum'][2], (1 - 0.5) * np.pi * 2 ** 2)
+        assert len(phot_plugin.table) == 3
+
+        # same results from pixel positions and a pool of processes
+        sources = Table({'xcenter': phot_table['xcenter'], 'ycenter': phot_table['ycenter'],
+                         'r': [4.5, 4.5, 2], 'dataset': sources['dataset']})
+        phot_table_pool = phot_plugin.calculate_catalog_photometry(
+            sources, background_value=0.5, add_to_table=True, n_cpu=2)
+        assert_allclose(phot_table_pool['sum'], phot_table['sum'])
+        assert_array_equal(phot_table_pool['id'], [4, 5, 6])
+        assert len(phot_plugin.table) == 6
+
+        with pytest.raises(ValueError, match='aperture shape'):
+            phot_plugin.calculate_catalog_photometry(Table({'xcenter': [1], 'ycenter': [1]}))
+        with pytest.raises(ValueError, match='dataset must be one of'):
+            phot_plugin.calculate_catalog_photometry(
+                Table({'xcenter': [1], 'ycenter': [1], 'r': [1], 'dataset': ['DNE']}))
+
 
 class TestSimpleAperPhot_NoWCS(BaseImviz_WCS_NoWCS):
     def test_plugin_no_wcs(self):
@@ -477,3 +525,31 @@ def test_curve_of_growth(with_unit):
     with pytest.raises(TypeError, match='Unsupported aperture'):
         _curve_of_growth(data, cen, EllipticalAnnulus(cen, 3, 8, 5), 100,
                          pixarea_fac=pixarea_fac)
+
+
+@pytest.mark.parametrize('aperture', [
+    CircularAperture((20.3, 18.6), 12),
+    EllipticalAperture((20.3, 18.6), 12, 7, theta=0.5),
+    EllipticalAperture((3.5, 35.2), 6, 9, theta=33 * u.deg),  # partially outside the image
+    RectangularAperture((20.3, 18.6), 12, 8, theta=0.3)])
+def test_nested_aperture_sums(aperture):
+    data = np.random.default_rng(0).normal(size=(40, 40)) + 5
+    data[20, 22] = np.nan  # excluded like in ApertureStats
+    params = [getattr(aperture, param) for param in aperture._params[1:]]
+    sizes = np.linspace(0, params[0], 21)[1:]
+
+    expected = []
+    for size in sizes:
+        scaled = [param * size / params[0] for param in params[:2]]
+        if isinstance(aperture, CircularAperture):
+            cur_aper = CircularAperture(aperture.positions, *scaled[:1])
+        else:
+            cur_aper = aperture.__class__(aperture.positions, *scaled, theta=aperture.theta)
+        expected.append(ApertureStats(data, cur_aper, local_bkg=1).sum)
+
+    sums = _nested_aperture_sums(data, aperture.positions, aperture, sizes, background=1)
+    assert_allclose(sums, expected)
+
+    sums = _nested_aperture_sums(data << u.Jy, aperture.positions, aperture, sizes,
+                                 background=1 * u.Jy)
+    assert_quantity_allclose(sums, expected * u.Jy)
@@ -1,5 +1,7 @@
 import numpy as np
 from numpy.testing import assert_allclose
+from glue.core.component_id import ComponentID
+from glue.core.component_link import ComponentLink
 from regions import RectanglePixelRegion
 
 from jdaviz.configs.imviz.tests.utils import BaseImviz_WCS_WCS
@@ -131,6 +133,35 @@ def test_blink(imviz_helper):
     assert viewer.top_visible_data_label == 'image_2'
 
 
+def test_mouseover_derived_component(imviz_helper):
+    arr = np.arange(2048 * 2048, dtype=float).reshape(2048, 2048)
+    imviz_helper.load_data(arr, data_label='image')
+    data = imviz_helper.app.data_collection['image']
+
+    computed_sizes = []
+
+    def _double(values):
+        computed_sizes.append(np.size(values))
+        return 2 * values
+
+    double_id = ComponentID('double')
+    data.add_component_link(ComponentLink([data.id['DATA']], double_id, using=_double))
+    viewer = imviz_helper.default_viewer._obj
+    viewer.state.layers[0].attribute = double_id
+    computed_sizes.clear()
+
+    label_mouseover = imviz_helper.app.session.application._tools['g-coords-info']
+    rng = np.random.default_rng(0)
+    for x, y in rng.integers(0, 2048, (1000, 2)):
+        label_mouseover._viewer_mouse_event(viewer,
+                                            {'event': 'mousemove', 'domain': {'x': x, 'y': y}})
+        assert label_mouseover.as_dict()['value'] == 2 * arr[y, x]
+
+    # only the element under the cursor is ever computed
+    assert len(computed_sizes) >= 1000
+    assert set(computed_sizes) == {1}
+
+
 def test_compass_open_while_load(imviz_helper):
     plg = imviz_helper.plugins['Compass']
     plg._obj.plugin_opened = True
@@ -1,5 +1,8 @@
 import os
 import warnings
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from zipfile import is_zipfile
@@ -11,6 +14,7 @@ from astropy.table import QTable
 from echo import delay_callback
 from glue.core.data import Data
 from glue.core.exceptions import IncompatibleAttribute
+from glue.core.link_helpers import LinkSameWithUnits
 
 from jdaviz.core.helpers import ConfigHelper
 from jdaviz.core.events import SnackbarMessage, TableClickMessage, RedshiftMessage, RowLockMessage
@@ -19,8 +23,10 @@ from jdaviz.configs.specviz.helper import _apply_redshift_to_spectra
 from jdaviz.configs.specviz2d import Specviz2d
 from jdaviz.configs.mosviz.plugins import jwst_header_to_skyregion
 from jdaviz.configs.mosviz.plugins.parsers import (
-    FALLBACK_NAME, mos_spec1d_parser, mos_spec2d_parser)
+    FALLBACK_NAME, mos_spec1d_parser, mos_spec2d_parser, _lazy_product_meta,
+    _read_mos_product)
 from jdaviz.configs.default.plugins.line_lists.line_list_mixin import LineListMixin
+from jdaviz.utils import standardize_metadata
 
 __all__ = ['Mosviz']
 
@@ -34,6 +40,11 @@ class Mosviz(ConfigHelper, LineListMixin):
     _default_spectrum_2d_viewer_reference_name = "spectrum-2d-viewer"
     _default_table_viewer_reference_name = "table-viewer"
 
+    # Lazy loading: number of rows that stay loaded after being selected, and number
+    # of rows before and after the selected row that are read in the background.
+    _lazy_cache_size = 5
+    _lazy_prefetch_rows = 1
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -76,6 +87,15 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         self._update_in_progress = False
 
+        # Lazy loading: data products by data label (see ``_add_lazy_products``),
+        # data labels of the loaded rows (least recently selected first), and rows
+        # being read in the background.
+        self._lazy_products = {}
+        self._lazy_rows = OrderedDict()
+        self._lazy_prefetch = {}
+        self._lazy_executor = None
+        self._lazy_finalizer = None
+
         self._initialize_table()
         self._default_visible_columns = []
 
@@ -96,10 +116,144 @@ class Mosviz(ConfigHelper, LineListMixin):
         # Add the table to the table viewer
         self.app.get_viewer(table_viewer_reference_name).add_data(table_data)
 
+    def _lazy_row_labels(self, row):
+        table_data = self.app.data_collection['MOS Table']
+        labels = []
+        for column in ('1D Spectra', '2D Spectra', 'Images'):
+            if table_data.find_component_id(column) is None:
+                continue
+            label = table_data.get_component(column).data[row]
+            if label in self._lazy_products:
+                labels.append(label)
+        return labels
+
+    def _read_lazy_products(self, labels, app=None):
+        parsed = {}
+        for label in labels:
+            product = self._lazy_products[label]
+            parsed[label] = _read_mos_product(product['column'], product['data_obj'],
+                                              app=app, **product['read_kwargs'])
+        return parsed
+
+    def _load_lazy_row(self, row, keep_row=None):
+        """
+        Parse the data products of a row of the table (if not yet loaded) and add them
+        to the data collection, then unload the least recently selected rows (except
+        for ``keep_row``, e.g., the row shown in the viewers) that exceed the cache size.
+        """
+        labels = self._lazy_row_labels(row)
+        dc_labels = self.app.data_collection.labels
+        to_load = [label for label in labels if label not in dc_labels]
+
+        if to_load:
+            parsed = {}
+            future = self._lazy_prefetch.pop(row, None)
+            if future is not None:
+                try:
+                    parsed = future.result()
+                except Exception:
+                    # read again below so the error is raised from here
+                    pass
+            missing = [label for label in to_load if label not in parsed]
+            parsed.update(self._read_lazy_products(missing, app=self.app))
+
+            auto_link = self.app.auto_link
+            self.app.auto_link = False
+            try:
+                with self.app.data_collection.delay_link_manager_update():
+                    for label in to_load:
+                        column = self._lazy_products[label]['column']
+                        data = parsed[label]
+                        if column == 'Images':
+                            data.label = label
+                        else:
+                            # Make metadata layout conform with other viz.
+                            data.meta = standardize_metadata(data.meta)
+                        if column == '2D Spectra':
+                            # TODO: this should not be set to nirspec for all datasets
+                            data.meta['INSTRUME'] = 'nirspec'
+                        data.meta['mosviz_row'] = row
+
+                        if column == '2D Spectra':
+                            self.app.data_collection[label] = data
+                        else:
+                            self.app.add_data(data, label, notify_done=False)
+
+                    # Link the 1D spectrum with its corresponding 2D spectrum, as is
+                    # done for all rows at once by link_table_data
+                    columns = {self._lazy_products[label]['column']: label
+                               for label in labels}
+                    if '1D Spectra' in columns and '2D Spectra' in columns:
+                        dc = self.app.data_collection
+                        wc_spec_1d = dc[columns['1D Spectra']].world_component_ids
+                        wc_spec_2d = dc[columns['2D Spectra']].world_component_ids
+                        dc.add_link(LinkSameWithUnits(wc_spec_1d[0], wc_spec_2d[1]))
+            finally:
+                self.app.auto_link = auto_link
+
+        self._lazy_rows[row] = labels
+        self._lazy_rows.move_to_end(row)
+
+        n_evict = len(self._lazy_rows) - max(self._lazy_cache_size, 1)
+        evict_rows = [r for r in self._lazy_rows if r not in (row, keep_row)][:max(n_evict, 0)]
+        if not evict_rows:
+            return
+        for evict_row in evict_rows:
+            del self._lazy_rows[evict_row]
+        # Data products can be in more than one row (e.g., a shared image)
+        keep_labels = set(label for labels in self._lazy_rows.values() for label in labels)
+        with self.app.data_collection.delay_link_manager_update():
+            for data in list(self.app.data_collection):
+                if data.label in self._lazy_products and data.label not in keep_labels:
+                    self.app.data_collection.remove(data)
+
+    def _prefetch_lazy_rows(self, row):
+        """
+        Read the data products of the rows next to ``row`` in the background, so they
+        can be added as soon as the next or previous row is selected.
+        """
+        nrows = int(self.app.data_collection['MOS Table'].size)
+        rows = set((row + offset) % nrows
+                   for offset in range(-self._lazy_prefetch_rows, self._lazy_prefetch_rows + 1)
+                   if offset != 0)
+
+        # stop reading rows that are no longer neighbors
+        for prefetch_row in list(self._lazy_prefetch):
+            if prefetch_row not in rows:
+                self._lazy_prefetch.pop(prefetch_row).cancel()
+
+        dc_labels = self.app.data_collection.labels
+        for prefetch_row in sorted(rows - set(self._lazy_prefetch) - set(self._lazy_rows)):
+            labels = [label for label in self._lazy_row_labels(prefetch_row)
+                      if label not in dc_labels]
+            if not labels:
+                continue
+            if self._lazy_executor is None:
+                self._lazy_executor = ThreadPoolExecutor(max_workers=1)
+                # Make sure the thread does not outlive the helper.
+                self._lazy_finalizer = weakref.finalize(
+                    self, self._lazy_executor.shutdown, wait=False, cancel_futures=True)
+            self._lazy_prefetch[prefetch_row] = self._lazy_executor.submit(
+                self._read_lazy_products, labels)
+
+    def _stop_lazy_prefetch(self):
+        """Cancel the background reads of rows and stop their thread."""
+        for future in self._lazy_prefetch.values():
+            future.cancel()
+        self._lazy_prefetch = {}
+        if self._lazy_finalizer is not None:
+            self._lazy_finalizer()
+        self._lazy_executor = None
+        self._lazy_finalizer = None
+
     def _row_lock_changed(self, msg):
         self._freeze_states_on_row_change = msg.is_locked
 
     def _on_row_selected_begin(self, event):
+        if self._lazy_products:
+            self._load_lazy_row(event['new'], keep_row=event['old'])
+            self._prefetch_lazy_rows(event['new'])
+
         self._redshift_cache = self.get_column("Redshift")[event['new']]
 
         if not self._freeze_states_on_row_change:
@@ -237,6 +391,16 @@ class Mosviz(ConfigHelper, LineListMixin):
         return pix, pixel_height
 
     def _add_redshift_column(self):
+        def _get_sp_value(data_label, attr, default=None):
+            if data_label in self._lazy_products:
+                product = self._lazy_products[data_label]
+                if isinstance(product['data_obj'], (str, Path)):
+                    # spectra that are not loaded yet are only read from files when needed,
+                    # so use the value from their (indexed) headers
+                    return _lazy_product_meta(product).get(attr.upper(), default)
+                return getattr(product['data_obj'], attr, default)
+            return getattr(self.app.data_collection[data_label].get_object(), attr, default)
+
         # Parse any information from the files into columns in the table
         def _get_sp_attribute(table_data, row, attr, fill=None):
             try:
@@ -244,16 +408,14 @@ class Mosviz(ConfigHelper, LineListMixin):
             except IncompatibleAttribute:
                 sp1_val = None
             else:
-                sp1 = self.app.data_collection[sp1_name].get_object()
-                sp1_val = getattr(sp1, attr, None)
+                sp1_val = _get_sp_value(sp1_name, attr)
 
             try:
                 sp2_name = table_data['2D Spectra'][row]
             except IncompatibleAttribute:
                 sp2_val = None
             else:
-                sp2 = self.app.data_collection[sp2_name].get_object()
-                sp2_val = getattr(sp2, attr, sp1_val)
+                sp2_val = _get_sp_value(sp2_name, attr, sp1_val)
 
             if sp1_val is not None and sp1_val != sp2_val:
                 # then there was a conflict
@@ -268,13 +430,13 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         table_data = self.app.data_collection['MOS Table']
         redshifts = np.asarray([_get_sp_attribute(table_data, row, 'redshift', 0)
-                                for row in range(int(table_data.size))])
+                                for row in range(int(table_data.size))], dtype=float)
         self._add_or_update_column(column_name='Redshift', data=redshifts,
                                    show=np.any(redshifts != 0))
 
     def load_data(self, spectra_1d=None, spectra_2d=None, images=None,
                   spectra_1d_label=None, spectra_2d_label=None,
-                  images_label=None, directory=None, instrument=None):
+                  images_label=None, directory=None, instrument=None, lazy=False):
         """
         Load and parse a set of MOS spectra and images.
 
@@ -317,7 +479,16 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         instrument : {'niriss', 'nircam', 'nirspec'}, optional
             Required and only used if ``directory`` is specified. Value is not case sensitive.
+
+        lazy : bool, optional
+            If `True`, only build the table (with the metadata read from the FITS headers)
+            and parse the spectra and images of a row when it is selected.  A few of the
+            recently selected rows are kept loaded, and the next and previous rows are
+            read in the background.  Not supported for NIRISS and NIRCam directories.
         """
+        # Rows being read in the background may no longer be next to the selected row
+        self._stop_lazy_prefetch()
+
         # Link data after everything is loaded
         self.app.auto_link = False
         allow_link_table = True
@@ -339,7 +510,11 @@ class Mosviz(ConfigHelper, LineListMixin):
                         "Ambiguous MOS Instrument: Only JWST NIRSpec, NIRCam, and "
                         f"NIRISS folder parsing are currently supported but got '{instrument}'")
                 if instrument == "nirspec":
-                    super().load_data(directory, parser_reference="mosviz-nirspec-directory-parser")
+                    super().load_data(directory, parser_reference="mosviz-nirspec-directory-parser",
+                                      lazy=lazy)
+                elif lazy:
+                    raise NotImplementedError(
+                        f"Lazy loading is not supported for {instrument.upper()} directories")
                 else:  # niriss or nircam
                     self.load_jwst_directory(directory, instrument=instrument)
             else:
@@ -349,71 +524,72 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         elif (spectra_1d is not None and spectra_2d is not None
                 and images is not None):
-            n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label)
-            self.load_2d_spectra(spectra_2d, spectra_2d_label)
+            n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label, lazy=lazy)
+            self.load_2d_spectra(spectra_2d, spectra_2d_label, lazy=lazy)
 
             # If we have a single image for multiple spectra, tell the table viewer.
             if single_image:
                 self._shared_image = True
                 self.app.get_viewer(self._default_table_viewer_reference_name)._shared_image = True
                 if n_specs > 1:
-                    self.load_images(images, images_label, share_image=n_specs)
+                    self.load_images(images, images_label, share_image=n_specs, lazy=lazy)
                 else:
-                    self.load_images(images, images_label)
+                    self.load_images(images, images_label, lazy=lazy)
             else:
-                self.load_images(images, images_label)
+                self.load_images(images, images_label, lazy=lazy)
 
             self.load_metadata()
 
         elif spectra_1d is not None and spectra_2d is not None:
-            self.load_1d_spectra(spectra_1d, spectra_1d_label)
-            self.load_2d_spectra(spectra_2d, spectra_2d_label)
+            self.load_1d_spectra(spectra_1d, spectra_1d_label, lazy=lazy)
+            self.load_2d_spectra(spectra_2d, spectra_2d_label, lazy=lazy)
             self.load_metadata()
 
         elif spectra_1d and images:
-            n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label)
+            n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label, lazy=lazy)
 
             # If we have a single image for multiple spectra, tell the table viewer.
             if single_image:
                 self._shared_image = True
                 self.app.get_viewer(self._default_table_viewer_reference_name)._shared_image = True
                 if n_specs > 1:
-                    self.load_images(images, images_label, share_image=n_specs)
+                    self.load_images(images, images_label, share_image=n_specs, lazy=lazy)
                 else:
-                    self.load_images(images, images_label)
+                    self.load_images(images, images_label, lazy=lazy)
             else:
-                self.load_images(images, images_label)
+                self.load_images(images, images_label, lazy=lazy)
 
             allow_link_table = False
 
         elif spectra_2d and images:
-            n_specs = self.load_2d_spectra(spectra_2d, spectra_2d_label)
+            n_specs = self.load_2d_spectra(spectra_2d, spectra_2d_label, lazy=lazy)
 
             # If we have a single image for multiple spectra, tell the table viewer.
             if single_image:
                 self._shared_image = True
                 self.app.get_viewer(self._default_table_viewer_reference_name)._shared_image = True
                 if n_specs > 1:
-                    self.load_images(images, images_label, share_image=n_specs)
+                    self.load_images(images, images_label, share_image=n_specs, lazy=lazy)
                 else:
-                    self.load_images(images, images_label)
+                    self.load_images(images, images_label, lazy=lazy)
             else:
-                self.load_images(images, images_label)
+                self.load_images(images, images_label, lazy=lazy)
 
             allow_link_table = False
 
         elif spectra_1d:
-            self.load_1d_spectra(spectra_1d, spectra_1d_label)
+            self.load_1d_spectra(spectra_1d, spectra_1d_label, lazy=lazy)
             allow_link_table = False
 
         elif spectra_2d:
-            self.load_2d_spectra(spectra_2d, spectra_2d_label)
+            self.load_2d_spectra(spectra_2d, spectra_2d_label, lazy=lazy)
             allow_link_table = False
 
         else:
             raise NotImplementedError("Please set valid values for the Mosviz.load_data() method")
 
-        if allow_link_table:
+        # With lazy loading, the spectra in each row are linked when the row is loaded
+        if allow_link_table and not lazy:
             self.link_table_data(None)
 
         self._add_redshift_column()
@@ -490,7 +666,8 @@ class Mosviz(ConfigHelper, LineListMixin):
         """
         self.app.load_data(file_obj=None, parser_reference="mosviz-metadata-parser")
 
-    def load_1d_spectra(self, data_obj, data_labels=None, add_redshift_column=False):
+    def load_1d_spectra(self, data_obj, data_labels=None, add_redshift_column=False,
+                        lazy=False):
         """
         Load and parse a set of 1D spectra objects.
 
@@ -506,6 +683,8 @@ class Mosviz(ConfigHelper, LineListMixin):
             for each item in ``data_obj`` if  ``data_obj`` is a list.
         add_redshift_column : bool
             Add redshift column to Mosviz table.
+        lazy : bool
+            Only parse the spectra when their row is selected, see `load_data`.
 
         Returns
         -------
@@ -513,12 +692,13 @@ class Mosviz(ConfigHelper, LineListMixin):
             Number of data objects loaded.
 
         """
-        n_specs = mos_spec1d_parser(self.app, data_obj, data_labels=data_labels)
+        n_specs = mos_spec1d_parser(self.app, data_obj, data_labels=data_labels, lazy=lazy)
         if add_redshift_column:
             self._add_redshift_column()
         return n_specs
 
-    def load_2d_spectra(self, data_obj, data_labels=None, add_redshift_column=False):
+    def load_2d_spectra(self, data_obj, data_labels=None, add_redshift_column=False,
+                        lazy=False):
         """
         Load and parse a set of 2D spectra objects.
 
@@ -534,6 +714,8 @@ class Mosviz(ConfigHelper, LineListMixin):
             for each item in ``data_obj`` if  ``data_obj`` is a list.
         add_redshift_column : bool
             Add redshift column to Mosviz table.
+        lazy : bool
+            Only parse the spectra when their row is selected, see `load_data`.
 
         Returns
         -------
@@ -541,7 +723,7 @@ class Mosviz(ConfigHelper, LineListMixin):
             Number of data objects loaded.
 
         """
-        n_specs = mos_spec2d_parser(self.app, data_obj, data_labels=data_labels)
+        n_specs = mos_spec2d_parser(self.app, data_obj, data_labels=data_labels, lazy=lazy)
         if add_redshift_column:
             self._add_redshift_column()
         return n_specs
@@ -559,7 +741,8 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         self.app.auto_link = True
 
-    def load_images(self, data_obj, data_labels=None, share_image=0, add_redshift_column=False):
+    def load_images(self, data_obj, data_labels=None, share_image=0, add_redshift_column=False,
+                    lazy=False):
         """
         Load and parse a set of image objects. If providing a file path, it
         must be readable by ``astropy.io.fits``.
@@ -582,9 +765,11 @@ class Mosviz(ConfigHelper, LineListMixin):
             spectra.
         add_redshift_column : bool
             Add redshift column to Mosviz table.
+        lazy : bool
+            Only parse the images when their row is selected, see `load_data`.
         """
         super().load_data(data_obj, parser_reference="mosviz-image-parser",
-                          data_labels=data_labels, share_image=share_image)
+                          data_labels=data_labels, share_image=share_image, lazy=lazy)
         if add_redshift_column:
             self._add_redshift_column()
 
@@ -891,6 +1076,9 @@ class Mosviz(ConfigHelper, LineListMixin):
             raise ValueError(f"row must be between 0 and {len(data_labels)-1}")
 
         data_label = data_labels[row]
+        if data_label in self._lazy_products:
+            table = self.app.get_viewer(self._default_table_viewer_reference_name)
+            self._load_lazy_row(row, keep_row=table.current_row)
         spectra = self.app.data_collection[data_label].get_object()
         if not apply_slider_redshift:
             return spectra
@@ -1,5 +1,7 @@
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 import csv
+import json
 import os
 from pathlib import Path
 import warnings
@@ -21,6 +23,12 @@ from jdaviz.utils import standardize_metadata, PRIHDR_KEY
 __all__ = ['mos_spec1d_parser', 'mos_spec2d_parser', 'mos_image_parser']
 
 FALLBACK_NAME = "Unspecified"
+# Sidecar file in the data directory with the header keywords indexed by _index_mos_directory
+MOS_INDEX_FILENAME = ".jdaviz_mos_index.json"
+MOS_INDEX_VERSION = 1
+# Header keywords used to sort the files of a directory and fill in the MOS table
+MOS_INDEX_KEYS = ('DATAMODL', 'FILTER', 'PUPIL', 'GRATING', 'S_WCS', 'SOURCEID', 'OBJECT',
+                  'SRCRA', 'SRCDEC', 'OBJ_RA', 'OBJ_DEC', 'REDSHIFT')
 EXPECTED_FILES = {"niriss": ['1D Spectra C', '1D Spectra R',
                              '2D Spectra C', '2D Spectra R',
                              'Direct Image'],
@@ -107,6 +115,130 @@ def _fields_from_ecsv(fname, fields, delimiter=","):
     return parsed_fields
 
 
+def _spec1d_labels(data_labels, n_data):
+    if isinstance(data_labels, str):
+        data_labels = [data_labels]
+
+    if data_labels is None:
+        data_labels = [f"1D Spectrum {i}" for i in range(n_data)]
+    elif n_data != len(data_labels):
+        data_labels = [f"{data_labels[0]} {i}" for i in range(n_data)]
+    return data_labels
+
+
+def _spec2d_labels(data_labels, n_data):
+    # If we're given a string, repeat it for each object
+    if isinstance(data_labels, str):
+        if n_data > 1:
+            data_labels = [f"{data_labels} {i}" for i in range(n_data)]
+        else:
+            data_labels = [data_labels]
+    elif data_labels is None:
+        if n_data > 1:
+            data_labels = [f"2D Spectrum {i}" for i in range(n_data)]
+        else:
+            data_labels = ['2D Spectrum']
+    return data_labels
+
+
+def _image_labels(data_labels, n_data, share_image=0):
+    if data_labels is None:
+        if share_image:
+            data_labels = ["Shared Image"]
+        else:
+            data_labels = [f"Image {i}" for i in range(n_data)]
+
+    elif isinstance(data_labels, str):
+        if share_image:
+            data_labels = [data_labels]
+        else:
+            data_labels = [f"{data_labels} {i}" for i in range(n_data)]
+    return data_labels
+
+
+def _add_lazy_products(app, column, data_obj, data_labels, **read_kwargs):
+    """
+    Record the data products of a MOS table column for lazy loading, so that they are
+    only parsed (see ``_read_mos_product``) and added to the data collection when their
+    row is selected.
+    """
+    lazy_products = app._jdaviz_helper._lazy_products
+    for cur_data, cur_label in zip(data_obj, data_labels):
+        lazy_products[cur_label] = {'column': column, 'data_obj': cur_data,
+                                    'read_kwargs': read_kwargs, 'meta': None}
+
+
+def _add_index_to_lazy_products(app, directory):
+    """
+    Use the header keywords indexed by ``_index_mos_directory`` as the metadata of the lazy
+    data products read from files in ``directory``, instead of reading each of their headers.
+    """
+    directory = Path(directory)
+    index = _index_mos_directory(directory)
+    for product in app._jdaviz_helper._lazy_products.values():
+        if not isinstance(product['data_obj'], (str, Path)):
+            continue
+        filepath = Path(product['data_obj'])
+        if filepath.parent == directory and filepath.name in index:
+            product['meta'] = _index_meta(index[filepath.name])
+
+
+def _lazy_product_meta(product):
+    """
+    Metadata of a lazy data product, from the indexed headers (see
+    ``_add_index_to_lazy_products``) or else read only from its headers.
+    """
+    if product['meta'] is None:
+        product['meta'] = _read_mos_header_meta(
+            product['data_obj'], ext=product['read_kwargs'].get('ext', 1))
+    return product['meta']
+
+
+def _is_spectrum_list_file(filename):
+    """
+    Whether the file cannot be read as a single `~specutils.Spectrum1D` (e.g., it has
+    multiple spectra), and so is read as a `~specutils.SpectrumList` instead.
+    """
+    formats = Spectrum1D.read.registry.identify_format(
+        'read', Spectrum1D, filename, None, [], {})
+    return len(formats) != 1
+
+
+def _read_mos_product(column, data_obj, app=None, **read_kwargs):
+    """
+    Parse a single data product of the MOS table column into an object that can be
+    added to the data collection.  This does not modify the app, so it can be used to
+    read data products in the background (in which case ``app`` should be `None`).
+    """
+    if column == '1D Spectra':
+        return Spectrum1D.read(data_obj) if _check_is_file(data_obj) else data_obj
+    elif column == '2D Spectra':
+        return _parse_spec2d(data_obj, **read_kwargs)
+    elif isinstance(data_obj, str):
+        return _load_fits_image_from_filename(data_obj, app)[0]
+    else:
+        return [d for d, _ in get_image_data_iterator(app, data_obj, "Image", ext=None)][0]
+
+
+def _read_mos_header_meta(data_obj, ext=1):
+    """
+    Metadata of a single data product of the MOS table, read only from the primary and
+    ``ext`` headers if a FITS file (or HDUList) is given.  Like the JWST readers, keywords
+    in the extension header take precedence.
+    """
+    if _check_is_file(data_obj):
+        with fits.open(data_obj) as hdulist:
+            return _read_mos_header_meta(hdulist, ext=ext)
+    elif isinstance(data_obj, fits.HDUList):
+        header = data_obj[0].header.copy()
+        if len(data_obj) > ext:
+            header.extend(data_obj[ext].header, strip=True, update=True)
+        return standardize_metadata(header)
+    elif isinstance(getattr(data_obj, 'meta', None), (dict, fits.Header)):
+        return standardize_metadata(data_obj.meta)
+    return {}
+
+
 @data_parser_registry("mosviz-link-data")
 def link_data_in_table(app, data_obj=None):
     """
@@ -146,7 +278,7 @@ def link_data_in_table(app, data_obj=None):
 
 
 @data_parser_registry("mosviz-nirspec-directory-parser")
-def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
+def mos_nirspec_directory_parser(app, data_obj, data_labels=None, lazy=False):
 
     spectra_1d = []
     spectra_2d = []
@@ -160,8 +292,8 @@ def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
         elif 's2d' in file_path:
             spectra_2d.append(file_path)
 
-    n_specs = mos_spec1d_parser(app, spectra_1d)
-    mos_spec2d_parser(app, spectra_2d)
+    n_specs = mos_spec1d_parser(app, spectra_1d, lazy=lazy)
+    mos_spec2d_parser(app, spectra_2d, lazy=lazy)
 
     # Load images, if present
     image_path = None
@@ -185,21 +317,28 @@ def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
                 kwargs = {'share_image': n_specs}
             else:
                 kwargs = {}
-            mos_image_parser(app, str(images[0]), **kwargs)
+            mos_image_parser(app, str(images[0]), lazy=lazy, **kwargs)
         elif n_images == n_specs:
-            mos_image_parser(app, list(map(str, images)))
+            mos_image_parser(app, list(map(str, images)), lazy=lazy)
         else:
             app.hub.broadcast(SnackbarMessage(
                 "The number of images in this directory does not match the "
                 "number of spectra 1d and 2d files, please make the "
                 "amounts equal or load images separately.", color='warning', sender=app))
 
+    if lazy:
+        # The metadata in the table is taken from the headers, which are indexed
+        # once for all the files
+        _add_index_to_lazy_products(app, level3_path)
+        if image_path is not None:
+            _add_index_to_lazy_products(app, image_path)
+
     mos_meta_parser(app)
 
 
 @data_parser_registry("mosviz-spec1d-parser")
 def mos_spec1d_parser(app, data_obj, data_labels=None,
-                      table_viewer_reference_name='table-viewer'):
+                      table_viewer_reference_name='table-viewer', lazy=False):
     """
     Attempts to parse a 1D spectrum object.
 
@@ -212,6 +351,9 @@ def mos_spec1d_parser(app, data_obj, data_labels=None,
         the mosviz table.
     data_labels : str, optional
         The label applied to the glue data component.
+    lazy : bool, optional
+        Only add the data labels to the mosviz table, the spectra are parsed
+        when their row is selected.
 
     Returns
     -------
@@ -219,13 +361,20 @@ def mos_spec1d_parser(app, data_obj, data_labels=None,
         Number of data objects loaded.
 
     """
-    if isinstance(data_labels, str):
-        data_labels = [data_labels]
-
     # Coerce into list if needed
     if not isinstance(data_obj, (list, tuple, SpectrumCollection)):
         data_obj = [data_obj]
 
+    # A single file with multiple spectra is read right away (as a SpectrumList below),
+    # since each of its spectra is a row in the table
+    if lazy and not (len(data_obj) == 1 and _check_is_file(data_obj[0]) and
+                     _is_spectrum_list_file(data_obj[0])):
+        data_labels = _spec1d_labels(data_labels, len(data_obj))
+        _add_lazy_products(app, '1D Spectra', data_obj, data_labels)
+        _add_to_table(app, data_labels, '1D Spectra',
+                      table_viewer_reference_name=table_viewer_reference_name)
+        return len(data_obj)
+
     # If the file has multiple objects in it, the Spectrum1D read machinery
     # will fail to find a reader for it, and we fall back on SpectrumList
     try:
@@ -235,10 +384,7 @@ def mos_spec1d_parser(app, data_obj, data_labels=None,
             if _check_is_file(data_obj[0]):
                 data_obj = SpectrumList.read(data_obj[0])
 
-    if data_labels is None:
-        data_labels = [f"1D Spectrum {i}" for i in range(len(data_obj))]
-    elif len(data_obj) != len(data_labels):
-        data_labels = [f"{data_labels[0]} {i}" for i in range(len(data_obj))]
+    data_labels = _spec1d_labels(data_labels, len(data_obj))
 
     # Handle the case where the 1d spectrum is a collection of spectra
 
@@ -257,9 +403,53 @@ def mos_spec1d_parser(app, data_obj, data_labels=None,
     return len(data_obj)
 
 
+def _parse_as_spectrum1d(hdulist, ext, transpose):
+    # Parse as a FITS file and assume the WCS is correct
+    data = hdulist[ext].data
+    header = hdulist[ext].header
+    metadata = standardize_metadata(header)
+    metadata[PRIHDR_KEY] = standardize_metadata(hdulist[0].header)
+    wcs = WCS(header, hdulist)
+    if transpose:
+        data = data.T
+        wcs = wcs.swapaxes(0, 1)
+
+    try:
+        data_unit = u.Unit(header['BUNIT'])
+    except Exception:
+        data_unit = u.count
+
+    # FITS WCS is invalid, so ignore it.
+    if wcs.spectral.naxis == 0:
+        kw = {}
+    else:
+        kw = {'wcs': wcs}
+
+    return Spectrum1D(flux=data * data_unit, meta=metadata, **kw)
+
+
+def _parse_spec2d(data, ext=1, transpose=False):
+    # If we got a filepath, first try and parse using the Spectrum1D and
+    # SpectrumList parsers, and then fall back to parsing it as a generic
+    # FITS file.
+    if _check_is_file(data):
+        try:
+            if ext != 1 or transpose:
+                with fits.open(data) as hdulist:
+                    data = _parse_as_spectrum1d(hdulist, ext, transpose)
+            else:
+                data = Spectrum1D.read(data)
+        except IORegistryError:
+            with fits.open(data) as hdulist:
+                data = _parse_as_spectrum1d(hdulist, ext, transpose)
+    elif isinstance(data, fits.HDUList):
+        data = _parse_as_spectrum1d(data, ext, transpose)
+    return data
+
+
 @data_parser_registry("mosviz-spec2d-parser")
 def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
-                      show_in_viewer=False, ext=1, transpose=False):
+                      show_in_viewer=False, ext=1, transpose=False, lazy=False):
     """
     Attempts to parse a 2D spectrum object.
 
@@ -281,6 +471,9 @@ def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
         The extension in the FITS file that contains the data to be loaded.
     transpose : bool, optional
         Flag to transpose the data array before loading.
+    lazy : bool, optional
+        Only add the data labels to the mosviz table, the spectra are parsed
+        when their row is selected.
 
     Returns
     -------
@@ -295,31 +488,6 @@ def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
         app._jdaviz_helper._default_table_viewer_reference_name
     )
 
-    # Note: This is also used by Specviz2D
-    def _parse_as_spectrum1d(hdulist, ext, transpose):
-        # Parse as a FITS file and assume the WCS is correct
-        data = hdulist[ext].data
-        header = hdulist[ext].header
-        metadata = standardize_metadata(header)
-        metadata[PRIHDR_KEY] = standardize_metadata(hdulist[0].header)
-        wcs = WCS(header, hdulist)
-        if transpose:
-            data = data.T
-            wcs = wcs.swapaxes(0, 1)
-
-        try:
-            data_unit = u.Unit(header['BUNIT'])
-        except Exception:
-            data_unit = u.count
-
-        # FITS WCS is invalid, so ignore it.
-        if wcs.spectral.naxis == 0:
-            kw = {}
-        else:
-            kw = {'wcs': wcs}
-
-        return Spectrum1D(flux=data * data_unit, meta=metadata, **kw)
-
     # Coerce into list-like object
     if (not isinstance(data_obj, (list, tuple, SpectrumCollection)) or
             isinstance(data_obj, fits.HDUList)):
@@ -330,35 +498,21 @@ def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
         if identify_jwst_s2d_multi_fits("test", data_obj[0]):
             data_obj = SpectrumList.read(data_obj[0])
 
-    # If we're given a string, repeat it for each object
-    if isinstance(data_labels, str):
-        if len(data_obj) > 1:
-            data_labels = [f"{data_labels} {i}" for i in range(len(data_obj))]
-        else:
-            data_labels = [data_labels]
-    elif data_labels is None:
-        if len(data_obj) > 1:
-            data_labels = [f"2D Spectrum {i}" for i in range(len(data_obj))]
-        else:
-            data_labels = ['2D Spectrum']
+    data_labels = _spec2d_labels(data_labels, len(data_obj))
+
+    if lazy:
+        _add_lazy_products(app, '2D Spectra', data_obj, data_labels,
+                           ext=ext, transpose=transpose)
+        if add_to_table:
+            _add_to_table(
+                app, data_labels, '2D Spectra',
+                table_viewer_reference_name=table_viewer_reference_name
+            )
+        return len(data_obj)
 
     with app.data_collection.delay_link_manager_update():
         for index, data in enumerate(data_obj):
-            # If we got a filepath, first try and parse using the Spectrum1D and
-            # SpectrumList parsers, and then fall back to parsing it as a generic
-            # FITS file.
-            if _check_is_file(data):
-                try:
-                    if ext != 1 or transpose:
-                        with fits.open(data) as hdulist:
-                            data = _parse_as_spectrum1d(hdulist, ext, transpose)
-                    else:
-                        data = Spectrum1D.read(data)
-                except IORegistryError:
-                    with fits.open(data) as hdulist:
-                        data = _parse_as_spectrum1d(hdulist, ext, transpose)
-            elif isinstance(data, fits.HDUList):
-                data = _parse_as_spectrum1d(data, ext, transpose)
+            data = _parse_spec2d(data, ext=ext, transpose=transpose)
 
             # Make metadata layout conform with other viz.
             data.meta = standardize_metadata(data.meta)
@@ -396,7 +550,7 @@ def _load_fits_image_from_filename(filename, app):
 
 @data_parser_registry("mosviz-image-parser")
 def mos_image_parser(app, data_obj, data_labels=None, share_image=0,
-                     image_viewer_reference_name="image-viewer"):
+                     image_viewer_reference_name="image-viewer", lazy=False):
     """
     Attempts to parse an image-like object or list of images.
 
@@ -415,11 +569,26 @@ def mos_image_parser(app, data_obj, data_labels=None, share_image=0,
         different row in the table does not reload the displayed image.
         Currently, if non-zero, the provided number must match the number of
         spectra.
+    lazy : bool, optional
+        Only add the data labels to the mosviz table, the images are parsed
+        when their row is selected.
     """
 
     if data_obj is None:
         return
 
+    if lazy:
+        if not isinstance(data_obj, (list, tuple)):
+            data_obj = [data_obj]
+        if share_image:
+            data_obj = data_obj[:1]
+        data_labels = _image_labels(data_labels, len(data_obj), share_image=share_image)
+        _add_lazy_products(app, 'Images', data_obj, data_labels)
+        if share_image:
+            data_labels *= share_image
+        _add_to_table(app, data_labels, 'Images')
+        return
+
     # The label does not matter here. We overwrite later.
     if isinstance(data_obj, str):
         data_obj = _load_fits_image_from_filename(data_obj, app)
@@ -443,17 +612,7 @@ def mos_image_parser(app, data_obj, data_labels=None, share_image=0,
     if share_image and n_data > 1:  # Just use the first one
         data_obj = [data_obj[0]]
 
-    if data_labels is None:
-        if share_image:
-            data_labels = ["Shared Image"]
-        else:
-            data_labels = [f"Image {i}" for i in n_data_range]
-
-    elif isinstance(data_labels, str):
-        if share_image:
-            data_labels = [data_labels]
-        else:
-            data_labels = [f"{data_labels} {i}" for i in n_data_range]
+    data_labels = _image_labels(data_labels, n_data, share_image=share_image)
 
     with app.data_collection.delay_link_manager_update():
 
@@ -556,8 +715,13 @@ def query_metadata_by_component(app, keys, data_type, fallback=FALLBACK_NAME):
     if not isinstance(keys, Iterable) or isinstance(keys, str):
         keys = [keys]
 
+    lazy_products = getattr(app._jdaviz_helper, '_lazy_products', {})
     for data in app._jdaviz_helper.get_column(data_type):
-        meta = app.data_collection[data].meta
+        if data in lazy_products:
+            # not necessarily loaded yet, so use the metadata from the headers
+            meta = _lazy_product_meta(lazy_products[data])
+        else:
+            meta = app.data_collection[data].meta
 
         # Search all given keys to see if they exist. Return the first hit
         key_found = False
@@ -649,15 +813,18 @@ def _get_source_identifiers_by_hdu(data_obj, filepaths=None,
     # Coerce into list if needed
     if not isinstance(data_obj, (list, tuple, SpectrumCollection)):
         data_obj = [data_obj]
-    hdus = [fits.open(x)[0] if _check_is_file(x) else x for x in data_obj]
-    for indx, hdu in enumerate(hdus):
+    # Only the primary headers are read from files, which are closed right away
+    headers = [fits.getheader(x, ext=0) if _check_is_file(x) else x for x in data_obj]
+    for indx, header in enumerate(headers):
         try:
+            if not isinstance(header, fits.Header):
+                header = header.header
             # Search all given keys to see if they exist. Return the first hit
             key_found = False
             for key in header_keys:
-                if key in hdu.header:
+                if key in header:
                     key_found = True
-                    src_name = hdu.header.get(key)
+                    src_name = header.get(key)
                     if not allow_duplicates and src_name in src_names:
                         continue
                     else:
@@ -682,7 +849,100 @@ def _get_source_identifiers_by_hdu(data_obj, filepaths=None,
     return src_names
 
 
-def _id_files_by_datamodl(label_dict, filepaths, catalog_key=None):
+def _read_mos_index_entry(filepath):
+    """
+    Read the `MOS_INDEX_KEYS` keywords of the primary header and of the first extension
+    header (where JWST spectra keep, e.g., the source position) of a FITS file.  Only
+    the headers are read, and the file is closed before returning.
+    """
+    def _header_keys(header):
+        # Keep values JSON serializable for the sidecar file
+        return {key: (header[key] if isinstance(header[key], (str, int, float, bool))
+                      else str(header[key]))
+                for key in MOS_INDEX_KEYS if key in header}
+
+    stat = os.stat(filepath)
+    entry = {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+    with fits.open(filepath) as hdulist:
+        entry['primary'] = _header_keys(hdulist[0].header)
+        try:
+            entry['ext'] = _header_keys(hdulist[1].header)
+        except IndexError:
+            entry['ext'] = {}
+    return entry
+
+
+def _index_mos_directory(directory, max_workers=None):
+    """
+    Index the header keywords of all the FITS files in a directory of MOS data.
+
+    The headers of the files are read in a thread pool, and the index is saved in a
+    `MOS_INDEX_FILENAME` sidecar file in the directory (if writable), so that only new or
+    modified files are read when the directory is loaded again.
+
+    Parameters
+    ----------
+    directory : str or `~pathlib.Path`
+        Directory with the MOS data products.
+    max_workers : int or `None`, optional
+        Number of threads used to read the headers, see
+        `~concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    index : dict
+        Index entries by file name, each with the keywords found in the ``'primary'``
+        and the first extension (``'ext'``) headers.
+    """
+    directory = Path(directory)
+    index_path = directory / MOS_INDEX_FILENAME
+
+    cached = {}
+    if index_path.is_file():
+        try:
+            with open(index_path) as f:
+                sidecar = json.load(f)
+            if (sidecar.get('version') == MOS_INDEX_VERSION and
+                    sidecar.get('keys') == list(MOS_INDEX_KEYS)):
+                cached = sidecar['files']
+        except (OSError, ValueError, KeyError):
+            cached = {}
+
+    index = {}
+    to_read = []
+    for filepath in sorted(directory.glob('*.fit*')):
+        if not filepath.is_file():
+            continue
+        entry = cached.get(filepath.name)
+        stat = filepath.stat()
+        if (entry is not None and entry['size'] == stat.st_size and
+                entry['mtime'] == stat.st_mtime_ns):
+            index[filepath.name] = entry
+        else:
+            to_read.append(filepath)
+
+    if to_read:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for filepath, entry in zip(to_read, executor.map(_read_mos_index_entry, to_read)):
+                index[filepath.name] = entry
+
+    if to_read or len(index) != len(cached):
+        try:
+            with open(index_path, 'w') as f:
+                json.dump({'version': MOS_INDEX_VERSION, 'keys': list(MOS_INDEX_KEYS),
+                           'files': index}, f)
+        except OSError:  # e.g., read-only directory
+            pass
+
+    return index
+
+
+def _index_meta(entry):
+    """Metadata of an index entry, with keywords of the extension taking precedence."""
+    return {**entry['primary'], **entry['ext']}
+
+
+def _id_files_by_datamodl(label_dict, filepaths, catalog_key=None, index=None):
     '''
     Given a dictionary of expected file labels, sort a directory of files into
     their matching categories using their DATAMODL values. The key corresponding
@@ -690,6 +950,9 @@ def _id_files_by_datamodl(label_dict, filepaths, catalog_key=None):
 
     Specific to JWST generally (through datamodels) and NIRISS specifically for
     the time, though the eventual plan is to add support for the NIRSpec parser.
+
+    If given, the primary headers are taken from the ``index`` of the directory
+    (see ``_index_mos_directory``) instead of being read from the files.
     '''
     if catalog_key is None:
         raise ValueError("cat_key must be identified before parsing directory")
@@ -705,7 +968,10 @@ def _id_files_by_datamodl(label_dict, filepaths, catalog_key=None):
 
         if fp.suffix in ('.fits', '.fits.gz', '.fit', '.fit.gz'):
             # eligible files will have a DATAMODL value in their primary headers
-            header = fits.getheader(fp, ext=0)
+            if index is not None and fp.name in index:
+                header = index[fp.name]['primary']
+            else:
+                header = fits.getheader(fp, ext=0)
             datamodl = header.get('DATAMODL')
 
             # infer the dispersion direction of 1D and 2D spectra by the last
@@ -791,9 +1057,20 @@ def mos_niriss_parser(app, data_dir, instrument=None,
     cat_key = 'Source Catalog'
     files_by_labels[cat_key] = ''
 
-    # use FITS header keywords to sort the directory's files
+    # use FITS header keywords to sort the directory's files, reading each
+    # primary header only once
+    index = _index_mos_directory(path)
+
+    def _filter_name(filepath):
+        key = 'PUPIL' if instrument == "niriss" else 'FILTER'
+        filepath = Path(filepath)
+        if filepath.parent == path and filepath.name in index:
+            return index[filepath.name]['primary'].get(key)
+        # e.g., images in a subdirectory
+        return fits.getheader(filepath, ext=0).get(key)
+
     files_by_labels = _id_files_by_datamodl(files_by_labels, path.glob('*'),
-                                            catalog_key=cat_key)
+                                            catalog_key=cat_key, index=index)
 
     # validate that all expected files are present in proper amounts
     _warn_if_not_found(app, files_by_labels)
@@ -826,10 +1103,7 @@ def mos_niriss_parser(app, data_dir, instrument=None,
         for image_file in files_by_labels["Direct Image"]:
             # save label for table viewer
             im_split = image_file.stem.split("_")[0]
-            if instrument == "niriss":
-                pupil = fits.getheader(image_file, ext=0).get('PUPIL')
-            elif instrument == "nircam":
-                pupil = fits.getheader(image_file, ext=0).get('FILTER')
+            pupil = _filter_name(image_file)
 
             image_label = f"Image {im_split} {pupil}"
             image_dict[pupil] = image_label
@@ -859,10 +1133,7 @@ def mos_niriss_parser(app, data_dir, instrument=None,
         for fname in files_by_labels[flabel]:
             print(f"Loading: {flabel} sources")
             if flabel in ('2D Spectra R', '2D Spectra C'):
-                if instrument == "niriss":
-                    filter_name = fits.getheader(fname, ext=0).get('PUPIL')
-                elif instrument == "nircam":
-                    filter_name = fits.getheader(fname, ext=0).get('FILTER')
+                filter_name = _filter_name(fname)
 
                 # Orientation denoted by "C", "R", or "C+R" for combined spectra
                 orientation = flabel.split()[-1]
@@ -951,10 +1222,7 @@ def mos_niriss_parser(app, data_dir, instrument=None,
                     raise KeyError(f"The SRCTYPE keyword in the header of file {fname} "
                                    "is not populated (expected values: EXTENDED or POINT)") from e
 
-                if instrument == "niriss":
-                    filter_name = fits.getheader(fname, ext=0).get('PUPIL')
-                elif instrument == "nircam":
-                    filter_name = fits.getheader(fname, ext=0).get('FILTER')
+                filter_name = _filter_name(fname)
 
                 # Orientation denoted by "C", "R", or "C+R" for combined spectra
                 orientation = flabel.split()[-1]
@@ -4,9 +4,13 @@ from zipfile import ZipFile
 
 import numpy as np
 import pytest
+from astropy import units as u
+from astropy.io import fits
 from astropy.nddata import CCDData
+from astropy.table import Table
 from specutils import Spectrum1D
 
+from jdaviz.configs.mosviz import helper as mosviz_helper_module
 from jdaviz.utils import PRIHDR_KEY
 
 
@@ -236,6 +240,106 @@ def test_load_single_image_multi_spec(mosviz_helper, mos_image, spectrum1d, mos_
     assert label_mouseover.icon == 'b'
 
 
+def test_load_lazy(mosviz_helper, tmp_path, monkeypatch, mos_image, mos_spectrum1d,
+                   mos_spectrum2d):
+    n_rows = 8
+    spectra1d, spectra2d, images = [], [], []
+    for i in range(n_rows):
+        spectra1d.append(str(tmp_path / f"spec1d_{i}.fits"))
+        mos_spectrum1d.write(spectra1d[-1], format='tabular-fits')
+
+        header = fits.Header(mos_spectrum2d.meta)
+        header['FILTER'] = 'F170LP'
+        header['GRATING'] = 'G235M'
+        header['REDSHIFT'] = 0.1 * i
+        spectra2d.append(str(tmp_path / f"spec2d_{i}.fits"))
+        fits.HDUList([fits.PrimaryHDU(header=fits.Header({'SOURCEID': i})),
+                      fits.ImageHDU(mos_spectrum2d.flux.value, header=header)]
+                     ).writeto(spectra2d[-1])
+
+        images.append(str(tmp_path / f"image_{i}.fits"))
+        mos_image.write(images[-1])
+
+    mosviz_helper.load_data(spectra1d, spectra2d, images=images, lazy=True)
+    dc = mosviz_helper.app.data_collection
+    table = mosviz_helper.app.get_viewer(mosviz_helper._default_table_viewer_reference_name)
+
+    # the table is built from the headers, only the first row is loaded
+    qtable = mosviz_helper.to_table()
+    assert len(qtable) == n_rows
+    assert qtable["Filter/Grating"][0] == "F170LP/G235M"
+    np.testing.assert_allclose(qtable["Redshift"], 0.1 * np.arange(n_rows))
+    assert dc.labels == ["MOS Table", "1D Spectrum 0", "2D Spectrum 0", "Image 0"]
+    assert dc["2D Spectrum 0"].meta['mosviz_row'] == 0
+    assert len(dc.external_links) == 1
+
+    for row in range(1, n_rows):
+        # the selected row was read in the background
+        mosviz_helper._lazy_prefetch[row].result()
+        table.select_row(row)
+        assert mosviz_helper.app.get_viewer(
+            mosviz_helper._default_spectrum_2d_viewer_reference_name
+        ).layers[0].layer.label == f"2D Spectrum {row}"
+
+    # only the most recently selected rows stay loaded
+    n_loaded = mosviz_helper._lazy_cache_size
+    assert list(mosviz_helper._lazy_rows) == list(range(n_rows - n_loaded, n_rows))
+    assert len(dc) == 1 + 3 * n_loaded
+    assert "1D Spectrum 0" not in dc.labels
+
+    # spectra in rows that are not loaded are read when accessed
+    with pytest.warns(UserWarning, match="Applying the value from the redshift"):
+        spec = mosviz_helper.get_spectrum_1d(row=0)
+    assert spec.shape == mos_spectrum1d.shape
+    assert list(mosviz_helper._lazy_rows)[-1] == 0
+    assert f"2D Spectrum {n_rows - 1}" in dc.labels
+
+    # rows can still be parsed without the background reads
+    read_mos_product = mosviz_helper_module._read_mos_product
+    n_calls = []
+
+    def read_product(*args, **kwargs):
+        n_calls.append(1)
+        return read_mos_product(*args, **kwargs)
+
+    monkeypatch.setattr(mosviz_helper_module, '_read_mos_product', read_product)
+    monkeypatch.setattr(mosviz_helper, '_lazy_prefetch_rows', 0)
+    for future in mosviz_helper._lazy_prefetch.values():
+        future.cancel()
+    mosviz_helper._lazy_prefetch = {}
+    table.select_row(1)
+    assert len(n_calls) == 3
+    assert dc["1D Spectrum 1"].meta['mosviz_row'] == 1
+
+    # loading more data stops the background reads
+    table.select_row(2)
+    executor = mosviz_helper._lazy_executor
+    assert executor is not None
+    with pytest.raises(NotImplementedError, match="Lazy loading is not supported"):
+        mosviz_helper.load_data(directory=str(tmp_path), instrument="niriss", lazy=True)
+    assert mosviz_helper._lazy_executor is None
+    assert mosviz_helper._lazy_prefetch == {}
+    assert executor._shutdown
+
+
+def test_load_lazy_spectrum_list(mosviz_helper, tmp_path):
+    # JWST x1d file with the spectra of two slits, read as a SpectrumList
+    hdus = [fits.PrimaryHDU(header=fits.Header({'TELESCOP': 'JWST'})), fits.ImageHDU(name='ASDF')]
+    for i in range(2):
+        hdu = fits.table_to_hdu(Table({'WAVELENGTH': [1, 2, 3] * u.um,
+                                       'FLUX': [i, i, i] * u.Jy}))
+        hdu.header.update({'EXTNAME': 'EXTRACT1D', 'EXTVER': i + 1, 'SRCTYPE': 'POINT'})
+        hdus.append(hdu)
+    filename = str(tmp_path / "multi_x1d.fits")
+    fits.HDUList(hdus).writeto(filename)
+
+    # each spectrum is a row, so the file is not loaded lazily
+    mosviz_helper.load_1d_spectra(filename, lazy=True)
+    assert mosviz_helper._lazy_products == {}
+    assert mosviz_helper.app.data_collection.labels == ["MOS Table", "1D Spectrum 0",
+                                                        "1D Spectrum 1"]
+
+
 def test_zip_error(mosviz_helper, tmp_path):
     '''
     Zipfiles are explicitly and intentionally not supported. This test confirms a TypeError is
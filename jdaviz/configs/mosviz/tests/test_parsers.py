@@ -1,9 +1,13 @@
+import os
 from zipfile import ZipFile
 
+import numpy as np
 import pytest
 from numpy.testing import assert_allclose
+from astropy.io import fits
 from astropy.utils.data import download_file
 
+from jdaviz.configs.mosviz.plugins import parsers
 from jdaviz.utils import PRIHDR_KEY, COMMENTCARD_KEY
 
 
@@ -225,3 +229,94 @@ def test_missing_srctype(mosviz_helper, tmp_path):
     with pytest.raises(KeyError, match=r".*The SRCTYPE keyword.*is not populated.*"):
         mosviz_helper.load_data(directory=(tmp_path / 'NIRISS_for_parser_p0171'),
                                 instrument="niriss")
+
+
+def _write_mos_file(path, datamodl, sourceid, filter_name='GR150C', pupil='F150W'):
+    primary = fits.PrimaryHDU(header=fits.Header({
+        'DATAMODL': datamodl, 'FILTER': filter_name, 'PUPIL': pupil, 'GRATING': 'N/A'}))
+    sci = fits.ImageHDU(np.zeros((5, 10)), header=fits.Header({
+        'EXTNAME': 'SCI', 'SOURCEID': sourceid, 'SRCRA': 5.0, 'SRCDEC': -5.0}))
+    fits.HDUList([primary, sci]).writeto(path, overwrite=True)
+
+
+def test_index_mos_directory(tmp_path, monkeypatch):
+    for i in range(3):
+        _write_mos_file(tmp_path / f"src{i}_x1d.fits", 'MultiSpecModel', i)
+        _write_mos_file(tmp_path / f"src{i}_cal.fits", 'MultiSlitModel', i, filter_name='GR150R')
+    _write_mos_file(tmp_path / "direct_i2d.fits", 'ImageModel', 0, filter_name='CLEAR')
+
+    index = parsers._index_mos_directory(tmp_path)
+    assert len(index) == 7
+    assert index['src1_x1d.fits']['primary'] == {'DATAMODL': 'MultiSpecModel',
+                                                 'FILTER': 'GR150C', 'PUPIL': 'F150W',
+                                                 'GRATING': 'N/A'}
+    assert parsers._index_meta(index['src1_x1d.fits'])['SOURCEID'] == 1
+    assert (tmp_path / parsers.MOS_INDEX_FILENAME).is_file()
+
+    # files are sorted the same way from the index as from the headers
+    labels = ['1D Spectra C', '1D Spectra R', '2D Spectra C', '2D Spectra R', 'Direct Image']
+
+    def _id_files(index=None):
+        files_by_labels = {k: [] for k in labels}
+        files_by_labels['Source Catalog'] = ''
+        return parsers._id_files_by_datamodl(files_by_labels, sorted(tmp_path.glob('*')),
+                                             catalog_key='Source Catalog', index=index)
+
+    expected = _id_files()
+    assert len(expected['1D Spectra C']) == 3
+    assert len(expected['2D Spectra R']) == 3
+    assert _id_files(index) == expected
+
+    # opening the directory again only reads the sidecar file
+    def fail(*args, **kwargs):
+        raise AssertionError("file opened")
+
+    with monkeypatch.context() as m:
+        m.setattr(parsers.fits, 'open', fail)
+        assert parsers._index_mos_directory(tmp_path) == index
+
+    # modified files are read again
+    _write_mos_file(tmp_path / "src1_x1d.fits", 'MultiSpecModel', 42)
+    os.utime(tmp_path / "src1_x1d.fits", ns=(1, 1))
+    opened = []
+    fits_open = fits.open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return fits_open(*args, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(parsers.fits, 'open', counting_open)
+        index = parsers._index_mos_directory(tmp_path)
+    assert opened == [tmp_path / "src1_x1d.fits"]
+    assert parsers._index_meta(index['src1_x1d.fits'])['SOURCEID'] == 42
+
+    # source identifiers only need the primary headers
+    paths = [str(tmp_path / f"src{i}_cal.fits") for i in range(3)]
+    assert parsers._get_source_identifiers_by_hdu(paths, header_keys='PUPIL',
+                                                  allow_duplicates=True) == ['F150W'] * 3
+
+
+def test_nirspec_directory_lazy(mosviz_helper, tmp_path, mos_spectrum1d, mos_spectrum2d):
+    for i in range(3):
+        mos_spectrum1d.meta['header'] = fits.Header({'SOURCEID': i, 'SRCRA': 5.0, 'SRCDEC': -5.0})
+        mos_spectrum1d.write(tmp_path / f"src{i}_x1d.fits", format='tabular-fits')
+
+        header = fits.Header(mos_spectrum2d.meta)
+        header['FILTER'] = 'F170LP'
+        header['GRATING'] = 'G235M'
+        fits.HDUList([fits.PrimaryHDU(), fits.ImageHDU(mos_spectrum2d.flux.value, header=header)]
+                     ).writeto(tmp_path / f"src{i}_s2d.fits")
+
+    mosviz_helper.load_data(directory=str(tmp_path), instrument="nirspec", lazy=True)
+
+    # the metadata in the table comes from the index of the directory
+    assert (tmp_path / parsers.MOS_INDEX_FILENAME).is_file()
+    products = mosviz_helper._lazy_products
+    assert products['1D Spectrum 1']['meta'] == {'SOURCEID': 1, 'SRCRA': 5.0, 'SRCDEC': -5.0}
+    qtable = mosviz_helper.to_table()
+    assert list(qtable['Identifier']) == [0, 1, 2]
+    assert qtable['Filter/Grating'][0] == 'F170LP/G235M'
+    assert list(qtable['R.A.']) == [5.0] * 3
+    assert mosviz_helper.app.data_collection.labels == ['MOS Table', '1D Spectrum 0',
+                                                        '2D Spectrum 0']
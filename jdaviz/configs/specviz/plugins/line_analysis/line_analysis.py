@@ -427,10 +427,10 @@ class LineAnalysis(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelect
         self.update_results(temp_results)
 
     def _compute_redshift_for_selected_line(self):
-        index = self.line_items.index(self.selected_line)
-        line_mark = self.line_marks[index]
-        rest_value = (line_mark.rest_value * line_mark.xunit).to_value(u.AA,
-                                                                       equivalencies=u.spectral())
+        line_mark = [mark for mark in self.line_marks
+                     if self.selected_line in mark.names_rest][0]
+        rest_value = line_mark.rest_values[line_mark.index(self.selected_line)]
+        rest_value = (rest_value * line_mark.xunit).to_value(u.AA, equivalencies=u.spectral())
         return (self.results_centroid - rest_value) / rest_value
 
     @observe('sync_identify')
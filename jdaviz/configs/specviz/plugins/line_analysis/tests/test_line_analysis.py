@@ -166,10 +166,11 @@ def test_line_identify(specviz_helper, spectrum1d):
     # manually update redshift
     la_plugin.vue_line_assign()
     assert_allclose(la_plugin.results_centroid, 7307.4232674401555)
-    line_mark = la_plugin.line_marks[la_plugin.line_items.index(la_plugin.selected_line)]
-    assert_allclose(line_mark.rest_value, 5007)
+    line_mark = [m for m in la_plugin.line_marks if la_plugin.selected_line in m.names_rest][0]
+    rest_value = line_mark.rest_values[line_mark.index(la_plugin.selected_line)]
+    assert_allclose(rest_value, 5007)
     z = la_plugin._compute_redshift_for_selected_line()
-    assert_allclose(z, (la_plugin.results_centroid - line_mark.rest_value)/line_mark.rest_value)
+    assert_allclose(z, (la_plugin.results_centroid - rest_value)/rest_value)
     assert_allclose(la_plugin.selected_line_redshift, z)
 
 
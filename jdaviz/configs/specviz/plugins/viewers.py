@@ -18,7 +18,8 @@ from specutils import Spectrum1D
 
 from jdaviz.core.events import SpectralMarksChangedMessage, LineIdentifyMessage, SnackbarMessage
 from jdaviz.core.registries import viewer_registry
-from jdaviz.core.marks import SpectralLine, LineUncertainties, ScatterMask, OffscreenLinesMarks
+from jdaviz.core.marks import (SpectralLineCollection, LineUncertainties, ScatterMask,
+                               OffscreenLinesMarks)
 from jdaviz.core.linelists import load_preset_linelist, get_available_linelists
 from jdaviz.core.freezable_state import FreezableProfileViewerState
 from jdaviz.configs.default.plugins.viewers import JdavizViewerMixin
@@ -87,9 +88,8 @@ class SpecvizProfileView(JdavizViewerMixin, BqplotProfileView):
 
                     if _class is not None:
                         cache_key = (lyr.label, statistic)
-                        if cache_key in self.jdaviz_app._get_object_cache:
-                            layer_data = self.jdaviz_app._get_object_cache[cache_key]
-                        else:
+                        layer_data = self.jdaviz_app._get_object_cache.get(cache_key)
+                        if layer_data is None:
                             # If spectrum, collapse via the defined statistic
                             if _class == Spectrum1D:
                                 layer_data = lyr.get_object(cls=_class, statistic=statistic)
@@ -201,57 +201,58 @@ class SpecvizProfileView(JdavizViewerMixin, BqplotProfileView):
         if return_table:
             return line_table
 
+    @property
+    def _spectral_line_marks(self):
+        return [x for x in self.figure.marks if isinstance(x, SpectralLineCollection)]
+
     def _broadcast_plotted_lines(self, marks=None):
         if marks is None:
-            marks = [x for x in self.figure.marks if isinstance(x, SpectralLine)]
+            marks = self._spectral_line_marks
 
         msg = SpectralMarksChangedMessage(marks, sender=self)
         self.session.hub.broadcast(msg)
 
-        if not np.any([mark.identify for mark in marks]):
+        if not np.any([mark.identified is not None for mark in marks]):
             # then clear the identified entry
             msg = LineIdentifyMessage(name_rest='', sender=self)
             self.session.hub.broadcast(msg)
 
+    def _remove_spectral_line_marks(self):
+        """
+        Remove all spectral line marks from the figure and return the name_rest
+        of the identified line, if any.
+        """
+        identified = None
+        remove = []
+        for mark in self._spectral_line_marks:
+            if mark.identified is not None:
+                identified = mark.names_rest[mark.identified]
+            remove += mark.marks
+        self.figure.marks = [x for x in self.figure.marks if x not in remove]
+        return identified
+
     def erase_spectral_lines(self, name=None, name_rest=None, show_none=True):
         """
         Erase either all spectral lines, all spectral lines sharing the same
         name (e.g. 'He II') or a specific name-rest value combination (e.g.
-        'HE II 1640.5', stored in SpectralLine as 'table_index').
+        'HE II 1640.5', stored in SpectralLineCollection.names_rest).
         """
-        fig = self.figure
         if name is None and name_rest is None:
-            fig.marks = [x for x in fig.marks if not isinstance(x, SpectralLine)]
+            self._remove_spectral_line_marks()
             if show_none:
                 self.spectral_lines["show"] = False
             self._broadcast_plotted_lines([])
         else:
-            temp_marks = []
-            # Toggle "show" value in main astropy table. The astropy table
-            # machinery only allows updating a single row at a time.
+            # Toggle "show" value in main astropy table and re-draw the remaining
+            # lines, which is a single mark per color
             if name_rest is not None:
                 if isinstance(name_rest, str):
-                    self.spectral_lines.loc[name_rest]["show"] = False
-                elif isinstance(name_rest, list):
-                    for nr in name_rest:
-                        self.spectral_lines.loc[nr]["show"] = False
-            # Get rid of the marks we no longer want
-            for x in fig.marks:
-                if isinstance(x, SpectralLine):
-                    if name is not None:
-                        self.spectral_lines.loc[name]["show"] = False
-                        if x.name == name:
-                            continue
-                    else:
-                        if isinstance(name_rest, str):
-                            if x.table_index == name_rest:
-                                continue
-                        elif isinstance(name_rest, list):
-                            if x.table_index in name_rest:
-                                continue
-                temp_marks.append(x)
-            fig.marks = temp_marks
-            self._broadcast_plotted_lines()
+                    name_rest = [name_rest]
+                hide = np.isin(self.spectral_lines["name_rest"], name_rest)
+            else:
+                hide = self.spectral_lines["linename"] == name
+            self.spectral_lines["show"][hide] = False
+            self.plot_spectral_lines()
 
     def get_scales(self):
         fig = self.figure
@@ -268,51 +269,41 @@ class SpecvizProfileView(JdavizViewerMixin, BqplotProfileView):
                 line = self.spectral_lines.loc[line]
             except KeyError:
                 line = self.spectral_lines.loc["linename", line]
-        if plot_units is None:
-            plot_units = self.data()[0].spectral_axis.unit
-
-        line_mark = SpectralLine(self,
-                                 line['rest'].to_value(plot_units),
-                                 self.redshift,
-                                 name=line["linename"],
-                                 table_index=line["name_rest"],
-                                 colors=[line["colors"]], **kwargs)
 
-        # Erase this line if it already existed, to avoid duplication
-        self.erase_spectral_lines(name_rest=line["name_rest"])
-
-        self.figure.marks = self.figure.marks + [line_mark]
         line["show"] = True
-        self._broadcast_plotted_lines()
+        self.plot_spectral_lines(**kwargs)
 
     def plot_spectral_lines(self, colors=["blue"], **kwargs):
         """
         Plots a user-provided astropy table of spectral lines in the viewer.
+        All shown lines sharing a color are drawn as a single mark.
         """
-        fig = self.figure
-        self.erase_spectral_lines(show_none=False)
-
-        # Check to see if colors were defined for each line
-        if "colors" in self.spectral_lines.columns:
-            colors = self.spectral_lines["colors"]
-        elif len(colors) != len(self.spectral_lines):
-            colors = colors*len(self.spectral_lines)
+        identified = self._remove_spectral_line_marks()
 
         lines = self.spectral_lines
-        plot_units = self.data()[0].spectral_axis.unit
 
+        # Check to see if colors were defined for each line
+        if "colors" in lines.columns:
+            colors = lines["colors"]
+        elif len(colors) != len(lines):
+            colors = colors*len(lines)
+        colors = np.asarray(colors)
+
+        show = np.asarray(lines["show"], dtype=bool)
         marks = []
-        for line, color in zip(lines, colors):
-            if not line["show"]:
-                continue
-            line = SpectralLine(self,
-                                line['rest'].to_value(plot_units),
-                                redshift=self.redshift,
-                                name=line["linename"],
-                                table_index=line["name_rest"],
-                                colors=[color], **kwargs)
-            marks.append(line)
-        fig.marks = fig.marks + marks
+        for color in dict.fromkeys(colors[show]):
+            in_mark = show & (colors == color)
+            mark = SpectralLineCollection(self,
+                                          lines["rest"][in_mark],
+                                          names_rest=lines["name_rest"][in_mark],
+                                          names=lines["linename"][in_mark],
+                                          redshift=self.redshift,
+                                          colors=[color], **kwargs)
+            if identified in mark.names_rest:
+                mark.identified = mark.index(identified)
+            marks.append(mark)
+
+        self.figure.marks = self.figure.marks + [m for mark in marks for m in mark.marks]
         self._broadcast_plotted_lines()
 
     def available_linelists(self):
@@ -342,6 +342,39 @@ def test_get_spectral_regions_unit_conversion(specviz_helper, spectrum1d):
     assert label_mouseover.icon == ''
 
 
+def test_mouseover_long_spectrum(specviz_helper):
+    rng = np.random.default_rng(0)
+    wave = np.sort(rng.uniform(5000, 6000, 100_000)) * u.AA
+    flux = rng.random(wave.size) * u.Jy
+    specviz_helper.load_data(Spectrum1D(flux=flux, spectral_axis=wave), data_label='long')
+
+    spec_viewer = specviz_helper.app.get_viewer('spectrum-viewer')
+    label_mouseover = specviz_helper.app.session.application._tools['g-coords-info']
+    for x in rng.uniform(5000, 6000, 50):
+        label_mouseover._viewer_mouse_event(spec_viewer,
+                                            {'event': 'mousemove', 'domain': {'x': x, 'y': 0.5}})
+        i = np.argmin(abs(wave.value - x))
+        assert label_mouseover.as_dict()['index'] == i
+        assert label_mouseover.as_dict()['axes_x'] == wave.value[i]
+        assert label_mouseover.as_dict()['axes_y'] == flux.value[i]
+
+    # the converted arrays are built once and reused across mouse events
+    assert len(label_mouseover._spectrum_hover_index) == 1
+    hover_index = list(label_mouseover._spectrum_hover_index.values())[0]
+    label_mouseover._viewer_mouse_event(spec_viewer,
+                                        {'event': 'mousemove', 'domain': {'x': 5500, 'y': 0.5}})
+    assert list(label_mouseover._spectrum_hover_index.values())[0] is hover_index
+
+    # a change in display units rebuilds the index (here in descending frequency order)
+    specviz_helper.plugins['Unit Conversion'].spectral_unit = 'Hz'
+    x = (5432.1 * u.AA).to_value(u.Hz, u.spectral())
+    label_mouseover._viewer_mouse_event(spec_viewer,
+                                        {'event': 'mousemove', 'domain': {'x': x, 'y': 0.5}})
+    assert list(label_mouseover._spectrum_hover_index.values())[0] is not hover_index
+    i = np.argmin(abs(wave.to_value(u.Hz, u.spectral()) - x))
+    assert label_mouseover.as_dict()['index'] == i
+
+
 def test_subset_default_thickness(specviz_helper, spectrum1d):
     specviz_helper.load_data(spectrum1d)
 
@@ -1,5 +1,9 @@
+import weakref
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
+from glue_jupyter.utils import get_ioloop
 from traitlets import Bool, List, Unicode, observe
 
 
@@ -29,6 +33,91 @@ _model_cls = {'Spline': models.Spline1D,
               'Chebyshev': models.Chebyshev1D}
 
 
+# plugin inputs (other than the selected data and traces) used by the live-preview, see
+# SpectralExtraction._preview_snapshot
+_preview_traitlets = ('trace_trace_selected', 'trace_offset', 'trace_type_selected',
+                      'trace_pixel', 'trace_order', 'trace_do_binning', 'trace_bins',
+                      'trace_window', 'trace_peak_method_selected',
+                      'bg_type_selected', 'bg_trace_selected', 'bg_trace_pixel',
+                      'bg_separation', 'bg_width', 'bg_statistic_selected',
+                      'ext_trace_selected', 'ext_dataset_selected', 'ext_type_selected',
+                      'ext_width', 'interactive_extract')
+
+
+class _PreviewCancelled(Exception):
+    # raised in the live-preview worker when a newer preview was requested
+    pass
+
+
+def _preview_input(obj):
+    # selected objects that failed to load are stored as the raised exception in the snapshot
+    if isinstance(obj, Exception):
+        raise obj
+    return obj
+
+
+# The specreduce objects are created from the values of the plugin inputs in ``p``, either the
+# plugin itself or a snapshot of its inputs (see SpectralExtraction._preview_snapshot).
+
+def _make_trace(p, data, orig_trace=None):
+    if orig_trace is not None:
+        # then we're offsetting an existing trace
+        # for FlatTrace, we can keep and expose a new FlatTrace (which has the advantage of
+        # being able to load back into the plugin)
+        if isinstance(orig_trace, tracing.FlatTrace):
+            trace = tracing.FlatTrace(data, orig_trace.trace_pos+p.trace_offset)
+        else:
+            trace = tracing.ArrayTrace(data, orig_trace.trace+p.trace_offset)
+
+    elif p.trace_type_selected == 'Flat':
+        trace = tracing.FlatTrace(data, p.trace_pixel)
+
+    elif p.trace_type_selected in _model_cls:
+        trace_model = _model_cls[p.trace_type_selected](degree=p.trace_order)
+        trace = tracing.FitTrace(data,
+                                 guess=p.trace_pixel,
+                                 bins=int(p.trace_bins) if p.trace_do_binning else None,
+                                 window=p.trace_window,
+                                 peak_method=p.trace_peak_method_selected.lower(),
+                                 trace_model=trace_model)
+
+    else:
+        raise NotImplementedError(f"trace_type={p.trace_type_selected} not implemented")
+
+    return trace
+
+
+def _make_bg(p, data, trace):
+    statistic = p.bg_statistic_selected.lower()
+    if p.bg_type_selected == 'Manual':
+        bg = background.Background(data, [trace], width=p.bg_width, statistic=statistic)
+    elif p.bg_type_selected == 'OneSided':
+        bg = background.Background.one_sided(data, trace, p.bg_separation,
+                                             width=p.bg_width, statistic=statistic)
+    elif p.bg_type_selected == 'TwoSided':
+        bg = background.Background.two_sided(data, trace, p.bg_separation,
+                                             width=p.bg_width, statistic=statistic)
+    else:  # pragma: no cover
+        raise NotImplementedError(f"bg_type={p.bg_type_selected} not implemented")
+
+    return bg
+
+
+def _make_extract(p, trace, inp_sp2d):
+    if p.ext_type_selected == 'Boxcar':
+        ext = extract.BoxcarExtract(inp_sp2d, trace, width=p.ext_width)
+    elif p.ext_type_selected == 'Horne':
+        if inp_sp2d.uncertainty is None:
+            inp_sp2d.uncertainty = VarianceUncertainty(np.ones_like(inp_sp2d.data))
+        if not hasattr(inp_sp2d.uncertainty, 'uncertainty_type'):
+            inp_sp2d.uncertainty = StdDevUncertainty(inp_sp2d.uncert)
+        ext = extract.HorneExtract(inp_sp2d, trace)
+    else:
+        raise NotImplementedError(f"extraction type '{p.ext_type_selected}' not supported")
+
+    return ext
+
+
 @tray_registry('spectral-extraction', label="Spectral Extraction",
                viewer_requirements=['spectrum', 'spectrum-2d'])
 class SpectralExtraction(PluginTemplateMixin):
@@ -203,12 +292,23 @@ class SpectralExtraction(PluginTemplateMixin):
     ext_add_to_viewer_selected = Unicode().tag(sync=True)
     # uses default "spinner"
 
+    # delay (in seconds) to wait for further changes before computing the live-preview
+    _preview_delay = 0.1
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self._marks = {}
         self._do_marks = False
 
+        # live-preview: the latest result of each step of the extraction (along with the inputs
+        # used to compute it) and the state of the debounced computation in the worker thread
+        self._preview_cache = {}
+        self._preview_request = 0
+        self._preview_executor = None
+        self._preview_future = None
+        self._preview_ioloop = None
+
         # TRACE
         self.trace_trace = DatasetSelect(self,
                                          'trace_trace_items',
@@ -499,35 +599,11 @@ class SpectralExtraction(PluginTemplateMixin):
     @observe('interactive_extract')
     @skip_if_no_updates_since_last_active()
     def _update_interactive_extract(self, event={}):
-        # also called by any of the _interaction_in_*_step
+        # the live-preview of each step also updates the extracted spectrum
         if not self._do_marks:
             return False
 
-        if self.interactive_extract:
-            try:
-                sp1d = self.export_extract_spectrum(add_data=False)
-            except Exception as e:
-                # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
-                # NOTE: FitTrace or manual background are often giving a
-                # "background regions overlapped" error from specreduce
-                self.ext_specreduce_err = repr(e)
-                self.marks['extract'].clear()
-            else:
-                self.ext_specreduce_err = ''
-                self.marks['extract'].update_xy(sp1d.spectral_axis.value,
-                                                sp1d.flux.value)
-        else:
-            self.marks['extract'].clear()
-
-        if self.interactive_extract and self.active_step == 'bg':
-            try:
-                spec = self.export_bg_spectrum()
-            except Exception:
-                self.marks['bg_spec'].clear()
-            else:
-                self.marks['bg_spec'].update_xy(spec.spectral_axis, spec.flux)
-        else:
-            self.marks['bg_spec'].clear()
+        self._request_preview(self.active_step if self.active_step in ('trace', 'bg') else 'ext')
 
     @observe('is_active', 'trace_dataset_selected', 'trace_type_selected',
              'trace_trace_selected', 'trace_offset', 'trace_order',
@@ -541,17 +617,7 @@ class SpectralExtraction(PluginTemplateMixin):
             self._update_plugin_marks(event)
             return
 
-        try:
-            trace = self.export_trace(add_data=False)
-        except Exception:
-            # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
-            self.marks['trace'].clear()
-        else:
-            self.marks['trace'].update_xy(range(len(trace.trace)),
-                                          trace.trace)
-            self.marks['trace'].line_style = 'solid'
-
-        self._update_interactive_extract(event)
+        self._request_preview('trace')
 
         self.active_step = 'trace'
         self._update_plugin_marks(event)
@@ -567,45 +633,7 @@ class SpectralExtraction(PluginTemplateMixin):
             self._update_plugin_marks(event)
             return
 
-        try:
-            trace = self._get_bg_trace()
-        except Exception:
-            # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
-            for mark in ['trace', 'bg1_center', 'bg1_lower', 'bg1_upper',
-                         'bg2_center', 'bg2_lower', 'bg2_upper', 'bg_spec']:
-                self.marks[mark].clear()
-        else:
-            xs = range(len(trace.trace))
-            self.marks['trace'].update_xy(xs,
-                                          trace.trace)
-            self.marks['trace'].line_style = 'dashed'
-
-            if self.bg_type_selected in ['OneSided', 'TwoSided']:
-                self.marks['bg1_center'].update_xy(xs,
-                                                   trace.trace+self.bg_separation)
-                self.marks['bg1_lower'].update_xy(xs,
-                                                  trace.trace+self.bg_separation-self.bg_width/2)
-                self.marks['bg1_upper'].update_xy(xs,
-                                                  trace.trace+self.bg_separation+self.bg_width/2)
-            else:
-                self.marks['bg1_center'].clear()
-                self.marks['bg1_lower'].update_xy(xs,
-                                                  trace.trace-self.bg_width/2)
-                self.marks['bg1_upper'].update_xy(xs,
-                                                  trace.trace+self.bg_width/2)
-
-            if self.bg_type_selected == 'TwoSided':
-                self.marks['bg2_center'].update_xy(xs,
-                                                   trace.trace-self.bg_separation)
-                self.marks['bg2_lower'].update_xy(xs,
-                                                  trace.trace-self.bg_separation-self.bg_width/2)
-                self.marks['bg2_upper'].update_xy(xs,
-                                                  trace.trace-self.bg_separation+self.bg_width/2)
-            else:
-                for mark in ['bg2_center', 'bg2_lower', 'bg2_upper']:
-                    self.marks[mark].clear()
-
-        self._update_interactive_extract(event)
+        self._request_preview('bg')
 
         self.active_step = 'bg'
         self._update_plugin_marks(event)
@@ -620,38 +648,292 @@ class SpectralExtraction(PluginTemplateMixin):
             self._update_plugin_marks(event)
             return
 
+        self._request_preview('ext')
+
+        self.active_step = 'ext'
+        self._update_plugin_marks(event)
+
+    def _request_preview(self, step):
+        """
+        Update the live-preview marks for ``step`` (one of 'trace', 'bg', 'ext').  Within a kernel,
+        requests are debounced and computed in a worker thread, and results of requests that are
+        superseded before they are done are discarded.  Otherwise, the preview is computed
+        immediately.
+        """
+        self._preview_request += 1
+        request = self._preview_request
+
+        ioloop = get_ioloop()
+        if ioloop is None:
+            self._apply_preview(step, self._compute_preview(step, self._preview_snapshot()))
+            return
+        self._preview_ioloop = ioloop
+
+        def submit():
+            if request != self._preview_request:
+                # a newer preview was requested within the delay
+                return
+            if self._preview_future is not None:
+                # drop the previous request if it has not started yet
+                self._preview_future.cancel()
+            if self._preview_executor is None:
+                self._preview_executor = ThreadPoolExecutor(max_workers=1)
+                # Make sure the thread does not outlive the plugin.
+                weakref.finalize(self, self._preview_executor.shutdown,
+                                 wait=False, cancel_futures=True)
+            # the worker only uses the snapshot, not the plugin traitlets or selected objects
+            self._preview_future = self._preview_executor.submit(
+                self._run_preview, ioloop, step, self._preview_snapshot(), request)
+
+        ioloop.add_callback(ioloop.call_later, self._preview_delay, submit)
+
+    def _run_preview(self, ioloop, step, p, request):
+        try:
+            results = self._compute_preview(step, p, request)
+        except _PreviewCancelled:
+            return
+        # update the marks from the main thread
+        ioloop.add_callback(self._apply_preview, step, results, request)
+
+    def _preview_snapshot(self):
+        """
+        Values of the plugin inputs used by the live-preview (see ``_preview_traitlets``) along
+        with the selected data and traces (as ``*_obj``), read from the main thread.
+        """
+        def get_obj(component, used=True):
+            if not used:
+                return None
+            try:
+                return component.selected_obj
+            except Exception as e:
+                # NOTE: raised by the step of the preview that uses it (see _preview_input)
+                return e
+
+        p = SimpleNamespace(**{name: getattr(self, name) for name in _preview_traitlets})
+        p.trace_dataset_obj = get_obj(self.trace_dataset)
+        p.trace_trace_obj = get_obj(self.trace_trace, p.trace_trace_selected != 'New Trace')
+        p.bg_dataset_obj = get_obj(self.bg_dataset)
+        p.bg_trace_obj = get_obj(self.bg_trace, p.bg_type_selected != 'Manual'
+                                 and p.bg_trace_selected != 'From Plugin')
+        p.ext_trace_obj = get_obj(self.ext_trace, p.ext_trace_selected != 'From Plugin')
+        p.ext_dataset_obj = get_obj(self.ext_dataset, p.ext_dataset_selected != 'From Plugin')
+        return p
+
+    def _set_preview_spinner(self, spinner, value, request=None):
+        if request is None:
+            setattr(self, spinner, value)
+        else:
+            # traitlets are only set from the main thread
+            self._preview_ioloop.add_callback(setattr, self, spinner, value)
+
+    def _preview_stage(self, stage, params, inputs, compute, request=None, spinner=None):
+        """
+        Return the result of ``compute(*inputs)``, reusing the cached result of ``stage`` if it was
+        computed with the same ``params`` and (identical) ``inputs``.  With a ``request``, this
+        is run in the worker thread.
+        """
+        if request is not None and request != self._preview_request:
+            raise _PreviewCancelled()
+        for input in inputs:
+            _preview_input(input)
+
+        cached = self._preview_cache.get(stage)
+        if (cached is not None and cached[0] == params
+                and all(cached_input is input for cached_input, input in zip(cached[1], inputs))):
+            return cached[2]
+
+        if spinner is not None:
+            self._set_preview_spinner(spinner, True, request)
         try:
-            trace = self._get_ext_trace()
-        except Exception:
-            # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
-            for mark in ['trace', 'ext_lower', 'ext_upper']:
-                self.marks[mark].clear()
+            result = compute(*inputs)
+        finally:
+            if spinner is not None:
+                self._set_preview_spinner(spinner, False, request)
+
+        if request is not None and request != self._preview_request:
+            # the inputs might have changed while computing
+            raise _PreviewCancelled()
+        self._preview_cache[stage] = (params, inputs, result)
+        return result
+
+    def _preview_trace(self, p, request=None):
+        params = (p.trace_trace_selected, p.trace_offset, p.trace_type_selected,
+                  p.trace_pixel, p.trace_order, p.trace_do_binning, p.trace_bins,
+                  p.trace_window, p.trace_peak_method_selected)
+        inputs = (p.trace_dataset_obj, )
+        if p.trace_trace_selected != 'New Trace':
+            inputs += (p.trace_trace_obj, )
+        return self._preview_stage('trace', params, inputs,
+                                   lambda *args: _make_trace(p, *args),
+                                   request, spinner='trace_spinner')
+
+    def _preview_bg_trace(self, p, request=None):
+        if p.bg_type_selected == 'Manual':
+            return self._preview_stage('bg_trace', (p.bg_trace_pixel, ),
+                                       (p.trace_dataset_obj, ),
+                                       lambda data: tracing.FlatTrace(data, p.bg_trace_pixel),
+                                       request)
+        elif p.bg_trace_selected == 'From Plugin':
+            return self._preview_trace(p, request)
+        return _preview_input(p.bg_trace_obj)
+
+    def _preview_bg(self, p, request=None):
+        params = (p.bg_type_selected, p.bg_separation, p.bg_width,
+                  p.bg_statistic_selected)
+        inputs = (p.bg_dataset_obj, self._preview_bg_trace(p, request))
+        return self._preview_stage('bg', params, inputs,
+                                   lambda data, trace: _make_bg(p, data, trace),
+                                   request, spinner='bg_spinner')
+
+    def _preview_bg_spectrum(self, p, request=None):
+        return self._preview_stage('bg_spec', (), (self._preview_bg(p, request), ),
+                                   lambda bg: bg.bkg_spectrum(),
+                                   request, spinner='bg_spec_spinner')
+
+    def _preview_ext_trace(self, p, request=None):
+        if p.ext_trace_selected == 'From Plugin':
+            return self._preview_trace(p, request)
+        return _preview_input(p.ext_trace_obj)
+
+    def _preview_ext_input_spectrum(self, p, request=None):
+        if p.ext_dataset_selected == 'From Plugin':
+            return self._preview_stage('bg_sub', (), (self._preview_bg(p, request), ),
+                                       lambda bg: bg.sub_image(),
+                                       request, spinner='bg_sub_spinner')
+        return _preview_input(p.ext_dataset_obj)
+
+    def _preview_extract_spectrum(self, p, request=None):
+        params = (p.ext_type_selected,
+                  p.ext_width if p.ext_type_selected == 'Boxcar' else None)
+        inputs = (self._preview_ext_trace(p, request),
+                  self._preview_ext_input_spectrum(p, request))
+        return self._preview_stage('extract', params, inputs,
+                                   lambda trace, inp_sp2d: _make_extract(p, trace, inp_sp2d).spectrum,  # noqa
+                                   request, spinner='spinner')
+
+    def _compute_preview(self, step, p, request=None):
+        """
+        Compute the results needed to update the live-preview marks for ``step`` from the snapshot
+        ``p`` of the plugin inputs.  The result (or the raised exception) of each is stored in the
+        returned dictionary.
+        """
+        def get(func):
+            try:
+                return func(p, request)
+            except _PreviewCancelled:
+                raise
+            except Exception as e:
+                # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
+                return e
+
+        results = {}
+        if step == 'trace':
+            results['trace'] = get(self._preview_trace)
+        elif step == 'bg':
+            results['trace'] = get(self._preview_bg_trace)
         else:
-            xs = range(len(trace.trace))
-            self.marks['trace'].update_xy(xs,
-                                          trace.trace)
-            self.marks['trace'].line_style = 'dashed'
-            if self.ext_type_selected == 'Boxcar':
-                self.marks['ext_lower'].update_xy(xs,
-                                                  trace.trace-self.ext_width/2)
-                self.marks['ext_upper'].update_xy(xs,
-                                                  trace.trace+self.ext_width/2)
+            results['trace'] = get(self._preview_ext_trace)
+            if p.ext_type_selected == 'Horne':
+                results['ext_input'] = get(self._preview_ext_input_spectrum)
+
+        if p.interactive_extract:
+            # NOTE: FitTrace or manual background are often giving a
+            # "background regions overlapped" error from specreduce
+            results['extract'] = get(self._preview_extract_spectrum)
+            if step == 'bg':
+                results['bg_spec'] = get(self._preview_bg_spectrum)
+
+        return results
+
+    def _apply_preview(self, step, results, request=None):
+        if request is not None and request != self._preview_request:
+            return
+
+        trace = results['trace']
+        if step == 'trace':
+            if isinstance(trace, Exception):
+                self.marks['trace'].clear()
             else:
-                for mark in ['ext_lower', 'ext_upper']:
+                self.marks['trace'].update_xy(range(len(trace.trace)),
+                                              trace.trace)
+                self.marks['trace'].line_style = 'solid'
+
+        elif step == 'bg':
+            if isinstance(trace, Exception):
+                for mark in ['trace', 'bg1_center', 'bg1_lower', 'bg1_upper',
+                             'bg2_center', 'bg2_lower', 'bg2_upper', 'bg_spec']:
                     self.marks[mark].clear()
+            else:
+                xs = range(len(trace.trace))
+                self.marks['trace'].update_xy(xs,
+                                              trace.trace)
+                self.marks['trace'].line_style = 'dashed'
+
+                if self.bg_type_selected in ['OneSided', 'TwoSided']:
+                    self.marks['bg1_center'].update_xy(xs,
+                                                       trace.trace+self.bg_separation)
+                    self.marks['bg1_lower'].update_xy(xs,
+                                                      trace.trace+self.bg_separation-self.bg_width/2)  # noqa
+                    self.marks['bg1_upper'].update_xy(xs,
+                                                      trace.trace+self.bg_separation+self.bg_width/2)  # noqa
+                else:
+                    self.marks['bg1_center'].clear()
+                    self.marks['bg1_lower'].update_xy(xs,
+                                                      trace.trace-self.bg_width/2)
+                    self.marks['bg1_upper'].update_xy(xs,
+                                                      trace.trace+self.bg_width/2)
+
+                if self.bg_type_selected == 'TwoSided':
+                    self.marks['bg2_center'].update_xy(xs,
+                                                       trace.trace-self.bg_separation)
+                    self.marks['bg2_lower'].update_xy(xs,
+                                                      trace.trace-self.bg_separation-self.bg_width/2)  # noqa
+                    self.marks['bg2_upper'].update_xy(xs,
+                                                      trace.trace-self.bg_separation+self.bg_width/2)  # noqa
+                else:
+                    for mark in ['bg2_center', 'bg2_lower', 'bg2_upper']:
+                        self.marks[mark].clear()
 
-        self._update_interactive_extract(event)
-
-        self.active_step = 'ext'
-        self._update_plugin_marks(event)
+        else:
+            if isinstance(trace, Exception):
+                for mark in ['trace', 'ext_lower', 'ext_upper']:
+                    self.marks[mark].clear()
+            else:
+                xs = range(len(trace.trace))
+                self.marks['trace'].update_xy(xs,
+                                              trace.trace)
+                self.marks['trace'].line_style = 'dashed'
+                if self.ext_type_selected == 'Boxcar':
+                    self.marks['ext_lower'].update_xy(xs,
+                                                      trace.trace-self.ext_width/2)
+                    self.marks['ext_upper'].update_xy(xs,
+                                                      trace.trace+self.ext_width/2)
+                else:
+                    for mark in ['ext_lower', 'ext_upper']:
+                        self.marks[mark].clear()
+
+            # TODO: remove this, the traitlet, and the row in spectral_extraction.vue
+            # when specutils handles the warning/exception
+            inp_sp2d = results.get('ext_input')
+            self.ext_uncert_warn = isinstance(getattr(inp_sp2d, 'uncertainty', None),
+                                              UnknownUncertainty)
+
+        sp1d = results.get('extract')
+        if isinstance(sp1d, Exception):
+            self.ext_specreduce_err = repr(sp1d)
+            self.marks['extract'].clear()
+        elif sp1d is not None:
+            self.ext_specreduce_err = ''
+            self.marks['extract'].update_xy(sp1d.spectral_axis.value,
+                                            sp1d.flux.value)
+        else:
+            self.marks['extract'].clear()
 
-        # TODO: remove this, the traitlet, and the row in spectral_extraction.vue
-        # when specutils handles the warning/exception
-        if self.ext_type_selected == 'Horne':
-            inp_sp2d = self._get_ext_input_spectrum()
-            self.ext_uncert_warn = isinstance(inp_sp2d.uncertainty, UnknownUncertainty)
+        spec = results.get('bg_spec')
+        if spec is None or isinstance(spec, Exception):
+            self.marks['bg_spec'].clear()
         else:
-            self.ext_uncert_warn = False
+            self.marks['bg_spec'].update_xy(spec.spectral_axis, spec.flux)
 
     def _set_create_kwargs(self, **kwargs):
         invalid_kwargs = [k for k in kwargs.keys() if not hasattr(self, k)]
@@ -705,39 +987,18 @@ class SpectralExtraction(PluginTemplateMixin):
         if len(kwargs) and self.active_step != 'trace':
             self.update_marks(step='trace')
 
-        if self.trace_trace_selected != 'New Trace':
-            # then we're offsetting an existing trace
-            # for FlatTrace, we can keep and expose a new FlatTrace (which has the advantage of
-            # being able to load back into the plugin)
-            orig_trace = self.trace_trace.selected_obj
-            if isinstance(orig_trace, tracing.FlatTrace):
-                trace = tracing.FlatTrace(self.trace_dataset.selected_obj,
-                                          orig_trace.trace_pos+self.trace_offset)
-            else:
-                trace = tracing.ArrayTrace(self.trace_dataset.selected_obj,
-                                           self.trace_trace.selected_obj.trace+self.trace_offset)
-
-        elif self.trace_type_selected == 'Flat':
-            trace = tracing.FlatTrace(self.trace_dataset.selected_obj,
-                                      self.trace_pixel)
-
-        elif self.trace_type_selected in _model_cls:
-            trace_model = _model_cls[self.trace_type_selected](degree=self.trace_order)
-            trace = tracing.FitTrace(self.trace_dataset.selected_obj,
-                                     guess=self.trace_pixel,
-                                     bins=int(self.trace_bins) if self.trace_do_binning else None,
-                                     window=self.trace_window,
-                                     peak_method=self.trace_peak_method_selected.lower(),
-                                     trace_model=trace_model)
-
-        else:
-            raise NotImplementedError(f"trace_type={self.trace_type_selected} not implemented")
+        trace = self._create_trace()
 
         if add_data:
             self.trace_add_results.add_results_from_plugin(trace, replace=False)
 
         return trace
 
+    def _create_trace(self):
+        if self.trace_trace_selected != 'New Trace':
+            return _make_trace(self, self.trace_dataset.selected_obj, self.trace_trace.selected_obj)
+        return _make_trace(self, self.trace_dataset.selected_obj)
+
     def vue_create_trace(self, *args):
         self.export_trace(add_data=True)
 
@@ -803,28 +1064,10 @@ class SpectralExtraction(PluginTemplateMixin):
         if len(kwargs) and self.active_step != 'bg':
             self.update_marks(step='bg')
 
-        trace = self._get_bg_trace()
-
-        if self.bg_type_selected == 'Manual':
-            bg = background.Background(self.bg_dataset.selected_obj,
-                                       [trace], width=self.bg_width,
-                                       statistic=self.bg_statistic.selected.lower())
-        elif self.bg_type_selected == 'OneSided':
-            bg = background.Background.one_sided(self.bg_dataset.selected_obj,
-                                                 trace,
-                                                 self.bg_separation,
-                                                 width=self.bg_width,
-                                                 statistic=self.bg_statistic.selected.lower())
-        elif self.bg_type_selected == 'TwoSided':
-            bg = background.Background.two_sided(self.bg_dataset.selected_obj,
-                                                 trace,
-                                                 self.bg_separation,
-                                                 width=self.bg_width,
-                                                 statistic=self.bg_statistic.selected.lower())
-        else:  # pragma: no cover
-            raise NotImplementedError(f"bg_type={self.bg_type_selected} not implemented")
+        return self._create_bg(self._get_bg_trace())
 
-        return bg
+    def _create_bg(self, trace):
+        return _make_bg(self, self.bg_dataset.selected_obj, trace)
 
     @with_spinner('bg_img_spinner')
     def export_bg_img(self, add_data=False, **kwargs):
@@ -932,21 +1175,10 @@ class SpectralExtraction(PluginTemplateMixin):
         if len(kwargs) and self.active_step != 'ext':
             self.update_marks(step='ext')
 
-        trace = self._get_ext_trace()
-        inp_sp2d = self._get_ext_input_spectrum()
-
-        if self.ext_type_selected == 'Boxcar':
-            ext = extract.BoxcarExtract(inp_sp2d, trace, width=self.ext_width)
-        elif self.ext_type_selected == 'Horne':
-            if inp_sp2d.uncertainty is None:
-                inp_sp2d.uncertainty = VarianceUncertainty(np.ones_like(inp_sp2d.data))
-            if not hasattr(inp_sp2d.uncertainty, 'uncertainty_type'):
-                inp_sp2d.uncertainty = StdDevUncertainty(inp_sp2d.uncert)
-            ext = extract.HorneExtract(inp_sp2d, trace)
-        else:
-            raise NotImplementedError(f"extraction type '{self.ext_type_selected}' not supported")  # noqa
+        return self._create_extract(self._get_ext_trace(), self._get_ext_input_spectrum())
 
-        return ext
+    def _create_extract(self, trace, inp_sp2d):
+        return _make_extract(self, trace, inp_sp2d)
 
     @with_spinner('spinner')
     def export_extract_spectrum(self, add_data=False, **kwargs):
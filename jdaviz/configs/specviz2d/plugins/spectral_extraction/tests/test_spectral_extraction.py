@@ -1,13 +1,25 @@
 import gwcs
+import numpy as np
 import pytest
+from astropy import units as u
 from astropy.utils.data import download_file
 from packaging.version import Version
 from specreduce import tracing, background, extract
 from specutils import Spectrum1D
 
+from jdaviz.configs.specviz2d.plugins.spectral_extraction import spectral_extraction
+
 GWCS_LT_0_18_1 = Version(gwcs.__version__) < Version('0.18.1')
 
 
+def _trace_spectrum2d():
+    # a 2D spectrum with a slightly tilted gaussian trace
+    y = np.arange(40)[:, np.newaxis]
+    x = np.arange(100)
+    data = 10 * np.exp(-0.5 * (y - 20 - 0.02 * x) ** 2 / 4) + 1
+    return Spectrum1D(flux=data * u.MJy)
+
+
 @pytest.mark.remote_data
 @pytest.mark.filterwarnings('ignore')
 def test_plugin(specviz2d_helper):
@@ -185,3 +197,92 @@ def test_spectrum_on_top(specviz2d_helper):
     pext = specviz2d_helper.app.get_tray_item_from_name('spectral-extraction')
     assert pext.bg_type_selected == 'OneSided'
     assert pext.bg_separation < 0
+
+
+@pytest.mark.filterwarnings('ignore')
+def test_preview_cache(specviz2d_helper):
+    specviz2d_helper.load_data(spectrum_2d=_trace_spectrum2d())
+    pext = specviz2d_helper.plugins['Spectral Extraction']._obj
+    pext.keep_active = True
+    pext.trace_type_selected = 'Polynomial'
+    assert len(pext.marks['trace'].x) == 100
+    assert len(pext.marks['extract'].x) == 100
+
+    trace = pext._preview_cache['trace'][2]
+    bg = pext._preview_cache['bg'][2]
+    extracted = pext._preview_cache['extract'][2]
+
+    # changing the extraction width re-uses the trace and background
+    pext.ext_width = 3
+    assert pext._preview_cache['trace'][2] is trace
+    assert pext._preview_cache['bg'][2] is bg
+    assert pext._preview_cache['extract'][2] is not extracted
+    assert pext.ext_specreduce_err == ''
+
+    # changing the background re-uses the trace
+    pext.bg_width = 2
+    assert pext.active_step == 'bg'
+    assert pext._preview_cache['trace'][2] is trace
+    assert pext._preview_cache['bg'][2] is not bg
+    assert len(pext.marks['bg_spec'].x) == 100
+
+    # previewed spectrum matches the exported one
+    np.testing.assert_allclose(pext.marks['extract'].y,
+                               pext.export_extract_spectrum().flux.value)
+
+
+class _FakeIOLoop:
+    def __init__(self):
+        self.callbacks = []
+
+    def add_callback(self, callback, *args):
+        self.callbacks.append((callback, args))
+
+    def call_later(self, delay, callback, *args):
+        self.callbacks.append((callback, args))
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback, args in callbacks:
+            callback(*args)
+
+
+@pytest.mark.filterwarnings('ignore')
+def test_preview_debounced(specviz2d_helper, monkeypatch):
+    specviz2d_helper.load_data(spectrum_2d=_trace_spectrum2d())
+    pext = specviz2d_helper.plugins['Spectral Extraction']._obj
+    pext.keep_active = True
+    assert len(pext.marks['ext_lower'].x) == 100
+
+    def mark_width():
+        return pext.marks['ext_upper'].y[0] - pext.marks['ext_lower'].y[0]
+
+    orig_width = pext.ext_width
+    assert mark_width() == orig_width
+
+    ioloop = _FakeIOLoop()
+    monkeypatch.setattr(spectral_extraction, 'get_ioloop', lambda: ioloop)
+
+    for width in (5, 6, 7):
+        pext.ext_width = width
+    ioloop.run()  # schedule the delayed requests
+    ioloop.run()  # submit the last request to the worker
+    assert pext._preview_future is not None
+    pext._preview_future.result()
+    # marks are only updated once the results are applied from the main thread
+    assert pext._preview_cache['extract'][0] == ('Boxcar', 7)
+    assert mark_width() == orig_width
+    # and so are the spinners, the worker does not set any traitlet itself
+    spinner_updates = [args[1:] for callback, args in ioloop.callbacks if callback is setattr]
+    assert spinner_updates == [('spinner', True), ('spinner', False)]
+    ioloop.run()
+    assert mark_width() == 7
+
+    # results of a request superseded while computing are discarded
+    pext.ext_width = 8
+    ioloop.run()
+    ioloop.run()
+    pext._preview_future.result()
+    pext.ext_width = 10
+    ioloop.run()
+    assert mark_width() == 7
@@ -254,7 +254,7 @@ class SpectralMarksChangedMessage(Message):
 
     @property
     def names_rest(self):
-        return [m.name_rest for m in self.marks]
+        return [name_rest for m in self.marks for name_rest in m.names_rest]
 
     @property
     def marks(self):
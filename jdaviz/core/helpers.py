@@ -9,6 +9,7 @@ on the motivation behind this concept.
 import re
 import warnings
 from contextlib import contextmanager
+from copy import deepcopy
 from inspect import isclass
 
 import numpy as np
@@ -90,19 +91,20 @@ class ConfigHelper(HubListener):
         # context managers.  Once they're all exited, then the linking/showing will
         # take place.
         self._in_batch_load += 1
-        with self.app.data_collection.delay_link_manager_update():
-            # user entrypoint (anything within the with-statement will get called here)
-            yield
+        with self.app._batch_state_updates():
+            with self.app.data_collection.delay_link_manager_update():
+                # user entrypoint (anything within the with-statement will get called here)
+                yield
 
-        self._in_batch_load -= 1
-        if not self._in_batch_load:
-            self.app.hub.broadcast(ExitBatchLoadMessage(sender=self.app))
+            self._in_batch_load -= 1
+            if not self._in_batch_load:
+                self.app.hub.broadcast(ExitBatchLoadMessage(sender=self.app))
 
-            # add any data to viewers that were requested but deferred
-            for data_label, viewer_ref in self._delayed_show_in_viewer_labels.items():
-                self.app.set_data_visibility(viewer_ref, data_label,
-                                             visible=True, replace=False)
-            self._delayed_show_in_viewer_labels = {}
+                # add any data to viewers that were requested but deferred
+                for data_label, viewer_ref in self._delayed_show_in_viewer_labels.items():
+                    self.app.set_data_visibility(viewer_ref, data_label,
+                                                 visible=True, replace=False)
+                self._delayed_show_in_viewer_labels = {}
 
     def load_data(self, data, data_label=None, parser_reference=None, **kwargs):
         if data_label:
@@ -467,6 +469,8 @@ class ConfigHelper(HubListener):
                         # convert the uncertainties to StdDevUncertainties, since
                         # that is assumed in a few places in jdaviz:
                         if uncertainty.unit is None:
+                            # do not modify the uncertainty of the input spectrum in place
+                            uncertainty = deepcopy(uncertainty)
                             uncertainty.unit = data.flux.unit
                         if hasattr(uncertainty, 'represent_as'):
                             new_uncert = uncertainty.represent_as(
@@ -542,6 +546,17 @@ class ConfigHelper(HubListener):
                 if cls is not None:  # pragma: no cover
                     raise ValueError("cls not supported for Trace object")
                 data = data.get_object()
+            elif cls == Spectrum1D and data.ndim == 3 and function:
+                # collapsing a cube is expensive, so share the collapsed spectrum with the
+                # spectrum viewer through the application object cache.  The cached spectrum is
+                # copied so that changes by the caller do not affect what the viewer shows.  Its
+                # metadata is only copied shallowly, as it holds the (e.g., original) cube.
+                cache_key = (data_label, function)
+                collapsed = self.app._get_object_cache.get(cache_key)
+                if collapsed is None:
+                    collapsed = data.get_object(cls=cls, **object_kwargs)
+                    self.app._get_object_cache[cache_key] = collapsed
+                data = deepcopy(collapsed, memo={id(collapsed.meta): dict(collapsed.meta)})
             else:
                 data = data.get_object(cls=cls, **object_kwargs)
 
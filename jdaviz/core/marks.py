@@ -11,8 +11,9 @@ from jdaviz.core.events import GlobalDisplayUnitChanged
 from jdaviz.core.events import (SliceToolStateMessage, LineIdentifyMessage,
                                 SpectralMarksChangedMessage,
                                 RedshiftMessage)
+from jdaviz.utils import spectral_axis_from_data
 
-__all__ = ['OffscreenLinesMarks', 'BaseSpectrumVerticalLine', 'SpectralLine',
+__all__ = ['OffscreenLinesMarks', 'BaseSpectrumVerticalLine', 'SpectralLineCollection',
            'SliceIndicatorMarks', 'ShadowMixin', 'ShadowLine', 'ShadowLabelFixedY',
            'PluginMark', 'LinesAutoUnit', 'PluginLine', 'PluginScatter',
            'LineAnalysisContinuum', 'LineAnalysisContinuumCenter',
@@ -53,11 +54,9 @@ class OffscreenLinesMarks(HubListener):
     def _update_counts(self, *args):
         oob_left, oob_right = 0, 0
         for m in self.viewer.figure.marks:
-            if isinstance(m, SpectralLine):
-                if m.x[0] < self.viewer.state.x_min:
-                    oob_left += 1
-                elif m.x[0] > self.viewer.state.x_max:
-                    oob_right += 1
+            if isinstance(m, SpectralLineCollection):
+                oob_left += np.count_nonzero(m.obs_values < self.viewer.state.x_min)
+                oob_right += np.count_nonzero(m.obs_values > self.viewer.state.x_max)
         self.left.text = [f'\u25c0 {oob_left}' if oob_left > 0 else '']
         self.right.text = [f'{oob_right} \u25b6' if oob_right > 0 else '']
 
@@ -111,8 +110,8 @@ class PluginMark:
 
         if self.yunit is not None and not np.all([s == 0 for s in self.y.shape]):
             if self.viewer.default_class is Spectrum1D:
-                spec = self.viewer.state.reference_data.get_object(cls=Spectrum1D)
-                eqv = u.spectral_density(spec.spectral_axis)
+                spectral_axis = spectral_axis_from_data(self.viewer.state.reference_data)
+                eqv = u.spectral_density(spectral_axis)
                 y = (self.y * self.yunit).to_value(unit, equivalencies=eqv)
             else:
                 y = (self.y * self.yunit).to_value(unit)
@@ -157,7 +156,7 @@ class BaseSpectrumVerticalLine(Lines, PluginMark, HubListener):
     def _update_reference_data(self, reference_data):
         if reference_data is None:
             return
-        self._update_data(reference_data.get_object(cls=Spectrum1D).spectral_axis)
+        self._update_data(spectral_axis_from_data(reference_data))
 
     def _update_data(self, x_all):
         # the x-units may have changed.  We want to convert the internal self.x
@@ -171,48 +170,62 @@ class BaseSpectrumVerticalLine(Lines, PluginMark, HubListener):
         self.xunit = new_unit
 
 
-class SpectralLine(BaseSpectrumVerticalLine):
+class SpectralLineCollection(Lines, PluginMark, HubListener):
     """
-    Subclass on bqplot Lines, mostly so that we can erase spectral lines
-    by eliminating any SpectralLines objects from a figures marks list. Also
-    lets us do wavelength redshifting here on mark creation.
+    Subclass on bqplot Lines to draw a collection of spectral lines as a single
+    NaN-separated trace, so that plotting a full line list only adds a single mark
+    to the figure.  Rest values are stored as an array so that redshifting and unit
+    conversion are vectorized over all lines in the collection, and lines are
+    identified by their index within the collection.
     """
-    def __init__(self, viewer, rest_value, redshift=0, name=None, **kwargs):
-        self._rest_value = rest_value
-        self._identify = False
-        self.name = name
-
-        # table_index is same as name_rest elsewhere
-        self.table_index = kwargs.pop("table_index", None)
+    def __init__(self, viewer, rest_values, names_rest, names=None, redshift=0, **kwargs):
+        self.viewer = viewer
+        self.names_rest = list(names_rest)
+        self.names = list(names) if names is not None else list(self.names_rest)
+        self._index = {name_rest: i for i, name_rest in enumerate(self.names_rest)}
+        self._redshift = redshift
+        self._identified = None
 
-        # setting redshift will set self.x and enable the obs_value property,
-        # but to do that we need x_unit set first (would normally be assigned
-        # in the super init)
-        self.xunit = u.Unit(viewer.state.x_display_unit)
-        self.redshift = redshift
+        # rest values are stored (as floats) in the display units of the viewer
+        self._rest_values = np.atleast_1d(
+            u.Quantity(rest_values).to_value(viewer.state.x_display_unit, u.spectral())
+        ).astype(float)
+        self._obs_values = self._rest_values.copy()
 
+        viewer.state.add_callback("reference_data", self._update_reference_data)
         viewer.session.hub.subscribe(self, LineIdentifyMessage,
                                      handler=self._process_identify_change)
 
-        super().__init__(viewer=viewer, x=self.obs_value, stroke_width=1,
+        scales = {'x': viewer.scales['x'], 'y': LinearScale(min=0, max=1)}
+        # the identified line is drawn on top of the collection with a wider stroke
+        self.identify_mark = Lines(x=[], y=[0, 1], scales=scales, stroke_width=3,
+                                   fill='none', close_path=False, visible=False,
+                                   colors=kwargs.get('colors', ['red']))
+
+        n_lines = len(self._rest_values)
+        # PluginMark.__init__ will set self.xunit and the observed values in self.x
+        super().__init__(x=np.full(n_lines * 3, np.nan),
+                         y=np.tile([0, 1, np.nan], n_lines),
+                         scales=scales, stroke_width=1,
                          fill='none', close_path=False, **kwargs)
 
     @property
-    def name_rest(self):
-        return self.table_index
+    def marks(self):
+        return [self, self.identify_mark]
 
-    @property
-    def rest_value(self):
-        return self._rest_value
+    def index(self, name_rest):
+        """
+        Index of the line with ``name_rest`` within this collection.
+        """
+        return self._index[name_rest]
 
     @property
-    def obs_value(self):
-        return self.x[0]
+    def rest_values(self):
+        return self._rest_values
 
-    def set_x_unit(self, unit=None):
-        prev_unit = self.xunit
-        super().set_x_unit(unit=unit)
-        self._rest_value = (self._rest_value * prev_unit).to_value(unit, u.spectral())
+    @property
+    def obs_values(self):
+        return self._obs_values
 
     @property
     def redshift(self):
@@ -221,44 +234,75 @@ class SpectralLine(BaseSpectrumVerticalLine):
     @redshift.setter
     def redshift(self, redshift):
         self._redshift = redshift
+        self._update_obs_values()
+
+    def _update_obs_values(self):
+        redshift = float(self._redshift)
         if str(self.xunit.physical_type) == 'length':
-            obs_value = self._rest_value*(1+redshift)
+            obs_values = self._rest_values*(1+redshift)
         elif str(self.xunit.physical_type) == 'frequency':
-            obs_value = self._rest_value/(1+redshift)
+            obs_values = self._rest_values/(1+redshift)
         else:
             # catch all for anything else (wavenumber, energy, etc)
-            rest_angstrom = (self._rest_value*self.xunit).to_value(u.Angstrom,
-                                                                   equivalencies=u.spectral())
+            rest_angstrom = (self._rest_values*self.xunit).to_value(u.Angstrom,
+                                                                    equivalencies=u.spectral())
             obs_angstrom = rest_angstrom*(1+redshift)
-            obs_value = (obs_angstrom*u.Angstrom).to_value(self.xunit,
-                                                           equivalencies=u.spectral())
-        self.x = [obs_value, obs_value]
+            obs_values = (obs_angstrom*u.Angstrom).to_value(self.xunit,
+                                                            equivalencies=u.spectral())
+        self._obs_values = obs_values
 
-    @property
-    def identify(self):
-        return self._identify
+        x = np.full((len(obs_values), 3), np.nan)
+        x[:, 0] = obs_values
+        x[:, 1] = obs_values
+        self.x = x.ravel()
+        self._update_identify_mark()
+
+    def set_x_unit(self, unit=None):
+        if unit is None:
+            if not hasattr(self.viewer.state, 'x_display_unit'):
+                return
+            unit = self.viewer.state.x_display_unit
+        unit = u.Unit(unit)
 
-    @identify.setter
-    def identify(self, identify):
-        if not isinstance(identify, bool):  # pragma: no cover
-            raise TypeError("identify must be of type bool")
+        if self.xunit is not None and unit != self.xunit:
+            self._rest_values = (self._rest_values * self.xunit).to_value(unit, u.spectral())
+        self.xunit = unit
+        # re-compute self.x from the current redshift (instead of converting that as well)
+        self._update_obs_values()
 
-        self._identify = identify
-        self.stroke_width = 3 if identify else 1
+    def set_y_unit(self, unit=None):
+        # the lines span the full height of the viewer in normalized coordinates,
+        # so there is nothing to convert
+        pass
 
-    def _process_identify_change(self, msg):
-        self.identify = msg.name_rest == self.table_index
+    def _update_reference_data(self, reference_data):
+        if reference_data is None:
+            return
+        self.set_x_unit(spectral_axis_from_data(reference_data).unit)
 
-    def _update_data(self, x_all):
-        new_unit = x_all.unit
-        if new_unit == self.xunit:
+    @property
+    def identified(self):
+        """
+        Index of the identified line within this collection, or `None`.
+        """
+        return self._identified
+
+    @identified.setter
+    def identified(self, index):
+        self._identified = index
+        self._update_identify_mark()
+
+    def _update_identify_mark(self):
+        if self._identified is None:
+            self.identify_mark.visible = False
             return
+        obs_value = self._obs_values[self._identified]
+        self.identify_mark.x = [obs_value, obs_value]
+        self.identify_mark.colors = self.colors
+        self.identify_mark.visible = True
 
-        old_quant = self._rest_value*self.xunit
-        self._rest_value = old_quant.to_value(new_unit, equivalencies=u.spectral())
-        # re-compute self.x from current redshift (instead of converting that as well)
-        self.redshift = self._redshift
-        self.xunit = new_unit
+    def _process_identify_change(self, msg):
+        self.identified = self._index.get(msg.name_rest)
 
 
 class SliceIndicatorMarks(BaseSpectrumVerticalLine, HubListener):
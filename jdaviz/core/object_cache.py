@@ -0,0 +1,162 @@
+"""The ``object_cache`` module houses the bounded cache used by the application
+to hold translated (e.g., collapsed ``Spectrum1D``) objects for loaded data.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+__all__ = ['ObjectCache', 'estimate_nbytes']
+
+# Default memory budget for cached objects, in bytes.
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+
+def estimate_nbytes(obj, _max_depth=4, _seen=None):
+    """Estimate the memory held by numpy buffers within an object.
+
+    The attributes of ``obj`` (and their attributes, up to a fixed depth) are
+    searched for numpy arrays, each buffer being counted once. This is meant to
+    capture the array data in objects such as ``Spectrum1D`` (flux, spectral
+    axis, uncertainty, mask), not the overhead of the Python objects themselves.
+
+    Parameters
+    ----------
+    obj : obj
+        Object to inspect.
+
+    Returns
+    -------
+    nbytes : int
+        Estimated size in bytes.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        # count the underlying buffer once even if shared by several views
+        base = obj
+        while isinstance(base.base, np.ndarray):
+            base = base.base
+        if base is not obj:
+            if id(base) in _seen:
+                return 0
+            _seen.add(id(base))
+        return base.nbytes
+
+    if _max_depth <= 0:
+        return 0
+
+    if isinstance(obj, dict):
+        children = obj.values()
+    elif isinstance(obj, (list, tuple)):
+        children = obj
+    else:
+        children = getattr(obj, '__dict__', {}).values()
+
+    return sum(estimate_nbytes(child, _max_depth=_max_depth - 1, _seen=_seen)
+               for child in children
+               if not isinstance(child, (str, bytes, int, float, type(None))))
+
+
+class ObjectCache:
+    """Least-recently-used cache with a memory budget.
+
+    Keys are ``(label, statistic)`` tuples where ``label`` is the label of a
+    data or subset layer, and values are the objects translated from that layer.
+    When the estimated size of the cached objects exceeds ``max_bytes``, the
+    least recently used entries are evicted.
+
+    Parameters
+    ----------
+    max_bytes : int or `None`
+        Memory budget in bytes. If `None`, ``DEFAULT_MAX_BYTES`` is used.
+    """
+    def __init__(self, max_bytes=None):
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._max_bytes = DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None and key not in self._entries:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self._entries:
+            self._pop(key)
+        nbytes = estimate_nbytes(value)
+        self._entries[key] = (value, nbytes)
+        self.nbytes += nbytes
+        self._evict()
+
+    def __delitem__(self, key):
+        if key not in self._entries:
+            raise KeyError(key)
+        self._pop(key)
+
+    @property
+    def max_bytes(self):
+        """Memory budget in bytes, evicting entries immediately when reduced."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._evict()
+
+    @property
+    def stats(self):
+        """Dictionary of cache statistics."""
+        return {'entries': len(self._entries), 'nbytes': self.nbytes,
+                'max_bytes': self._max_bytes, 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
+
+    def get(self, key, default=None):
+        """Return the cached value for ``key`` (marking it as recently used)
+        or ``default`` if it is not cached."""
+        if key not in self._entries:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def invalidate(self, label=None):
+        """Remove all entries for the given data or subset label, or every
+        entry if ``label`` is `None`."""
+        if label is None:
+            self._entries.clear()
+            self.nbytes = 0
+            return
+        for key in [k for k in self._entries if k[0] == label]:
+            self._pop(key)
+
+    def clear(self):
+        """Remove all entries."""
+        self.invalidate()
+
+    def _pop(self, key):
+        _, nbytes = self._entries.pop(key)
+        self.nbytes -= nbytes
+
+    def _evict(self):
+        # always keep the most recently added entry, even if on its own it exceeds the budget
+        while self.nbytes > self._max_bytes and len(self._entries) > 1:
+            self._pop(next(iter(self._entries)))
+            self.evictions += 1
@@ -0,0 +1,289 @@
+"""The ``parse_cache`` module houses an opt-in on-disk cache of the glue data
+produced by parsing a file, so that re-opening the same file (in this or a later
+session) can skip the parsing step entirely.
+
+Each entry is a directory holding one memory-mappable ``.npy`` file per data
+component and a JSON manifest with the coordinates, metadata, and units, keyed
+by the absolute path, modification time, and size of the parsed file.  Nothing
+is unpickled when loading an entry: FITS WCS are stored as headers and other
+WCS (e.g., GWCS) as ASDF files.
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+
+import asdf
+import numpy as np
+from astropy import units as u
+from astropy.io import fits
+from astropy.io.fits.header import _HeaderComments
+from astropy.wcs import WCS
+from glue.core import Data
+from glue_astronomy.translators.spectrum1d import PaddedSpectrumWCS
+from specutils import Spectrum1D
+
+from jdaviz.utils import spectral_axis_from_data
+
+__all__ = ['ParseCache', 'get_parse_cache']
+
+# Opt-in: set this environment variable (or pass ``cache_dir`` to ``load_data``)
+# to enable caching of parsed data products.
+CACHE_DIR_ENV = 'JDAVIZ_PARSE_CACHE_DIR'
+
+# Default on-disk budget for cached entries, in bytes.
+DEFAULT_MAX_BYTES = 20 * 1024 ** 3
+
+_MANIFEST = 'manifest.json'
+_MANIFEST_VERSION = 2
+
+
+def get_parse_cache(cache_dir=None):
+    """Return a `ParseCache` for ``cache_dir`` (or the directory set by the
+    ``JDAVIZ_PARSE_CACHE_DIR`` environment variable), or `None` if neither is set."""
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    return ParseCache(cache_dir)
+
+
+def _serialize_wcs(wcs, entry_dir, name):
+    if isinstance(wcs, WCS):
+        if wcs.cpdis1 or wcs.cpdis2 or wcs.det2im1 or wcs.det2im2:
+            # lookup-table distortions are not stored in the header
+            raise TypeError('cannot cache a WCS with lookup-table distortions')
+        return {'__type__': 'fits_wcs', 'header': wcs.to_header_string(relax=True),
+                'pixel_shape': wcs.pixel_shape}
+    filename = f'{name}.asdf'
+    asdf.AsdfFile({'wcs': wcs}).write_to(os.path.join(entry_dir, filename))
+    return {'__type__': 'asdf_wcs', 'file': filename}
+
+
+def _deserialize_wcs(serialized, entry_dir):
+    if serialized['__type__'] == 'fits_wcs':
+        wcs = WCS(fits.Header.fromstring(serialized['header']))
+        if serialized['pixel_shape'] is not None:
+            wcs.pixel_shape = serialized['pixel_shape']
+        return wcs
+    # read the file into memory, so that nothing is left open (or memory-mapped) by asdf
+    with open(os.path.join(entry_dir, serialized['file']), 'rb') as f:
+        buffer = io.BytesIO(f.read())
+    with asdf.open(buffer, lazy_load=False) as af:
+        return af.tree['wcs']
+
+
+def _serialize(obj, entry_dir, name):
+    """Convert ``obj`` (e.g., the metadata of a data) to something that can be written to
+    JSON, storing WCS in separate files in ``entry_dir`` (named after ``name``).  Raises
+    `TypeError` if ``obj`` cannot be serialized."""
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, dict):
+        if not all(isinstance(k, str) for k in obj):
+            raise TypeError('cannot cache a dictionary with non-string keys')
+        return {k: _serialize(v, entry_dir, f'{name}_{i}') for i, (k, v) in enumerate(obj.items())}
+    if isinstance(obj, (list, tuple)):
+        items = [_serialize(v, entry_dir, f'{name}_{i}') for i, v in enumerate(obj)]
+        return {'__type__': 'tuple', 'items': items} if isinstance(obj, tuple) else items
+    if isinstance(obj, _HeaderComments):
+        return {'__type__': 'header_comments', 'header': obj._header.tostring()}
+    if isinstance(obj, WCS) or hasattr(obj, 'forward_transform'):
+        return _serialize_wcs(obj, entry_dir, name)
+    raise TypeError(f'cannot cache {obj.__class__.__name__} objects')
+
+
+def _deserialize(obj, entry_dir):
+    if isinstance(obj, list):
+        return [_deserialize(v, entry_dir) for v in obj]
+    if not isinstance(obj, dict):
+        return obj
+    obj_type = obj.get('__type__')
+    if obj_type == 'tuple':
+        return tuple(_deserialize(v, entry_dir) for v in obj['items'])
+    if obj_type == 'header_comments':
+        return fits.Header.fromstring(obj['header']).comments
+    if obj_type in ('fits_wcs', 'asdf_wcs'):
+        return _deserialize_wcs(obj, entry_dir)
+    return {k: _deserialize(v, entry_dir) for k, v in obj.items()}
+
+
+def _serialize_coords(data, entry_dir, name):
+    coords = data.coords
+    if isinstance(coords, PaddedSpectrumWCS):
+        # the spectral GWCS is built from a lookup table, so store the spectral axis itself
+        spectral_axis = spectral_axis_from_data(data)
+        return {'__type__': 'padded', 'values': spectral_axis.value.tolist(),
+                'unit': spectral_axis.unit.to_string(), 'ndim': coords.pixel_n_dim}
+    return _serialize(coords, entry_dir, name)
+
+
+def _deserialize_coords(serialized, entry_dir):
+    if isinstance(serialized, dict) and serialized.get('__type__') == 'padded':
+        spectral_axis = np.asarray(serialized['values']) * u.Unit(serialized['unit'])
+        spec = Spectrum1D(flux=np.zeros(len(spectral_axis)) * u.one, spectral_axis=spectral_axis)
+        return PaddedSpectrumWCS(spec.wcs, serialized['ndim'])
+    return _deserialize(serialized, entry_dir)
+
+
+class ParseCache:
+    """On-disk cache of parsed glue data.
+
+    Parameters
+    ----------
+    cache_dir : str or path-like
+        Directory for the cache entries (created if it does not exist).
+    max_bytes : int or `None`
+        Maximum total size of the cache entries.  When exceeded, the least
+        recently used entries are removed.  If `None`, ``DEFAULT_MAX_BYTES`` is used.
+    """
+    def __init__(self, cache_dir, max_bytes=None):
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.max_bytes = DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def key(self, path, variant=''):
+        """Cache key for ``path`` based on its absolute path, modification time, and size.
+        ``variant`` distinguishes different parsings of the same file (e.g., a different
+        data label)."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        token = f'{path}|{stat.st_mtime_ns}|{stat.st_size}|{variant}'
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _entry_dir(self, path, variant=''):
+        return os.path.join(self.cache_dir, self.key(path, variant))
+
+    def load(self, path, variant=''):
+        """
+        Return the cached entries for ``path``, or `None` if it is not cached.
+
+        Returns
+        -------
+        entries : list of dict or `None`
+            Each entry has the keys ``label`` (data label), ``data``
+            (`~glue.core.data.Data` with copy-on-write memory-mapped components, so that
+            changes are never written back to the cache), ``viewers``
+            (viewer reference names the data was shown in), and ``role``
+            (e.g., ``'flux'``, ``'uncert'``, or `None`).
+        """
+        entry_dir = self._entry_dir(path, variant)
+        manifest_path = os.path.join(entry_dir, _MANIFEST)
+        if not os.path.isfile(manifest_path):
+            return None
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            if manifest.get('version') != _MANIFEST_VERSION:
+                return None
+            entries = [self._load_entry(entry_dir, item) for item in manifest['items']]
+        except Exception as e:  # pragma: no cover
+            logging.warning(f'Ignoring unreadable parse cache entry {entry_dir}: {repr(e)}')
+            return None
+        # mark as recently used for eviction, best effort (e.g., read-only cache directory)
+        try:
+            os.utime(manifest_path)
+        except OSError:
+            pass
+        return entries
+
+    def _load_entry(self, entry_dir, item):
+        data = Data(coords=_deserialize_coords(item['coords'], entry_dir), label=item['label'])
+        components = {}
+        for i, (label, units) in enumerate(item['components']):
+            arr = np.load(os.path.join(entry_dir, f"{item['index']}_{i}.npy"), mmap_mode='c')
+            data[label] = arr
+            data.get_component(label).units = units
+            components[label] = arr
+        meta = _deserialize(item['meta'], entry_dir)
+        if item['orig_spec'] is not None:
+            # rebuild the spectrum in its original units, sharing the flux buffer
+            wcs = _deserialize_wcs(item['orig_spec']['wcs'], entry_dir)
+            unit = u.Unit(item['orig_spec']['unit'])
+            meta['_orig_spec'] = Spectrum1D(flux=components['flux'] << unit, wcs=wcs)
+        data.meta.update(meta)
+        return {'label': item['label'], 'data': data,
+                'viewers': item['viewers'], 'role': item['role']}
+
+    def store(self, path, entries, variant=''):
+        """
+        Store the parsed ``entries`` (in the format returned by :meth:`load`) for ``path``.
+        Entries that cannot be serialized are not cached.
+
+        Returns
+        -------
+        stored : bool
+            Whether the entries were written to the cache.
+        """
+        entry_dir = self._entry_dir(path, variant)
+        tmp_dir = entry_dir + '.tmp'
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        try:
+            items = [self._store_entry(tmp_dir, index, entry)
+                     for index, entry in enumerate(entries)]
+            with open(os.path.join(tmp_dir, _MANIFEST), 'w') as f:
+                json.dump({'version': _MANIFEST_VERSION, 'path': os.path.abspath(path),
+                           'items': items}, f)
+        except Exception as e:
+            logging.warning(f'Could not cache parsed data for {path}: {repr(e)}')
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return False
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.rename(tmp_dir, entry_dir)
+        self.evict(keep=os.path.basename(entry_dir))
+        return True
+
+    def _store_entry(self, entry_dir, index, entry):
+        data = entry['data']
+        components = []
+        for i, cid in enumerate(data.main_components):
+            np.save(os.path.join(entry_dir, f'{index}_{i}.npy'),
+                    np.ascontiguousarray(data.get_data(cid)), allow_pickle=False)
+            components.append((cid.label, data.get_component(cid).units))
+        meta = dict(data.meta)
+        orig_spec = meta.pop('_orig_spec', None)
+        if orig_spec is not None:
+            orig_spec = {'wcs': _serialize_wcs(orig_spec.wcs, entry_dir, f'{index}_orig_spec'),
+                         'unit': orig_spec.flux.unit.to_string()}
+        item = {'index': index, 'label': entry['label'], 'viewers': list(entry['viewers']),
+                'role': entry['role'], 'components': components,
+                'meta': _serialize(meta, entry_dir, f'{index}_meta'),
+                'orig_spec': orig_spec,
+                'coords': _serialize_coords(data, entry_dir, f'{index}_coords')}
+        # fail early (before the manifest is written) if anything cannot be written to JSON
+        json.dumps(item)
+        return item
+
+    def entries(self):
+        """List of ``(key, nbytes, last_used)`` for all entries in the cache."""
+        result = []
+        for key in os.listdir(self.cache_dir):
+            entry_dir = os.path.join(self.cache_dir, key)
+            manifest_path = os.path.join(entry_dir, _MANIFEST)
+            if not os.path.isfile(manifest_path):
+                continue
+            nbytes = sum(os.path.getsize(os.path.join(entry_dir, f))
+                         for f in os.listdir(entry_dir))
+            result.append((key, nbytes, os.path.getmtime(manifest_path)))
+        return result
+
+    def evict(self, keep=None):
+        """Remove the least recently used entries until the cache fits within ``max_bytes``."""
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        total = sum(entry[1] for entry in entries)
+        for key, nbytes, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+            total -= nbytes
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        for key, _, _ in self.entries():
+            shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
@@ -1,6 +1,7 @@
+from astropy.coordinates import SphericalRepresentation
 from astropy.coordinates.sky_coordinate import SkyCoord
 from astropy.nddata import NDData
-from astropy.table import QTable
+from astropy.table import QTable, vstack
 from astropy.table.row import Row as QTableRow
 import astropy.units as u
 import bqplot
@@ -19,6 +20,7 @@ from glue.core import Data, HubListener
 from glue.core.link_helpers import LinkSame
 from glue.core.message import (DataCollectionAddMessage,
                                DataCollectionDeleteMessage,
+                               DataUpdateMessage,
                                SubsetCreateMessage,
                                SubsetDeleteMessage,
                                SubsetUpdateMessage)
@@ -31,7 +33,7 @@ from glue_jupyter.widgets.linked_dropdown import get_choices as _get_glue_choice
 from regions import PixelRegion
 from specutils import Spectrum1D
 from specutils.manipulation import extract_region
-from traitlets import Any, Bool, Dict, Float, HasTraits, List, Unicode, observe
+from traitlets import Any, Bool, Dict, Float, HasTraits, Int, List, Unicode, observe
 
 from ipywidgets import widget_serialization
 from ipypopout import PopoutButton
@@ -613,6 +615,10 @@ class SelectPluginComponent(BasePluginComponent, HasTraits):
         super().__init__(*args, **kwargs)
         self._selected_previous = None
         self._cached_properties = ["selected_obj", "selected_item"]
+        # verdicts of the filters per item (see _is_valid_item_cached), reset when the filters
+        # change and otherwise updated by the subclasses as individual items change
+        self._valid_items_cache = {}
+        self._valid_items_filters = None
 
         self._default_mode = default_mode
         self._default_text = default_text
@@ -826,6 +832,20 @@ class SelectPluginComponent(BasePluginComponent, HasTraits):
                 return False
         return True
 
+    def _is_valid_item_cached(self, item, key):
+        """
+        Return whether ``item`` passes the filters, re-using the verdict cached under ``key``
+        unless the filters have changed since.  Subclasses are responsible for dropping the
+        entry from ``_valid_items_cache`` whenever ``item`` itself changes.
+        """
+        filters = tuple(self.filters)
+        if filters != self._valid_items_filters:
+            self._valid_items_cache = {}
+            self._valid_items_filters = filters
+        if key not in self._valid_items_cache:
+            self._valid_items_cache[key] = self._is_valid_item(item)
+        return self._valid_items_cache[key]
+
     def _multiselect_changed(self, event):
         self._clear_cache()
         if self.is_multiselect:
@@ -1337,25 +1357,29 @@ class LayerSelect(SelectPluginComponent):
             viewer_names = [viewer_names]
         return [self._get_viewer(viewer) for viewer in viewer_names]
 
-    def _layer_to_dict(self, layer_label):
+    def _layer_to_dict(self, layer_label, viewer_layers=None):
+        # viewer_layers is a list of (viewer, layer) tuples with the given label, if not provided
+        # all selected viewers will be searched for layers with the label
+        if viewer_layers is None:
+            viewer_layers = [(viewer, layer) for viewer in self.viewer_objs
+                             for layer in viewer.layers if layer.layer.label == layer_label]
         is_subset = None
         colors = []
         visibilities = []
-        for viewer in self.viewer_objs:
-            for layer in viewer.layers:
-                if layer.layer.label == layer_label and is_not_wcs_only(layer.layer):
-                    if is_subset is None:
-                        is_subset = ((hasattr(layer, 'state') and hasattr(layer.state, 'subset_state')) or  # noqa
-                                     (hasattr(layer, 'layer') and hasattr(layer.layer, 'subset_state')))  # noqa
-
-                    if (getattr(viewer.state, 'color_mode', None) == 'Colormaps'
-                            and hasattr(layer.state, 'cmap')):
-                        colors.append(layer.state.cmap.name)
-                    else:
-                        colors.append(layer.state.color)
+        for viewer, layer in viewer_layers:
+            if is_not_wcs_only(layer.layer):
+                if is_subset is None:
+                    is_subset = ((hasattr(layer, 'state') and hasattr(layer.state, 'subset_state')) or  # noqa
+                                 (hasattr(layer, 'layer') and hasattr(layer.layer, 'subset_state')))  # noqa
+
+                if (getattr(viewer.state, 'color_mode', None) == 'Colormaps'
+                        and hasattr(layer.state, 'cmap')):
+                    colors.append(layer.state.cmap.name)
+                else:
+                    colors.append(layer.state.color)
 
-                    visibilities.append(getattr(layer.state, 'bitmap_visible', True)
-                                        and layer.visible)
+                visibilities.append(getattr(layer.state, 'bitmap_visible', True)
+                                    and layer.visible)
 
         return {"label": layer_label,
                 "is_subset": is_subset,
@@ -1450,26 +1474,24 @@ class LayerSelect(SelectPluginComponent):
     @observe('filters')
     def _update_layer_items(self, msg={}):
         # NOTE: _on_layers_changed is passed without a msg object during init
-        # TODO: Handle changes to just one item without recompiling the whole thing
         manual_items = [{'label': label} for label in self.manual_options]
+        layer_icons = self.app.state.layer_icons
+        only_wcs_layers = self.only_wcs_layers
+
+        # group the layers of all selected viewers by label in a single pass, the colors and
+        # visibilities across the viewers are then collected within _layer_to_dict.
         # use getattr so the super() call above doesn't try to access the attr before
         # it is initialized:
+        layers_by_label = {}
+        for viewer in self.viewer_objs:
+            for layer in getattr(viewer, 'layers', []):
+                layer_label = layer.layer.label
+                if ((layer_icons.get(layer_label) or only_wcs_layers)
+                        and self._is_valid_item(layer.layer)):
+                    layers_by_label.setdefault(layer_label, []).append((viewer, layer))
 
-        all_layers = [
-            layer for viewer in self.viewer_objs
-            for layer in getattr(viewer, 'layers', [])
-            if self._is_valid_item(layer.layer)
-        ]
-
-        # remove duplicates - we'll loop back through all selected viewers to get a list of colors
-        # and visibilities later within _layer_to_dict
-        layer_labels = [
-            layer.layer.label for layer in all_layers
-            if self.app.state.layer_icons.get(layer.layer.label) or
-            self.only_wcs_layers
-        ]
-        unique_layer_labels = list(set(layer_labels))
-        layer_items = [self._layer_to_dict(layer_label) for layer_label in unique_layer_labels]
+        layer_items = [self._layer_to_dict(layer_label, viewer_layers)
+                       for layer_label, viewer_layers in layers_by_label.items()]
 
         def _sort_by_icon(items_dict):
             icon = items_dict['icon']
@@ -1477,9 +1499,12 @@ class LayerSelect(SelectPluginComponent):
 
         layer_items.sort(key=_sort_by_icon)
 
-        self.items = manual_items + layer_items
-
-        self._apply_default_selection()
+        items = manual_items + layer_items
+        # send the new items and any resulting change to the selection to the UI at once
+        with self.plugin.hold_sync():
+            if items != self.items:
+                self.items = items
+            self._apply_default_selection()
 
     def update_wcs_only_filter(self, wcs_only):
         """
@@ -1705,6 +1730,7 @@ class SubsetSelect(SelectPluginComponent):
         return {"label": subset.label, "color": False, "type": False}
 
     def _delete_subset(self, subset):
+        self._valid_items_cache.pop(subset.label, None)
         # NOTE: calling .remove will not trigger traitlet update
         self.items = [s for s in self.items
                       if s['label'] != subset.label]
@@ -1730,10 +1756,18 @@ class SubsetSelect(SelectPluginComponent):
         return super()._is_valid_item(subset, locals())
 
     def _update_subset(self, subset, attribute=None):
-        if subset.label not in self.labels:
+        if attribute == 'subset_state':
+            # a new subset state can change the verdict of the filters (e.g., to a composite)
+            self._valid_items_cache.pop(subset.label, None)
+
+        # NOTE: a message is received for the subset of each data entry in the subset group, so
+        # the verdict of the filters is cached per subset label
+        labels = self.labels
+        if subset.label not in labels:
             # NOTE: this logic will need to be revisited if generic renaming of subsets is added
             # see https://github.com/spacetelescope/jdaviz/pull/1175#discussion_r829372470
-            if subset.label.startswith('Subset') and self._is_valid_item(subset):
+            if (subset.label.startswith('Subset')
+                    and self._is_valid_item_cached(subset, subset.label)):
                 # NOTE: += will not trigger traitlet update
                 self.items = self.items + [self._subset_to_dict(subset)]  # noqa
         else:
@@ -1743,10 +1777,11 @@ class SubsetSelect(SelectPluginComponent):
                 # we add support for renaming subsets
 
                 # NOTE: in-line replacement (self.spectral_subset_items[i] = ...)
-                # will not trigger traitlet update
-                self.items = [s if s['label'] != subset.label
-                              else self._subset_to_dict(subset)
-                              for s in self.items]
+                # will not trigger traitlet update, so only replace the entry if it changed
+                index = labels.index(subset.label)
+                item = self._subset_to_dict(subset)
+                if item != self.items[index]:
+                    self.items = self.items[:index] + [item] + self.items[index + 1:]
 
         if (attribute == 'subset_state' and
             ((self.is_multiselect and subset.label in self.selected)
@@ -2346,6 +2381,44 @@ class NonFiniteUncertaintyMismatchMixin(VuetifyTemplate, HubListener):
         self.non_finite_uncertainty_mismatch = bool(mismatch)
 
 
+def _linear_fit_along_last_axis(x, y, mask=None):
+    """
+    Least-squares fit of ``y = slope * x + intercept`` along the last axis
+    of ``y``, solved in closed form for all other indices at once (e.g.
+    for every spaxel of a cube).
+
+    Non-finite values of ``y`` and values where ``mask`` is `True` are
+    excluded from the fit. Slope and intercept are NaN where fewer than
+    two distinct ``x`` values remain.
+    """
+    x = np.asarray(x, dtype=float)
+    valid = np.isfinite(y)
+    if mask is not None:
+        valid &= ~mask
+
+    # Sums are taken relative to the mean of x to limit cancellation.
+    x0 = x.mean() if x.size else 0
+    dx = x - x0
+    if valid.all():
+        # the sums over x are the same for every spaxel
+        n = np.full(y.shape[:-1], x.size)
+        sum_x = np.full(y.shape[:-1], dx.sum())
+        sum_xx = np.full(y.shape[:-1], (dx ** 2).sum())
+    else:
+        y = np.where(valid, y, 0)
+        weights = valid.astype(y.dtype)
+        n = weights.sum(axis=-1)
+        sum_x = weights @ dx
+        sum_xx = weights @ dx ** 2
+    sum_y = y.sum(axis=-1)
+    sum_xy = y @ dx
+    denom = n * sum_xx - sum_x ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(denom > 0, (n * sum_xy - sum_x * sum_y) / denom, np.nan)
+        intercept = (sum_y - slope * sum_x) / n - slope * x0
+    return slope, intercept
+
+
 class SpectralContinuumMixin(VuetifyTemplate, HubListener):
     """
     Plugin select to choose options for a linear spectral continuum.
@@ -2526,22 +2599,20 @@ class SpectralContinuumMixin(VuetifyTemplate, HubListener):
         min_x = min(spectral_axis.value)
         if spatial_subset == 'per-pixel':
             # full_spectrum.flux is a cube, so we want to act on all spaxels independently
-            continuum_y = full_spectrum.flux[:, :, continuum_mask].value
-
-            def fit_continuum(continuum_y_spaxel):
-                return np.polyfit(continuum_x-min_x, continuum_y_spaxel, deg=1)
+            continuum_y = full_spectrum.flux.value[:, :, continuum_mask]
+            if full_spectrum.mask is not None:
+                continuum_y_mask = full_spectrum.mask[:, :, continuum_mask]
+            else:
+                continuum_y_mask = None
 
             # compute the linear fit for each spaxel independently, along the spectral axis
-            slopes_intercepts = np.apply_along_axis(fit_continuum, 2, continuum_y)
-            slopes = slopes_intercepts[:, :, 0]
-            intercepts = slopes_intercepts[:, :, 1]
-
-            # spectrum.spectral_axis is an array, but we need our continuum to have the same
-            # shape as the fluxes in the cube, so let's just duplicate to the correct shape
-            spectral_axis_cube = np.zeros(spectrum.flux.shape)
-            spectral_axis_cube[:, :] = spectrum.spectral_axis.value
+            slopes, intercepts = _linear_fit_along_last_axis(continuum_x-min_x, continuum_y,
+                                                             mask=continuum_y_mask)
 
-            continuum = slopes[:, :, np.newaxis] * (spectral_axis_cube-min_x) + intercepts[:, :, np.newaxis]  # noqa
+            # broadcast the spectral axis against the per-spaxel slopes and intercepts
+            # to get a continuum with the same shape as the fluxes in the cube
+            continuum = (slopes[:, :, np.newaxis] * (spectrum.spectral_axis.value-min_x)
+                         + intercepts[:, :, np.newaxis])
         else:
             continuum_y = full_spectrum.flux[continuum_mask].value
             slope, intercept = np.polyfit(continuum_x-min_x, continuum_y, deg=1)
@@ -2711,12 +2782,25 @@ class ViewerSelect(SelectPluginComponent):
     @observe('filters')
     def _on_viewers_changed(self, msg=None):
         # NOTE: _on_viewers_changed is passed without a msg object during init
+        # only the viewer in the message (if any) is re-filtered, the cached verdicts are re-used
+        # for all other viewers
+        viewer_id = getattr(msg, 'viewer_id', None)
+        if viewer_id is not None:
+            self._valid_items_cache.pop(viewer_id, None)
+        elif msg is None or isinstance(msg, (AddDataMessage, RemoveDataMessage)):
+            self._valid_items_cache = {}
+
         # list of dictionaries with id, ref, ref_or_id
         was_empty = len(self.items) == 0
         manual_items = [{'label': label} for label in self.manual_options]
-        self.items = manual_items + [{k: v for k, v in vd.items() if k != 'viewer'}
-                                     for vd in self.viewer_dicts if self._is_valid_item(vd['viewer'])]  # noqa
-        self._apply_default_selection(skip_if_current_valid=not was_empty)
+        items = manual_items + [{k: v for k, v in vd.items() if k != 'viewer'}
+                                for vd in self.viewer_dicts
+                                if self._is_valid_item_cached(vd['viewer'], vd['id'])]
+        # send the new items and any resulting change to the selection to the UI at once
+        with self.plugin.hold_sync():
+            if items != self.items:
+                self.items = items
+            self._apply_default_selection(skip_if_current_valid=not was_empty)
 
 
 class ViewerSelectMixin(VuetifyTemplate, HubListener):
@@ -2839,8 +2923,13 @@ class DatasetSelect(SelectPluginComponent):
         self.hub.subscribe(self, RemoveDataMessage, handler=self._on_data_changed)
         self.hub.subscribe(self, DataCollectionAddMessage, handler=self._on_data_changed)
         self.hub.subscribe(self, DataCollectionDeleteMessage, handler=self._on_data_changed)
+        self.hub.subscribe(self, DataUpdateMessage, handler=self._on_data_changed,
+                           filter=lambda msg: msg.attribute == 'label')
+        # viewers (and so their layers) can be created or destroyed without any data message
+        self.hub.subscribe(self, ViewerAddedMessage, handler=self._on_data_changed)
+        self.hub.subscribe(self, ViewerRemovedMessage, handler=self._on_data_changed)
 
-        self.app.state.add_callback('layer_icons', lambda _: self._on_data_changed())
+        self.app.state.add_callback('layer_icons', lambda _: self._update_items())
         # initialize items from original viewers
         self._on_data_changed()
 
@@ -2859,7 +2948,7 @@ class DatasetSelect(SelectPluginComponent):
         def _subset_update(msg):
             if msg.attribute == 'subset_state':
                 if get_subset_type(msg.subset) == 'spatial':
-                    self._on_data_changed()
+                    self._update_items()
 
         self.hub.subscribe(self, SubsetUpdateMessage,
                            handler=_subset_update)
@@ -2969,24 +3058,47 @@ class DatasetSelect(SelectPluginComponent):
 
     @observe('filters')
     def _on_data_changed(self, msg=None):
-        # NOTE: _on_data_changed is passed without a msg object during init
-        # future improvement: don't recreate the entire list when msg is passed
+        # NOTE: _on_data_changed is passed without a msg object during init.  When a message with
+        # a data entry is passed, only that entry is re-filtered and the cached verdicts are re-used
+        # for all other entries.  Otherwise (e.g., viewers were created or destroyed) all entries
+        # are re-filtered.
+        data = getattr(msg, 'data', None)
+        if data is not None:
+            self._valid_items_cache.pop(data.uuid, None)
+        else:
+            self._valid_items_cache = {}
+        self._update_items(data)
+
+    def _update_items(self, data=None):
+        # Rebuild the items from the cached verdicts of the filters, which is all that is needed
+        # when only the layer icons or spatial subsets change.  ``data`` is the data entry that
+        # changed, if any.
+        layer_icons = self.app.state.layer_icons
+
         def _dc_to_dict(data):
             d = {'label': data.label,
-                 'icon': self.app.state.layer_icons.get(data.label)}
+                 'icon': layer_icons.get(data.label)}
 
             return d
 
         manual_items = [{'label': label} for label in self.manual_options]
-        self.items = manual_items + [_dc_to_dict(data) for data in self.app.data_collection
-                                     if self._is_valid_item(data)]
+        items = manual_items + [_dc_to_dict(data) for data in self.app.data_collection
+                                if self._is_valid_item_cached(data, data.uuid)]
         if getattr(self, '_include_spatial_subsets', False):
             # allow for spatial subsets to be listed
-            self.items = self.items + [_dc_to_dict(subset) for subset in self.app.data_collection.subset_groups  # noqa
-                                       if get_subset_type(subset) == 'spatial']
-        self._apply_default_selection()
-        # future improvement: only clear cache if the selected data entry was changed?
-        self._clear_cache(*self._cached_properties)
+            items += [_dc_to_dict(subset) for subset in self.app.data_collection.subset_groups
+                      if get_subset_type(subset) == 'spatial']
+
+        items_changed = items != self.items
+        # send the new items and any resulting change to the selection to the UI at once
+        with self.plugin.hold_sync():
+            if items_changed:
+                self.items = items
+            self._apply_default_selection()
+
+        selected = self.selected if self.is_multiselect else [self.selected]
+        if items_changed or data is None or data.label in selected:
+            self._clear_cache(*self._cached_properties)
 
 
 class DatasetSelectMixin(VuetifyTemplate, HubListener):
@@ -3894,10 +4006,19 @@ class Table(PluginSubcomponent):
 
     headers_visible = List([]).tag(sync=True)  # list of strings
     headers_avail = List([]).tag(sync=True)   # list of strings
-    items = List().tag(sync=True)  # list of dictionaries, pass single dict to add_row
+    items = List().tag(sync=True)  # list of dictionaries for the rows on the current page
+    items_count = Int(0).tag(sync=True)  # total number of rows in the table
+    page = Int(1).tag(sync=True)
+    items_per_page = Int(10).tag(sync=True)  # -1 to show all rows
+    sort_by = List([]).tag(sync=True)
+    sort_desc = List([]).tag(sync=True)
 
     def __init__(self, plugin, *args, **kwargs):
         self._qtable = None
+        # rows of the table, formatted for the UI.  Only the rows on the current page are sent to
+        # the UI (through ``items``).
+        self._rows = []
+        self._sort_order = None
         super().__init__(plugin, 'Table', *args, **kwargs)
 
     def default_value_for_column(self, colname=None, value=None):
@@ -3915,6 +4036,80 @@ class Table(PluginSubcomponent):
     def _new_col_visible(colname):
         return True
 
+    @staticmethod
+    def _float_format(column):
+        if column in ('slice', 'index'):
+            # stored in astropy table as a float so we can also store nans,
+            # but should display in the UI without any decimals
+            return ".0f"
+        elif column in ('pixel', ):
+            return "0.3f"
+        elif column in ('xcenter', 'ycenter'):
+            return "0.1f"
+        elif column in ('sum', ):
+            return ".3e"
+        return "0.5f"
+
+    @staticmethod
+    def _json_safe(column, item):
+        def float_precision(column, item):
+            return f"{item:{Table._float_format(column)}}"
+
+        if isinstance(item, SkyCoord):
+            return item.to_string('hmsdms', precision=4)
+        if isinstance(item, u.Quantity) and not np.isnan(item):
+            return f"{float_precision(column, item.value)} {item.unit.to_string()}"
+
+        if hasattr(item, 'to_string'):
+            return item.to_string()
+        if isinstance(item, float) and np.isnan(item):
+            return ''
+        if isinstance(item, tuple) and np.all([np.isnan(i) for i in item]):
+            return ''
+
+        if isinstance(item, float):
+            return float_precision(column, item)
+        elif isinstance(item, (list, tuple)):
+            return [float_precision(column, i) if isinstance(i, float) else i for i in item]
+
+        return item
+
+    @staticmethod
+    def _json_safe_column(colname, column):
+        """
+        Format all the entries of a column for the UI at once, equivalent to calling
+        ``_json_safe`` on each entry.
+        """
+        if isinstance(column, SkyCoord):
+            # same as column.to_string('hmsdms', precision=4), which formats each coordinate
+            # separately
+            sph = column.frame.represent_as(SphericalRepresentation)
+            lon = sph.lon.to_string(unit=u.hour, pad=True, precision=4)
+            lat = sph.lat.to_string(unit=u.degree, pad=True, alwayssign=True, precision=4)
+            return np.char.add(np.char.add(lon, ' '), lat).tolist()
+
+        values = getattr(column, 'value', column)
+        is_quantity = isinstance(column, u.Quantity)
+        supported_ndim = (1, ) if is_quantity else (1, 2)
+        if (isinstance(column, np.ma.MaskedArray) or not isinstance(values, np.ndarray)
+                or values.dtype.kind != 'f' or values.ndim not in supported_ndim):
+            return [Table._json_safe(colname, item) for item in column]
+
+        isnan = np.isnan(values)
+        formatted = np.char.mod(f"%{Table._float_format(colname)}", values).astype(object)
+        if is_quantity:
+            formatted = formatted + f" {column.unit.to_string()}"
+            # nans fall back on Quantity.to_string
+            formatted[isnan] = [item.to_string() for item in column[isnan]]
+        elif values.ndim == 1:
+            formatted[isnan] = ''
+        else:
+            formatted = formatted.tolist()
+            for i in np.flatnonzero(np.all(isnan, axis=1)):
+                formatted[i] = ''
+            return formatted
+        return formatted.tolist()
+
     def add_item(self, item):
         """
         Add an item/row to the table.
@@ -3923,44 +4118,8 @@ class Table(PluginSubcomponent):
         ----------
         item : QTable, QTableRow, or dictionary of row-name, value pairs
         """
-        def json_safe(column, item):
-            def float_precision(column, item):
-                if column in ('slice', 'index'):
-                    # stored in astropy table as a float so we can also store nans,
-                    # but should display in the UI without any decimals
-                    return f"{item:.0f}"
-                elif column in ('pixel', ):
-                    return f"{item:0.3f}"
-                elif column in ('xcenter', 'ycenter'):
-                    return f"{item:0.1f}"
-                elif column in ('sum', ):
-                    return f"{item:.3e}"
-                else:
-                    return f"{item:0.5f}"
-
-            if isinstance(item, SkyCoord):
-                return item.to_string('hmsdms', precision=4)
-            if isinstance(item, u.Quantity) and not np.isnan(item):
-                return f"{float_precision(column, item.value)} {item.unit.to_string()}"
-
-            if hasattr(item, 'to_string'):
-                return item.to_string()
-            if isinstance(item, float) and np.isnan(item):
-                return ''
-            if isinstance(item, tuple) and np.all([np.isnan(i) for i in item]):
-                return ''
-
-            if isinstance(item, float):
-                return float_precision(column, item)
-            elif isinstance(item, (list, tuple)):
-                return [float_precision(column, i) if isinstance(i, float) else i for i in item]
-
-            return item
-
         if isinstance(item, QTable):
-            for row in item:
-                self.add_item(row)
-            return
+            return self.add_items(item)
         if isinstance(item, QTableRow):
             # Row does not have .items() implemented
             item = {k: v for k, v in zip(item.keys(), item.values())}
@@ -3985,17 +4144,109 @@ class Table(PluginSubcomponent):
             self.headers_visible = self.headers_visible + [m for m in missing_headers if self._new_col_visible(m)]  # noqa
 
         # clean data to show in the UI
-        self.items = self.items + [{k: json_safe(k, v) for k, v in item.items()}]
+        self._append_rows([{k: self._json_safe(k, v) for k, v in item.items()}])
+
+    def add_items(self, items):
+        """
+        Add multiple items/rows to the table at once.  Rows of a QTable with the same columns
+        as the table are appended and formatted column-by-column, and the UI is only updated once.
+
+        Parameters
+        ----------
+        items : QTable or list of QTableRow or dictionaries of row-name, value pairs
+        """
+        if not isinstance(items, QTable):
+            items = [{k: v for k, v in zip(item.keys(), item.values())}
+                     if isinstance(item, QTableRow) else item for item in items]
+            if len(items) and all(item.keys() == items[0].keys() for item in items):
+                items = QTable(rows=items)
+            else:
+                for item in items:
+                    self.add_item(item)
+                return
+
+        if not len(items):
+            return
+        if self._qtable is None or set(items.colnames) != set(self._qtable.colnames):
+            # the first row creates the table (or adds any missing columns to it)
+            self.add_item(items[0])
+            items = items[1:]
+        if set(items.colnames) != set(self._qtable.colnames):
+            for row in items:
+                self.add_item(row)
+            return
+        if not len(items):
+            return
+
+        self._qtable = vstack([self._qtable, items[self._qtable.colnames]],
+                              join_type='exact', metadata_conflicts='silent')
+        columns = [self._json_safe_column(colname, items[colname]) for colname in items.colnames]
+        self._append_rows([dict(zip(items.colnames, values)) for values in zip(*columns)])
+
+    def _append_rows(self, rows):
+        self._rows.extend(rows)
+        self._sort_order = None
+        self._update_items()
+
+    def _sort_key(self, colname):
+        if self._qtable is not None and colname in self._qtable.colnames:
+            column = self._qtable[colname]
+            try:
+                key = np.asarray(getattr(column, 'value', column))
+            except Exception:  # pragma: no cover
+                key = None
+            if key is not None and key.ndim == 1 and key.dtype.kind in 'biufUS':
+                return key
+        # fallback on the entries shown in the UI
+        return np.array([str(row.get(colname, '')) for row in self._rows])
+
+    def _get_sort_order(self):
+        if not len(self.sort_by):
+            return None
+        if self._sort_order is None:
+            order = np.arange(len(self._rows))
+            # sort by the last column first so that ties are resolved by the previous columns
+            for i in range(len(self.sort_by) - 1, -1, -1):
+                key = self._sort_key(self.sort_by[i])[order]
+                desc = i < len(self.sort_desc) and self.sort_desc[i]
+                if desc and key.dtype.kind in 'biuf':
+                    # negate instead of reversing to keep nans last and ties in order
+                    inds = np.argsort(-key.astype(float), kind='stable')
+                else:
+                    inds = np.argsort(key, kind='stable')
+                    if desc:
+                        inds = inds[::-1]
+                order = order[inds]
+            self._sort_order = order
+        return self._sort_order
+
+    @observe('page', 'items_per_page', 'sort_by', 'sort_desc')
+    def _update_items(self, event={}):
+        if event.get('name') in ('sort_by', 'sort_desc'):
+            self._sort_order = None
+        order = self._get_sort_order()
+        if self.items_per_page > 0:
+            start = (self.page - 1) * self.items_per_page
+            inds = slice(start, start + self.items_per_page)
+        else:
+            inds = slice(None)
+        rows = self._rows[inds] if order is None else [self._rows[i] for i in order[inds]]
+        with self.hold_sync():
+            self.items_count = len(self._rows)
+            self.items = rows
 
     def __len__(self):
-        return len(self.items)
+        return len(self._rows)
 
     def clear_table(self):
         """
         Clear all entries/markers from the current table.
         """
-        self.items = []
         self._qtable = None
+        self._rows = []
+        self._sort_order = None
+        self.page = 1
+        self._update_items()
 
     def vue_clear_table(self, data=None):
         # if the plugin (or via the TableMixin) has its own clear_table implementation,
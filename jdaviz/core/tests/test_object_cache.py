@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from astropy import units as u
+from specutils import Spectrum1D
+
+from jdaviz.core.object_cache import ObjectCache, estimate_nbytes
+
+
+def test_estimate_nbytes():
+    arr = np.zeros(1000)
+    assert estimate_nbytes(arr) == 8000
+    # views of the same buffer are only counted once
+    assert estimate_nbytes([arr, arr[:10], arr.reshape(10, 100)]) == 8000
+
+    sp = Spectrum1D(flux=np.zeros(1000) * u.Jy, spectral_axis=np.arange(1000) * u.um)
+    assert estimate_nbytes(sp) >= 16000
+
+
+def test_object_cache_lru():
+    cache = ObjectCache(max_bytes=3000)
+    for i in range(3):
+        cache[(f'data{i}', None)] = np.zeros(100)
+    assert cache.nbytes == 2400
+    assert cache.get(('data0', None)) is not None
+    assert cache.get(('missing', None)) is None
+    with pytest.raises(KeyError):
+        cache[('missing', None)]
+
+    # data1 is now the least recently used entry
+    cache[('data3', None)] = np.zeros(100)
+    assert list(cache) == [('data2', None), ('data0', None), ('data3', None)]
+    assert cache.stats == {'entries': 3, 'nbytes': 2400, 'max_bytes': 3000,
+                           'hits': 1, 'misses': 2, 'evictions': 1}
+
+    # reducing the budget evicts immediately, but keeps the latest entry
+    cache.max_bytes = 100
+    assert list(cache) == [('data3', None)]
+    assert cache.evictions == 3
+
+    cache[('data3', 'Sum')] = np.zeros(5)
+    cache.invalidate('data3')
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_object_cache_invalidation(cubeviz_helper, spectrum1d_cube):
+    cubeviz_helper.load_data(spectrum1d_cube, data_label='test')
+    app = cubeviz_helper.app
+    sv = app.get_viewer('spectrum-viewer')
+    sv.data()
+    assert any(key[0] == 'test[FLUX]' for key in app._get_object_cache)
+
+    data = app.data_collection['test[FLUX]']
+    comp = data.id['flux']
+    data.update_components({comp: data.get_data(comp) * 2})
+    assert not any(key[0] == 'test[FLUX]' for key in app._get_object_cache)
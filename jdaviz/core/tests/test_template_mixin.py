@@ -2,9 +2,14 @@ import pytest
 import numpy as np
 import astropy.units as u
 
+from astropy.coordinates import SkyCoord
+from astropy.table import QTable
 from glue.core.roi import XRangeROI, CircularROI
+from numpy.testing import assert_allclose
 from specutils import Spectrum1D
 
+from jdaviz.core.template_mixin import Table, _linear_fit_along_last_axis
+
 
 def test_spectralsubsetselect(specviz_helper, spectrum1d):
     # apply mask to spectrum to check selected subset is masked:
@@ -124,3 +129,129 @@ def test_viewer_select(cubeviz_helper, spectrum1d_cube):
     # try setting based on id instead of reference
     p.viewer_selected = p.viewer.ids[0]
     assert p.viewer_selected == p.viewer.labels[0]
+
+
+def test_dataset_select_incremental(specviz_helper, spectrum1d):
+    app = specviz_helper.app
+    specviz_helper.load_data(spectrum1d, data_label='test')
+    p = app.get_tray_item_from_name('g-gaussian-smooth')
+    assert p.dataset.labels == ['test']
+
+    # only the data entry in each message is passed through the filters again
+    checked = []
+    orig_is_valid_item = p.dataset._is_valid_item
+
+    def _is_valid_item(data):
+        checked.append(data.label)
+        return orig_is_valid_item(data)
+
+    p.dataset._is_valid_item = _is_valid_item
+
+    app.add_data(spectrum1d, 'other')
+    assert p.dataset.labels == ['test']  # not shown in any viewer
+    app.add_data_to_viewer('spectrum-viewer', 'other')
+    assert p.dataset.labels == ['test', 'other']
+    assert set(checked) == {'other'}
+
+    app.data_collection['other'].label = 'renamed'
+    assert p.dataset.labels == ['test', 'renamed']
+    p.dataset_selected = 'renamed'
+
+    checked.clear()
+    app.remove_data_from_viewer('spectrum-viewer', 'renamed')
+    assert p.dataset.labels == ['test']
+    assert p.dataset_selected == 'test'
+    assert set(checked) == {'renamed'}
+
+    # changing the filters passes all data entries through the filters again
+    checked.clear()
+    p.dataset.add_filter('is_trace')
+    p.dataset._on_data_changed()
+    assert p.dataset.labels == []
+    assert sorted(checked) == ['renamed', 'test']
+
+
+def test_dataset_select_refresh(imviz_helper):
+    imviz_helper.load_data(np.zeros((4, 4)), data_label='a')
+    imviz_helper.create_image_viewer(viewer_name='v2')
+    imviz_helper.load_data(np.ones((4, 4)), data_label='b', show_in_viewer=False)
+    imviz_helper.app.add_data_to_viewer('v2', 'b')
+    ap = imviz_helper.plugins['Aperture Photometry']._obj
+    assert ap.dataset.labels == ['a', 'b']
+
+    # destroying the only viewer with 'b' drops it, without any data message
+    imviz_helper.destroy_viewer('v2')
+    assert ap.dataset.labels == ['a']
+
+    # a refresh without a message passes all data entries through the filters again
+    data_a = imviz_helper.app.data_collection['a']
+    ap.dataset._valid_items_cache[data_a.uuid] = False
+    ap.dataset._on_data_changed()
+    assert ap.dataset.labels == ['a']
+
+
+def test_table_add_items(imviz_helper):
+    table = Table(imviz_helper.plugins['Markers']._obj)
+    n = 25
+    qtable = QTable({'xcenter': np.arange(n, dtype=float),
+                     'sum': np.linspace(1, 2, n) * u.Jy,
+                     'sky': SkyCoord(np.linspace(0, 10, n) * u.deg, np.zeros(n) * u.deg),
+                     'label': [f'source {i}' for i in range(n)]})
+    qtable['xcenter'][1] = np.nan
+    qtable['sum'][2] = np.nan
+    table.add_items(qtable[:5])
+    table.add_item(qtable[5])
+    table.add_items(qtable[6:])
+    assert len(table) == table.items_count == n
+    assert len(table.export_table()) == n
+
+    # formatting the full columns is equivalent to formatting each entry
+    for row, expected_row in zip(table._rows, qtable):
+        assert row == {k: Table._json_safe(k, v)
+                       for k, v in zip(expected_row.keys(), expected_row.values())}
+    assert table._rows[1]['xcenter'] == ''
+
+    # only the rows on the current page are sent to the UI
+    assert [item['label'] for item in table.items] == [f'source {i}' for i in range(10)]
+    table.page = 3
+    assert [item['label'] for item in table.items] == [f'source {i}' for i in range(20, 25)]
+
+    table.sort_by = ['xcenter']
+    table.sort_desc = [True]
+    table.page = 1
+    assert table.items[0]['label'] == 'source 24'
+    # nans are sorted last
+    table.page = 3
+    assert table.items[-1]['label'] == 'source 1'
+
+    table.clear_table()
+    assert len(table) == table.items_count == 0
+    assert table.items == []
+    assert table.page == 1
+
+
+def test_linear_fit_along_last_axis():
+    rng = np.random.default_rng(42)
+    x = np.linspace(0, 4, 50)
+    y = 0.5 * x + 2 + rng.normal(0, 0.1, (6, 5, x.size))
+
+    # reference: independent np.polyfit for each spaxel
+    expected = np.apply_along_axis(lambda y_spaxel: np.polyfit(x, y_spaxel, deg=1), 2, y)
+    slopes, intercepts = _linear_fit_along_last_axis(x, y)
+    assert slopes.shape == intercepts.shape == (6, 5)
+    assert_allclose(slopes, expected[..., 0])
+    assert_allclose(intercepts, expected[..., 1])
+
+    # non-finite and masked values are excluded from the fit of their spaxel only
+    y[0, 0, 3] = np.nan
+    mask = np.zeros(y.shape, dtype=bool)
+    mask[1, 1, :10] = True
+    # too few valid values left to fit
+    mask[2, 2, 1:] = True
+    slopes, intercepts = _linear_fit_along_last_axis(x, y, mask=mask)
+    assert_allclose([slopes[0, 0], intercepts[0, 0]],
+                    np.polyfit(np.delete(x, 3), np.delete(y[0, 0], 3), deg=1))
+    assert_allclose([slopes[1, 1], intercepts[1, 1]],
+                    np.polyfit(x[10:], y[1, 1, 10:], deg=1))
+    assert np.isnan(slopes[2, 2]) and np.isnan(intercepts[2, 2])
+    assert_allclose(slopes[3:], expected[3:, :, 0])
@@ -17,7 +17,7 @@ from glue_jupyter.bqplot.common.tools import (CheckableTool,
 from bqplot.interacts import BrushSelector, BrushIntervalSelector
 
 from jdaviz.core.events import LineIdentifyMessage, SpectralMarksChangedMessage
-from jdaviz.core.marks import SpectralLine
+from jdaviz.core.marks import SpectralLineCollection
 
 __all__ = []
 
@@ -342,7 +342,9 @@ class SelectLine(CheckableTool, HubListener):
         # yes this would be avoid a list-comprehension by putting in
         # _on_plotted_lines_changed, but by leaving it here, we let
         # the marks worry about unit conversions
-        lines_x = np.array([mark.obs_value for mark in self.line_marks])
+        if not len(self.line_marks):
+            return
+        lines_x = np.concatenate([mark.obs_values for mark in self.line_marks])
         if not len(lines_x):
             return
         ind = np.argmin(abs(lines_x - data['domain']['x']))
@@ -351,7 +353,8 @@ class SelectLine(CheckableTool, HubListener):
         self.viewer.session.hub.broadcast(msg)
 
     def is_visible(self):
-        return len([m for m in self.viewer.figure.marks if isinstance(m, SpectralLine)]) > 0
+        return len([m for m in self.viewer.figure.marks
+                    if isinstance(m, SpectralLineCollection)]) > 0
 
 
 @viewer_tool
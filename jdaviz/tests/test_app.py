@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from jdaviz import Application, Specviz
@@ -143,6 +144,20 @@ def test_case_that_used_to_break_return_label(specviz_helper, spectrum1d):
     assert dc[1].label == "this used to break (2)"
 
 
+def test_unique_name_after_rename_and_remove(specviz_helper, spectrum1d):
+    dc = specviz_helper.app.data_collection
+    specviz_helper.load_data(spectrum1d, data_label="test")
+    specviz_helper.load_data(spectrum1d, data_label="test")
+    assert specviz_helper.app.return_unique_name("test") == "test (2)"
+
+    dc["test (1)"].label = "renamed"
+    assert specviz_helper.app.return_unique_name("test") == "test (1)"
+    assert specviz_helper.app.return_unique_name("renamed") == "renamed (1)"
+
+    dc.remove(dc["test"])
+    assert specviz_helper.app.return_unique_name("test") == "test"
+
+
 def test_viewer_renaming_specviz(specviz_helper):
     viewer_names = [
         'spectrum-viewer',
@@ -170,3 +185,26 @@ def test_viewer_renaming_imviz(imviz_helper):
             old_reference='non-existent',
             new_reference='this-is-forbidden'
         )
+
+
+def test_batched_state_updates(imviz_helper):
+    app = imviz_helper.app
+    changes = []
+    app.state.add_callback('data_items', lambda _: changes.append('data_items'))
+    app.state.add_callback('layer_icons', lambda _: changes.append('layer_icons'))
+
+    arr = np.zeros((2, 2))
+    with imviz_helper.batch_load():
+        for i in range(3):
+            imviz_helper.load_data(arr, data_label=f'image_{i}')
+        # the state is updated right away, only the callbacks are delayed
+        assert len(app.state.data_items) == 3
+        assert changes == []
+
+    assert sorted(changes) == ['data_items', 'layer_icons']
+    assert app.state.layer_icons == {'image_0': 'a', 'image_1': 'b', 'image_2': 'c'}
+
+    # outside of batch_load, each load triggers the callbacks once
+    imviz_helper.load_data(arr, data_label='image_3')
+    assert sorted(changes) == ['data_items', 'data_items', 'layer_icons', 'layer_icons']
+    assert app.state.layer_icons['image_3'] == 'd'
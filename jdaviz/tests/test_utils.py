@@ -1,4 +1,7 @@
 import pytest
+from astropy.tests.helper import assert_quantity_allclose
+from glue.core import Data
+from specutils import Spectrum1D
 
 from jdaviz import utils
 
@@ -14,3 +17,68 @@ def test_alpha_index_exceptions():
         utils.alpha_index(4.2)
     with pytest.raises(ValueError, match="index must be positive"):
         utils.alpha_index(-1)
+
+
+@pytest.mark.filterwarnings('ignore')
+def test_spectral_axis_from_data(cubeviz_helper, spectrum1d_cube):
+    cubeviz_helper.load_data(spectrum1d_cube, data_label='test')
+    cube = cubeviz_helper.app.data_collection['test[FLUX]']
+    collapsed = cubeviz_helper.get_data('test[FLUX]', function='sum')
+    cubeviz_helper.app.add_data(collapsed, 'collapsed')
+
+    for data in (cube, cubeviz_helper.app.data_collection['collapsed']):
+        expected = data.get_object(cls=Spectrum1D).spectral_axis
+        assert_quantity_allclose(utils.spectral_axis_from_data(data), expected)
+
+
+class _CountingCollection(list):
+    """List of data that counts how many times it was iterated over."""
+    n_iter = 0
+
+    def __iter__(self):
+        self.n_iter += 1
+        return super().__iter__()
+
+
+def test_data_label_registry_scaling():
+    n_labels = 10_000
+    dc = _CountingCollection()
+    registry = utils._DataLabelRegistry(dc)
+
+    # labels are picked from the index, without going through the data collection
+    for i in range(n_labels):
+        label = registry.unique_name(f"data{i % 100}", ext="SCI" if i % 2 else None)
+        data = Data(label=label)
+        dc.append(data)
+        registry.add(data)
+    assert dc.n_iter == 0
+
+    labels = [data.label for data in dc]
+    assert len(set(labels)) == n_labels
+    assert labels[:3] == ["data0", "data1[SCI]", "data2"]
+    assert labels[-1] == "data99[SCI] (99)"
+
+    # queries are answered from the index, without going through the labels
+    n_iter = dc.n_iter
+    for i in range(n_labels):
+        expected = f"data{i % 100}" if i % 2 else f"data{i % 100} (100)"
+        assert registry.unique_name(f"data{i % 100}") == expected
+    assert dc.n_iter == n_iter
+
+    # renaming and removing data keeps the index in sync
+    dc[0].label = "renamed (1000)"
+    registry.rename(dc[0])
+    assert registry.unique_name("data0") == "data0 (1001)"
+    to_remove = [data for data in dc if data.label.startswith("data0")]
+    n_iter = dc.n_iter
+    for data in to_remove:
+        dc.remove(data)
+        registry.remove(data)
+    assert registry.unique_name("data0") == "data0"
+    assert registry.unique_name("data2") == "data2 (100)"
+    assert dc.n_iter == n_iter
+
+    # out of sync (e.g., data removed without the registry being told) is rebuilt
+    dc.pop()
+    assert registry.unique_name("data99", ext="SCI") == "data99[SCI] (99)"
+    assert dc.n_iter == n_iter + 1
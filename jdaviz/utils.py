@@ -1,20 +1,26 @@
 import os
+import re
 import time
 import threading
-from collections import deque
+from collections import Counter, deque
 
 import numpy as np
+from astropy import units as u
 from astropy.io import fits
 from astropy.utils import minversion
+from astropy.wcs import WCS, WCSSUB_SPECTRAL
 from astropy.wcs.wcsapi import BaseHighLevelWCS
 from glue.config import settings
 from glue.core import BaseData
 from glue.core.exceptions import IncompatibleAttribute
 from glue.core.subset import SubsetState, RangeSubsetState, RoiSubsetState
+from glue_astronomy.translators.spectrum1d import PaddedSpectrumWCS
 from ipyvue import watch
+from specutils import Spectrum1D
 
 __all__ = ['SnackbarQueue', 'enable_hot_reloading', 'bqplot_clear_figure',
-           'standardize_metadata', 'ColorCycler', 'alpha_index', 'get_subset_type']
+           'standardize_metadata', 'ColorCycler', 'alpha_index', 'get_subset_type',
+           'spectral_axis_from_data']
 
 NUMPY_LT_2_0 = not minversion("numpy", "2.0.dev")
 
@@ -225,6 +231,26 @@ def data_has_valid_wcs(data, ndim=None):
     return status
 
 
+def spectral_axis_from_data(data):
+    """Return the spectral axis of a glue Data without translating its values.
+
+    ``data.get_object(cls=Spectrum1D)`` collapses a cube over its spatial axes
+    (or copies the full cube) just to build the spectral axis, which is costly for
+    large cubes. When the spectral axis is defined by the WCS alone, only the
+    spectral sub-WCS is evaluated here.
+    """
+    coords = getattr(data, 'coords', None)
+    if data.ndim > 1:
+        if isinstance(coords, PaddedSpectrumWCS):
+            return Spectrum1D(flux=np.zeros(data.shape[-1]) * u.one,
+                              wcs=coords.spectral_wcs).spectral_axis
+        if isinstance(coords, WCS) and coords.has_spectral:
+            spec_axis = coords.naxis - 1 - coords.wcs.spec
+            return Spectrum1D(flux=np.zeros(data.shape[spec_axis]) * u.one,
+                              wcs=coords.sub([WCSSUB_SPECTRAL])).spectral_axis
+    return data.get_object(cls=Spectrum1D).spectral_axis
+
+
 def layer_is_table_data(layer):
     return isinstance(layer, BaseData) and layer.ndim == 1
 
@@ -311,6 +337,104 @@ class ColorCycler:
         self.counter = -1
 
 
+class _DataLabelRegistry:
+    """
+    Index of the data labels in a `~glue.core.data_collection.DataCollection`, so that
+    unique labels can be generated without scanning every label in the collection.
+
+    The index is kept up to date by the application through :meth:`add`, :meth:`remove`,
+    and :meth:`rename` (on the data collection add/delete and data label update messages),
+    and is rebuilt if it ever gets out of sync with the collection (e.g., messages that
+    are still queued or not yet delivered).
+    """
+    # Any label ending with a space followed by parenthesis with a number inside.
+    _dup_pattern = re.compile(r"(.*)(\s\(\d*\))$")
+
+    def __init__(self, data_collection):
+        self._data_collection = data_collection
+        self._labels = {}  # data -> label
+        self._label_counts = Counter()  # label -> number of data with that label
+        self._base_counts = Counter()  # label without duplicate number -> number of labels
+        self._dup_numbers = Counter()  # duplicate number -> number of labels
+        self._max_number = 0
+
+    def _split(self, label):
+        if not self._dup_pattern.fullmatch(label):
+            return label, None
+        label_split = label.split(" ")
+        try:
+            number = int(label_split[-1][1:-1])
+        except ValueError:
+            # e.g., "label ()", not counted as a duplicate
+            return label, None
+        return " ".join(label_split[:-1]), number
+
+    def _count(self, label, increment):
+        base, number = self._split(label)
+        self._label_counts[label] += increment
+        self._base_counts[base] += increment
+        if number is not None:
+            self._dup_numbers[number] += increment
+            if increment > 0:
+                self._max_number = max(self._max_number, number)
+            elif self._dup_numbers[number] <= 0:
+                del self._dup_numbers[number]
+                if number == self._max_number:
+                    self._max_number = max(self._dup_numbers, default=0)
+
+    def add(self, data):
+        if data in self._labels:
+            self.rename(data)
+            return
+        self._labels[data] = data.label
+        self._count(data.label, 1)
+
+    def remove(self, data):
+        label = self._labels.pop(data, None)
+        if label is not None:
+            self._count(label, -1)
+
+    def rename(self, data):
+        if data not in self._labels or self._labels[data] == data.label:
+            return
+        self._count(self._labels[data], -1)
+        self._labels[data] = data.label
+        self._count(data.label, 1)
+
+    def sync(self):
+        """Rebuild the index if it does not match the data collection."""
+        if len(self._labels) == len(self._data_collection):
+            return
+        self._labels.clear()
+        self._label_counts.clear()
+        self._base_counts.clear()
+        self._dup_numbers.clear()
+        self._max_number = 0
+        for data in self._data_collection:
+            self.add(data)
+
+    def __contains__(self, label):
+        return self._label_counts[label] > 0
+
+    def unique_name(self, data_label, ext=None):
+        """Unique data label, see `~jdaviz.app.Application.return_unique_name`."""
+        self.sync()
+        if ext:
+            data_label = f"{data_label}[{ext}]"
+
+        number_of_duplicates = self._base_counts[data_label]
+        if number_of_duplicates > 0:
+            data_label = f"{data_label} ({number_of_duplicates})"
+
+        # The label can still be taken, e.g., if "test (1)" was loaded before "test",
+        # in which case we use one more than the maximum duplicate number found.
+        if data_label in self:
+            label_without_dup = " ".join(data_label.split(" ")[:-1])
+            data_label = f"{label_without_dup} ({self._max_number + 1})"
+
+        return data_label
+
+
 def get_subset_type(subset):
     """
     Determine the subset type of a subset or layer